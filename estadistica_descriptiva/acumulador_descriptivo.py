@@ -0,0 +1,294 @@
+"""
+Acumulador Descriptivo - Estadísticas por bloques para archivos que no caben en memoria
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+import numpy as np
+from estadistica_descriptiva.resumen_descriptivo import (
+    ResumenDescriptivo, cuantiles_desde_frecuencias, momentos_centrales, valores_en_rangos_frecuencias
+)
+from estadistica_descriptiva.bosquejo_cuantiles import BosquejoCuantiles
+from utils.cargar_datos import importar_csv_por_bloques
+
+
+def combinar_momentos(a, b):
+    """
+    Combina dos tuplas (n, media, M2, M3, M4) de forma numéricamente estable
+    (fórmulas de Chan/Pébay). M2, M3 y M4 son sumas de desviaciones a la media.
+    Los elementos pueden ser arreglos: se combinan posición a posición.
+    """
+    n_a, media_a, m2_a, m3_a, m4_a = a
+    n_b, media_b, m2_b, m3_b, m4_b = b
+    if np.all(n_a == 0):
+        return b
+    if np.all(n_b == 0):
+        return a
+
+    n = n_a + n_b
+    delta = media_b - media_a
+    delta_n = delta / n
+    producto = n_a * n_b
+
+    media = media_a + delta_n * n_b
+    m2 = m2_a + m2_b + delta * delta_n * producto
+    m3 = (m3_a + m3_b
+          + delta * delta_n ** 2 * producto * (n_a - n_b)
+          + 3 * delta_n * (n_a * m2_b - n_b * m2_a))
+    m4 = (m4_a + m4_b
+          + delta * delta_n ** 3 * producto * (n_a * n_a - producto + n_b * n_b)
+          + 6 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+          + 4 * delta_n * (n_a * m3_b - n_b * m3_a))
+    return n, media, m2, m3, m4
+
+
+def agregar_dato(momentos, valor):
+    """combinar_momentos(momentos, (1, valor, 0, 0, 0)) en O(1): Welford/Pébay"""
+    n, media, m2, m3, m4 = momentos
+    n += 1
+    delta = valor - media
+    delta_n = delta / n
+    termino = delta * delta_n * (n - 1)
+    m4 = (m4 + termino * delta_n * delta_n * (n * n - 3 * n + 3)
+          + 6 * delta_n * delta_n * m2 - 4 * delta_n * m3)
+    m3 = m3 + termino * delta_n * (n - 2) - 3 * delta_n * m2
+    return n, media + delta_n, m2 + termino, m3, m4
+
+
+def quitar_dato(momentos, valor):
+    """
+    Inversa de agregar_dato: (n, media, M2, M3, M4) sin uno de sus datos,
+    despejados de las mismas fórmulas (n debe ser mayor que 1). Acepta
+    arreglos de valores, ej. la muestra sin cada observación.
+    """
+    n, media, m2, m3, m4 = momentos
+    # delta = valor - (media sin el valor)
+    delta = (valor - media) * n / (n - 1)
+    delta_n = delta / n
+    termino = delta * delta_n * (n - 1)
+    m2 = m2 - termino
+    m3 = m3 - termino * delta_n * (n - 2) + 3 * delta_n * m2
+    m4 = (m4 - termino * delta_n * delta_n * (n * n - 3 * n + 3)
+          - 6 * delta_n * delta_n * m2 + 4 * delta_n * m3)
+    return n - 1, media - delta_n, m2, m3, m4
+
+
+def combinar_frecuencias(valores_a, conteos_a, valores_b, conteos_b):
+    """Suma dos tablas de frecuencias (valores ordenados y sus conteos)"""
+    # Con una tabla vacía se conserva el tipo de la otra (enteros siguen enteros)
+    if len(valores_a) == 0:
+        return valores_b, np.asarray(conteos_b, dtype=np.int64)
+    if len(valores_b) == 0:
+        return valores_a, np.asarray(conteos_a, dtype=np.int64)
+    valores = np.concatenate([valores_a, valores_b])
+    conteos = np.concatenate([conteos_a, conteos_b])
+    unicos, posiciones = np.unique(valores, return_inverse=True)
+    return unicos, np.bincount(posiciones, weights=conteos, minlength=len(unicos)).astype(np.int64)
+
+
+class AcumuladorDescriptivo(ResumenDescriptivo):
+    """
+    Resumen descriptivo que se construye bloque a bloque.
+
+    Guarda solo momentos, mínimo/máximo, sumas para las medias geométrica
+    y armónica y, opcionalmente, la tabla de frecuencias (exacta para
+    columnas discretas como 'Edad'). Dos acumuladores se pueden combinar.
+
+    Se usa igual que un ResumenDescriptivo: calcular_varianza(acumulador),
+    calcular_asimetria(acumulador), calcular_tendencia_central(acumulador)...
+
+    frecuencias: False para columnas continuas con muchos valores distintos
+                 (sin frecuencias no hay moda ni cuantiles exactos)
+    error_cuantiles: si se indica (ej. 0.01), se mantiene un BosquejoCuantiles
+                     y, sin frecuencias, mediana, cuartiles, deciles, percentiles
+                     y cercas IQR se estiman con ese error en memoria acotada
+    semilla: semilla del bosquejo, para resultados reproducibles
+    """
+
+    def __init__(self, frecuencias=True, error_cuantiles=None, semilla=None):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.suma_logaritmos = 0.0
+        self.suma_inversos = 0.0
+        self.ceros = 0
+        self.negativos = 0
+        self.con_frecuencias = frecuencias
+        self.valores_frecuencia = np.array([])
+        self.conteos = np.array([], dtype=np.int64)
+        self.bosquejo = BosquejoCuantiles(error_cuantiles, semilla) if error_cuantiles else None
+        self._cuartiles = None
+        self._acumulados = None
+
+    def actualizar(self, bloque):
+        """Agrega un bloque de datos (los valores faltantes se ignoran)"""
+        valores = np.asarray(bloque, dtype=float)
+        valores = valores[~np.isnan(valores)]
+        if len(valores) == 0:
+            return self
+
+        k = len(valores)
+        media, m2, m3, m4 = momentos_centrales(valores)
+        self._combinar_momentos((k, media[()], m2 * k, m3 * k, m4 * k))
+
+        self.minimo = min(self.minimo, valores.min())
+        self.maximo = max(self.maximo, valores.max())
+
+        positivos = valores[valores > 0]
+        self.suma_logaritmos += np.log(positivos).sum()
+        self.suma_inversos += (1.0 / positivos).sum()
+        self.ceros += int(np.count_nonzero(valores == 0))
+        self.negativos += int(np.count_nonzero(valores < 0))
+
+        if self.con_frecuencias:
+            # Las columnas enteras (ej. 'Edad') conservan sus valores enteros en la tabla
+            originales = np.asarray(bloque)
+            unicos, conteos = np.unique(originales if originales.dtype.kind in 'iu' else valores,
+                                        return_counts=True)
+            self.valores_frecuencia, self.conteos = combinar_frecuencias(
+                self.valores_frecuencia, self.conteos, unicos, conteos)
+        if self.bosquejo is not None:
+            self.bosquejo.actualizar(valores)
+        return self
+
+    def combinar(self, otro):
+        """Incorpora otro acumulador (por ejemplo, de otro archivo)"""
+        self._combinar_momentos((otro.n, otro.media, otro.m2, otro.m3, otro.m4))
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self.suma_logaritmos += otro.suma_logaritmos
+        self.suma_inversos += otro.suma_inversos
+        self.ceros += otro.ceros
+        self.negativos += otro.negativos
+
+        self.con_frecuencias = self.con_frecuencias and otro.con_frecuencias
+        if self.con_frecuencias:
+            self.valores_frecuencia, self.conteos = combinar_frecuencias(
+                self.valores_frecuencia, self.conteos, otro.valores_frecuencia, otro.conteos)
+        else:
+            self.valores_frecuencia = np.array([])
+            self.conteos = np.array([], dtype=np.int64)
+
+        if self.bosquejo is not None and otro.bosquejo is not None:
+            self.bosquejo.combinar(otro.bosquejo)
+        else:
+            self.bosquejo = None
+        return self
+
+    def _combinar_momentos(self, momentos):
+        self.n, self.media, self.m2, self.m3, self.m4 = combinar_momentos(
+            (self.n, self.media, self.m2, self.m3, self.m4), momentos)
+        self._cuartiles = None
+        self._acumulados = None
+
+    @property
+    def acumulados(self):
+        """Conteos acumulados de la tabla de frecuencias (una vez por actualización)"""
+        if self._acumulados is None:
+            self._acumulados = np.cumsum(self.conteos)
+        return self._acumulados
+
+    def _requiere_frecuencias(self, medida):
+        if not self.con_frecuencias:
+            raise ValueError(f'No se puede calcular {medida} sin acumular frecuencias (frecuencias=True)')
+
+    def cuantiles(self, probabilidades, metodo='linear'):
+        """
+        Exactos si hay frecuencias (con cualquier metodo de
+        METODOS_INTERPOLACION); si no, aproximados con el bosquejo, que no
+        interpola y solo admite 'linear'
+        """
+        if self.con_frecuencias:
+            return cuantiles_desde_frecuencias(self.valores_frecuencia, self.acumulados, probabilidades, metodo)
+        if self.bosquejo is not None:
+            if metodo != 'linear':
+                raise ValueError(f"El método '{metodo}' necesita frecuencias (frecuencias=True); "
+                                 "el bosquejo de cuantiles solo admite 'linear'")
+            return self.bosquejo.cuantiles(probabilidades)
+        raise ValueError('No se pueden calcular cuantiles sin frecuencias (frecuencias=True) '
+                         'ni bosquejo (error_cuantiles)')
+
+    def tabla_frecuencias(self):
+        """(valores, frecuencias) si se acumulan frecuencias; si no, None"""
+        return (self.valores_frecuencia, self.conteos) if self.con_frecuencias else None
+
+    def valores_en_rangos(self, rangos):
+        """Estadísticos de orden exactos a partir de la tabla de frecuencias"""
+        self._requiere_frecuencias('los estadísticos de orden')
+        return valores_en_rangos_frecuencias(self.valores_frecuencia, self.acumulados, rangos)
+
+    def modas(self):
+        """Valor(es) con mayor frecuencia"""
+        self._requiere_frecuencias('la moda')
+        return self.valores_frecuencia[self.conteos == self.conteos.max()]
+
+    def desviacion_media(self):
+        """Exacta si hay frecuencias; si no, aproximada con el bosquejo"""
+        if not self.con_frecuencias and self.bosquejo is not None:
+            return self.bosquejo.desviacion_media(self.media)
+        self._requiere_frecuencias('la desviación media')
+        return (self.conteos * np.abs(self.valores_frecuencia - self.media)).sum() / self.n
+
+    def posiciones_atipicos(self, factor=1.5):
+        """Los datos leídos por bloques no conservan las filas"""
+        return None
+
+    def valores_atipicos(self, factor=1.5):
+        """Valores fuera de las cercas IQR (None si solo hay bosquejo)"""
+        if not self.con_frecuencias and self.bosquejo is not None:
+            return None
+        self._requiere_frecuencias('los valores atípicos')
+        limite_inferior, limite_superior = self.cercas(factor)
+        mascara = (self.valores_frecuencia < limite_inferior) | (self.valores_frecuencia > limite_superior)
+        return np.repeat(self.valores_frecuencia[mascara], self.conteos[mascara])
+
+    def contar_atipicos(self, factor=1.5):
+        """Cantidad de valores atípicos (estimada con el bosquejo si no hay frecuencias)"""
+        if not self.con_frecuencias and self.bosquejo is not None:
+            limite_inferior, limite_superior = self.cercas(factor)
+            proporcion = (self.bosquejo.rango(limite_inferior, incluir_igual=False)
+                          + 1 - self.bosquejo.rango(limite_superior))
+            return int(round(proporcion * self.n))
+        return len(self.valores_atipicos(factor))
+
+
+def analizar_csv_por_bloques(ruta, columna, tamano_bloque=100_000, frecuencias=True,
+                             error_cuantiles=None):
+    """
+    Recorre un CSV por bloques y devuelve el AcumuladorDescriptivo de una columna,
+    sin cargar el archivo completo en memoria
+    """
+    acumulador = AcumuladorDescriptivo(frecuencias=frecuencias, error_cuantiles=error_cuantiles)
+    for bloque in importar_csv_por_bloques(ruta, columnas=[columna], tamano_bloque=tamano_bloque):
+        acumulador.actualizar(bloque[columna])
+    return acumulador
+
+
+def _resumir_particion(particion, frecuencias, error_cuantiles, semilla):
+    return AcumuladorDescriptivo(frecuencias, error_cuantiles, semilla).actualizar(particion)
+
+
+def analizar_particiones(particiones, procesos=None, frecuencias=True, error_cuantiles=None,
+                         semilla=None):
+    """
+    Resume cada partición de datos en paralelo y combina los resultados
+    
+    particiones: lista de arreglos (ej. np.array_split(datos, 8))
+    procesos: cantidad de procesos (None = todos los núcleos, 1 = sin paralelismo)
+    
+    Retorna un único AcumuladorDescriptivo, que se puede pasar a
+    analisis_completo_dispersion, analisis_completo_forma, etc.
+    """
+    particiones = list(particiones)
+    semillas = np.random.SeedSequence(semilla).spawn(len(particiones))
+    argumentos = ([frecuencias] * len(particiones), [error_cuantiles] * len(particiones), semillas)
+
+    if procesos == 1:
+        resumenes = list(map(_resumir_particion, particiones, *argumentos))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            resumenes = list(ejecutor.map(_resumir_particion, particiones, *argumentos))
+    return reduce(AcumuladorDescriptivo.combinar, resumenes)
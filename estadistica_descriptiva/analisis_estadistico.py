@@ -1,53 +1,98 @@
 import pandas as pd
 import numpy as np
-from scipy import stats
-from scipy.stats import gmean, hmean
+from estadistica_descriptiva.acumulador_descriptivo import AcumuladorDescriptivo
+from estadistica_descriptiva.estadisticos_orden import mediana_seleccion
+from estadistica_descriptiva.medias import calcular_medias
+from estadistica_descriptiva.modas import calcular_modas, moda_por_clases
+from estadistica_descriptiva.intervalos_clase import agrupar_en_clases, columnas_acumuladas, tabla_intervalos
+from estadistica_descriptiva.resumen_descriptivo import (
+    ResumenDescriptivo, ResumenFrecuencias, ResumenEnteros, es_entero_compacto, contar_enteros
+)
 
 def calcular_tendencia_central(datos):
-    media = round(np.mean(datos), 2)
-    mediana = round(np.median(datos), 2)
+    # Resumen exacto ya calculado: se trabaja con sus datos
+    if isinstance(datos, ResumenDescriptivo) and not isinstance(datos, (AcumuladorDescriptivo, ResumenFrecuencias)):
+        datos = datos.valores
+    if not isinstance(datos, ResumenDescriptivo) and es_entero_compacto(datos):
+        # Enteros de rango pequeño: todo sale de un solo conteo
+        datos = ResumenEnteros(datos)
     
-    # Moda con soporte para múltiples modas
-    moda_resultado = stats.mode(datos, keepdims=True)
-    moda = [round(m, 2) for m in moda_resultado.mode.tolist()]
+    # Todas las medias en una sola pasada (la geométrica en escala logarítmica)
+    medias = calcular_medias(datos)
     
-    media_geometrica = round(gmean(datos), 2)
-    media_armonica = round(hmean(datos), 2)
+    if isinstance(datos, AcumuladorDescriptivo) and not datos.con_frecuencias:
+        # Acumulado sin tabla de frecuencias: no hay moda y la mediana sale del bosquejo
+        mediana = datos.mediana() if datos.bosquejo is not None else np.nan
+        moda = []
+    else:
+        if isinstance(datos, (AcumuladorDescriptivo, ResumenFrecuencias)):
+            # Resumen por bloques o por frecuencias: todo sale de lo acumulado
+            mediana = datos.mediana()
+        else:
+            # Mediana por selección, sin ordenar los datos
+            mediana = mediana_seleccion(np.asarray(datos))
+        
+        # Todas las modas; si ningún valor se repite (datos continuos) se usa la moda por clases
+        modas = calcular_modas(datos)
+        if modas['tipo'] == 'amodal':
+            modas = moda_por_clases(datos)
+        moda = modas['modas'].tolist()
     
     return {
-        "Media aritmética": media,
-        "Mediana": mediana,
-        "Moda": moda,
-        "Media Geométrica": media_geometrica,
-        "Media Armónica": media_armonica
+        "Media aritmética": round(medias['aritmetica'], 2),
+        "Mediana": round(mediana, 2),
+        "Moda": [round(m, 2) for m in moda],
+        "Media Geométrica": round(medias['geometrica'], 2),
+        "Media Armónica": round(medias['armonica'], 2),
+        "Media Recortada (10%)": round(medias['recortada'], 2),
+        "Media Winsorizada (10%)": round(medias['winsorizada'], 2)
     }
 
+def calcular_frecuencias(datos):
+    """
+    Cuenta cuántas veces aparece cada valor sin recorrer los datos en Python
+    
+    Funciona con columnas numéricas y de texto/categóricas (ej. 'Carrera', 'Genero').
+    Los valores faltantes se ignoran; los enteros de rango pequeño se
+    cuentan directamente con np.bincount.
+    También acepta un AcumuladorDescriptivo (con frecuencias) o un
+    ResumenFrecuencias, cuya tabla ya está contada.
+    Retorna (valores, frecuencias) ordenados por valor ascendente.
+    """
+    if isinstance(datos, ResumenDescriptivo):
+        tabla = datos.tabla_frecuencias()
+        if tabla is not None:
+            return tabla
+        if not hasattr(datos, 'valores'):
+            raise ValueError('El acumulador no guarda frecuencias (frecuencias=True)')
+        datos = datos.valores
+    if es_entero_compacto(datos):
+        return contar_enteros(datos)
+    codigos, valores = pd.factorize(pd.Series(datos), sort=True)
+    codigos = codigos[codigos >= 0]
+    frecuencias = np.bincount(codigos, minlength=len(valores))
+    return np.asarray(valores), frecuencias
+
 def generar_dfs(datos):
-    frecuencias = {}
-    for valor in datos:
-        frecuencias[valor] = frecuencias.get(valor, 0) + 1
+    valores, frecuencias = calcular_frecuencias(datos)
 
     df = pd.DataFrame({
-        "Valor": list(frecuencias.keys()),
-        "Frecuencia": list(frecuencias.values())
+        "Valor": valores,
+        "Frecuencia": frecuencias,
+        **columnas_acumuladas(frecuencias)
     })
-    df = df.sort_values(by="Valor", ascending=True).reset_index(drop=True)
-    df["Frecuencia Acumulada"] = df["Frecuencia"].cumsum()
-    df["Frecuencia Relativa"] = (df["Frecuencia"] / len(datos)).round(2)
-    df["Frecuencia Relativa Acumulada"] = df["Frecuencia Relativa"].cumsum().round(2)
     return df
 
-def generar_dfsvai(datos, bins=10):
-    # Genera clases y produce un DataFrame con columna 'Intervalo' y 'Frecuencia'
-    clases = pd.cut(datos, bins=bins)
-    df = clases.value_counts().sort_index().reset_index()
-    # Renombrar para que la columna de intervalos se llame 'Intervalo'
-    df.columns = ["Intervalo", "Frecuencia"]
-    # Marca de clase (punto medio)
-    df["Marca de Clase"] = df["Intervalo"].apply(lambda x: round((x.left + x.right) / 2, 2))
-    # Ordenar por marca de clase ascendente (útil para graficar de izquierda a derecha)
-    df = df.sort_values(by="Marca de Clase", ascending=True).reset_index(drop=True)
-    df["Frecuencia Acumulada"] = df["Frecuencia"].cumsum()
-    df["Frecuencia Relativa"] = (df["Frecuencia"] / len(datos)).round(2)
-    df["Frecuencia Relativa Acumulada"] = df["Frecuencia Relativa"].cumsum().round(2)
-    return df
+def generar_dfsvai(datos, bins=10, amplitud=None):
+    """
+    Cuadro de frecuencia agrupada con columnas 'Intervalo', 'Límite Inferior',
+    'Límite Superior', 'Frecuencia', 'Marca de Clase' y frecuencias acumuladas
+    y relativas
+
+    bins: cantidad de clases, regla ('sturges', 'scott', 'fd') o bordes ya
+          definidos (ej. los mismos bordes para todos los bloques de un CSV)
+    amplitud: ancho fijo de clase (tiene prioridad sobre bins)
+    datos también puede ser un ResumenDescriptivo (ej. un acumulador con frecuencias).
+    """
+    bordes, frecuencias = agrupar_en_clases(datos, bins, amplitud)
+    return tabla_intervalos(bordes, frecuencias)
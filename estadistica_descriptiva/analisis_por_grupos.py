@@ -0,0 +1,70 @@
+"""
+Análisis por Grupos - Todas las medidas descriptivas para varias columnas y grupos a la vez
+"""
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.resumen_descriptivo import coeficientes_forma
+
+
+def analisis_descriptivo_columnas(df, columnas=None, agrupar_por=None):
+    """
+    Calcula tendencia central, dispersión, posición y forma para cada columna
+    numérica, opcionalmente por grupos (ej. agrupar_por=['Carrera', 'Genero'])
+
+    Todas las medidas salen de operaciones groupby vectorizadas sobre la tabla
+    en formato largo, sin recorrer los grupos ni las columnas en Python.
+
+    Retorna una tabla ordenada con una fila por (grupo, variable) y una
+    columna por medida. Asimetría y curtosis salen de coeficientes_forma,
+    igual que en medidas_forma.
+    """
+    if agrupar_por is None:
+        agrupar_por = []
+    elif isinstance(agrupar_por, str):
+        agrupar_por = [agrupar_por]
+    if columnas is None:
+        columnas = [c for c in df.select_dtypes(include='number').columns if c not in agrupar_por]
+
+    largo = df[agrupar_por + list(columnas)].melt(
+        id_vars=agrupar_por, var_name='Variable', value_name='Valor').dropna(subset=['Valor'])
+    largo['Valor'] = largo['Valor'].astype(float)
+    # Las variables se mantienen en el orden de las columnas
+    largo['Variable'] = pd.Categorical(largo['Variable'], categories=list(columnas))
+    claves = agrupar_por + ['Variable']
+    grupos = largo.groupby(claves, sort=True, observed=True)['Valor']
+
+    resultado = grupos.agg(['count', 'mean', 'median', 'min', 'max', 'var', 'std'])
+    resultado.columns = ['n', 'Media', 'Mediana', 'Mínimo', 'Máximo', 'Varianza', 'Desviación Estándar']
+
+    # Moda: valor más frecuente de cada grupo (el menor en caso de empate)
+    conteos = largo.groupby(claves + ['Valor'], observed=True).size().rename('conteo').reset_index()
+    conteos = conteos.sort_values(claves + ['conteo', 'Valor'],
+                                  ascending=[True] * len(claves) + [False, True])
+    resultado['Moda'] = conteos.drop_duplicates(claves).set_index(claves)['Valor']
+
+    # Media geométrica (solo definida si todos los valores son positivos)
+    logaritmos = np.log(largo['Valor'].where(largo['Valor'] > 0))
+    resultado['Media Geométrica'] = np.exp(logaritmos.groupby([largo[c] for c in claves], observed=True).mean())
+    resultado.loc[grupos.min() <= 0, 'Media Geométrica'] = np.nan
+
+    # Posición
+    cuartiles = grupos.quantile([0.25, 0.75]).unstack()
+    resultado['Q1'] = cuartiles[0.25]
+    resultado['Q3'] = cuartiles[0.75]
+    resultado['IQR'] = resultado['Q3'] - resultado['Q1']
+    resultado['Rango'] = resultado['Máximo'] - resultado['Mínimo']
+    resultado['CV (%)'] = resultado['Desviación Estándar'] / resultado['Media'].abs() * 100
+
+    # Forma: momentos centrales por grupo
+    desviaciones = largo['Valor'] - grupos.transform('mean')
+    cuadrados = desviaciones ** 2
+    momentos = pd.DataFrame({'m2': cuadrados, 'm3': cuadrados * desviaciones,
+                             'm4': cuadrados * cuadrados})
+    momentos = momentos.groupby([largo[c] for c in claves], observed=True).mean()
+    asimetria, curtosis = coeficientes_forma(momentos['m2'], momentos['m3'], momentos['m4'])
+    resultado['Asimetría'] = pd.Series(asimetria, index=momentos.index)
+    resultado['Curtosis'] = pd.Series(curtosis, index=momentos.index)
+
+    orden = ['n', 'Media', 'Mediana', 'Moda', 'Media Geométrica', 'Mínimo', 'Máximo', 'Rango',
+             'Varianza', 'Desviación Estándar', 'CV (%)', 'Q1', 'Q3', 'IQR', 'Asimetría', 'Curtosis']
+    return resultado[orden].reset_index()
@@ -0,0 +1,115 @@
+"""
+Bosquejo de Cuantiles - Percentiles aproximados en memoria acotada (estilo KLL)
+"""
+import numpy as np
+
+
+class BosquejoCuantiles:
+    """
+    Resumen aproximado de una columna que permite estimar cualquier cuantil
+    usando memoria acotada, sin importar cuántos datos se procesen.
+
+    Los datos se guardan en niveles; cuando un nivel se llena se ordena y se
+    conserva uno de cada dos elementos, que pasa al nivel siguiente con el
+    doble de peso. Dos bosquejos (por ejemplo, de archivos distintos) se
+    pueden combinar.
+
+    error: error de rango aproximado (0.01 → el cuantil reportado está, con
+           alta probabilidad, entre los percentiles p-1% y p+1%)
+    semilla: semilla para que la compactación sea reproducible
+    """
+
+    def __init__(self, error=0.01, semilla=None):
+        self.error = error
+        self.k = max(8, int(np.ceil(1.65 / error)))
+        self.n = 0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.niveles = [np.array([])]
+        self._rng = np.random.default_rng(semilla)
+
+    def _capacidad(self, nivel):
+        # Los niveles más bajos (menos pesados) guardan menos elementos
+        profundidad = len(self.niveles) - nivel - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** profundidad)))
+
+    def actualizar(self, bloque):
+        """Agrega un bloque de datos (los valores faltantes se ignoran)"""
+        valores = np.asarray(bloque, dtype=float)
+        valores = valores[~np.isnan(valores)]
+        if len(valores) == 0:
+            return self
+
+        self.n += len(valores)
+        self.minimo = min(self.minimo, valores.min())
+        self.maximo = max(self.maximo, valores.max())
+        self.niveles[0] = np.concatenate([self.niveles[0], valores])
+        self._compactar()
+        return self
+
+    def combinar(self, otro):
+        """Incorpora otro bosquejo; el resultado mantiene el error del más grueso"""
+        self.k = min(self.k, otro.k)
+        self.error = max(self.error, otro.error)
+        self.n += otro.n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        while len(self.niveles) < len(otro.niveles):
+            self.niveles.append(np.array([]))
+        for nivel, elementos in enumerate(otro.niveles):
+            self.niveles[nivel] = np.concatenate([self.niveles[nivel], elementos])
+        self._compactar()
+        return self
+
+    def _compactar(self):
+        while sum(len(elementos) for elementos in self.niveles) > \
+                sum(self._capacidad(nivel) for nivel in range(len(self.niveles))):
+            nivel = next(h for h, elementos in enumerate(self.niveles)
+                         if len(elementos) > self._capacidad(h))
+            if nivel + 1 == len(self.niveles):
+                self.niveles.append(np.array([]))
+
+            ordenados = np.sort(self.niveles[nivel])
+            # Con cantidad impar, un elemento se queda en el nivel actual
+            sobrante = len(ordenados) % 2
+            desplazamiento = self._rng.integers(0, 2)
+            promovidos = ordenados[sobrante + desplazamiento::2]
+
+            self.niveles[nivel] = ordenados[:sobrante]
+            self.niveles[nivel + 1] = np.concatenate([self.niveles[nivel + 1], promovidos])
+
+    def _ponderados(self):
+        """Elementos guardados ordenados y su peso acumulado"""
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate([np.full(len(elementos), 2.0 ** nivel)
+                                for nivel, elementos in enumerate(self.niveles)])
+        orden = np.argsort(valores, kind='stable')
+        return valores[orden], np.cumsum(pesos[orden])
+
+    def elementos(self):
+        """(valores ordenados, pesos): muestra ponderada que representa a todos los datos"""
+        valores, acumulados = self._ponderados()
+        return valores, np.diff(acumulados, prepend=0.0)
+
+    def cuantiles(self, probabilidades):
+        """Cuantiles aproximados (probabilidades entre 0 y 1)"""
+        p = np.asarray(probabilidades, dtype=float)
+        valores, acumulados = self._ponderados()
+        posiciones = np.searchsorted(acumulados, p * acumulados[-1], side='left')
+        resultado = valores[np.minimum(posiciones, len(valores) - 1)]
+        # Los extremos se conocen con exactitud
+        resultado = np.where(p <= 0, self.minimo, resultado)
+        return np.where(p >= 1, self.maximo, resultado)
+
+    def desviacion_media(self, centro):
+        """Desviación media aproximada Σ|xi - centro| / n usando los elementos ponderados"""
+        valores, pesos = self.elementos()
+        return (pesos * np.abs(valores - centro)).sum() / pesos.sum()
+
+    def rango(self, x, incluir_igual=True):
+        """Proporción aproximada de datos menores (o iguales) a x"""
+        valores, acumulados = self._ponderados()
+        lado = 'right' if incluir_igual else 'left'
+        posiciones = np.searchsorted(valores, np.asarray(x, dtype=float), side=lado)
+        acumulado = np.where(posiciones > 0, acumulados[np.maximum(posiciones - 1, 0)], 0.0)
+        return acumulado / acumulados[-1]
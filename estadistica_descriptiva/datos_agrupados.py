@@ -0,0 +1,166 @@
+"""
+Datos Agrupados - Estadísticas directamente desde cuadros de frecuencia
+"""
+import re
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.resumen_descriptivo import ResumenFrecuencias
+
+_NUMERO = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def leer_intervalos(intervalos):
+    """
+    Obtiene los límites inferior y superior de textos como '(16.983, 18.7]'
+    o de objetos pd.Interval
+    """
+    inferiores, superiores = [], []
+    for intervalo in intervalos:
+        if isinstance(intervalo, pd.Interval):
+            inferiores.append(intervalo.left)
+            superiores.append(intervalo.right)
+        else:
+            numeros = _NUMERO.findall(str(intervalo))
+            inferiores.append(float(numeros[0]))
+            superiores.append(float(numeros[1]))
+    return np.array(inferiores, dtype=float), np.array(superiores, dtype=float)
+
+
+def moda_agrupada(inferiores, superiores, frecuencias):
+    """
+    Moda para datos agrupados: Mo = Li + d1 / (d1 + d2) · c
+
+    d1 = f(modal) - f(anterior), d2 = f(modal) - f(siguiente), c = amplitud.
+    Si hay varias clases modales se devuelve una moda por cada una.
+    """
+    frecuencias = np.asarray(frecuencias, dtype=float)
+    anteriores = np.concatenate([[0.0], frecuencias[:-1]])
+    siguientes = np.concatenate([frecuencias[1:], [0.0]])
+    modales = np.flatnonzero(frecuencias == frecuencias.max())
+
+    d1 = frecuencias[modales] - anteriores[modales]
+    d2 = frecuencias[modales] - siguientes[modales]
+    amplitud = superiores[modales] - inferiores[modales]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        proporcion = np.where(d1 + d2 > 0, d1 / (d1 + d2), 0.5)
+    return inferiores[modales] + proporcion * amplitud
+
+
+class ResumenAgrupado(ResumenFrecuencias):
+    """
+    Resumen de un cuadro de frecuencias por intervalos
+
+    Media, varianza y forma usan las marcas de clase; mediana, cuartiles,
+    percentiles y moda usan las fórmulas clásicas de interpolación dentro
+    de la clase. Todo en O(cantidad de clases).
+    """
+
+    def __init__(self, inferiores, superiores, frecuencias):
+        orden = np.argsort(inferiores, kind='stable')
+        self.inferiores = np.asarray(inferiores, dtype=float)[orden]
+        self.superiores = np.asarray(superiores, dtype=float)[orden]
+        self.frecuencias = np.asarray(frecuencias)[orden]
+        self.marcas = (self.inferiores + self.superiores) / 2
+        self.acumuladas = np.cumsum(self.frecuencias)
+        super().__init__(self.marcas, self.frecuencias)
+        self.minimo = self.inferiores[self.frecuencias > 0][0]
+        self.maximo = self.superiores[self.frecuencias > 0][-1]
+
+    def cuantiles(self, probabilidades, metodo='linear'):
+        """
+        Pk = Li + (k·n - F(anterior)) / f · c: la interpolación dentro de la
+        clase es la única que admiten los datos agrupados ('linear')
+        """
+        if metodo != 'linear':
+            raise ValueError(f"El método '{metodo}' necesita los datos originales; "
+                             "los datos agrupados solo admiten 'linear'")
+        p = np.asarray(probabilidades, dtype=float)
+        objetivo = p * self.n
+        clase = np.minimum(np.searchsorted(self.acumuladas, objetivo, side='left'),
+                           len(self.frecuencias) - 1)
+        anterior = np.where(clase > 0, self.acumuladas[np.maximum(clase - 1, 0)], 0)
+        frecuencia = self.frecuencias[clase]
+        amplitud = self.superiores[clase] - self.inferiores[clase]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraccion = np.where(frecuencia > 0, (objetivo - anterior) / frecuencia, 0.0)
+        return self.inferiores[clase] + fraccion * amplitud
+
+    def modas(self):
+        return moda_agrupada(self.inferiores, self.superiores, self.frecuencias)
+
+
+def resumen_desde_tabla(tabla):
+    """
+    Crea el resumen de un cuadro de frecuencia ya agregado
+
+    - Cuadro simple: columnas 'Valor' y 'Frecuencia' → ResumenFrecuencias
+    - Cuadro agrupado: 'Intervalo' (o 'Límite Inferior'/'Límite Superior')
+      y 'Frecuencia' → ResumenAgrupado
+
+    El resultado se puede pasar a calcular_varianza, calcular_cuartiles,
+    analisis_completo_forma, calcular_tendencia_central, etc.
+    """
+    if 'Límite Inferior' in tabla.columns and 'Límite Superior' in tabla.columns:
+        return ResumenAgrupado(tabla['Límite Inferior'], tabla['Límite Superior'], tabla['Frecuencia'])
+    if 'Intervalo' in tabla.columns:
+        inferiores, superiores = leer_intervalos(tabla['Intervalo'])
+        return ResumenAgrupado(inferiores, superiores, tabla['Frecuencia'])
+    if 'Valor' in tabla.columns:
+        return ResumenFrecuencias(tabla['Valor'], tabla['Frecuencia'])
+    raise ValueError("El cuadro debe tener columnas 'Valor' o 'Intervalo' junto con 'Frecuencia'")
+
+
+def analisis_datos_agrupados(tabla, percentiles_deseados=None):
+    """
+    Media, varianza, desviación, mediana, moda, cuartiles y percentiles
+    de un cuadro de frecuencias sin expandir sus filas
+    """
+    if percentiles_deseados is None:
+        percentiles_deseados = [10, 25, 50, 75, 90]
+
+    resumen = tabla if isinstance(tabla, ResumenFrecuencias) else resumen_desde_tabla(tabla)
+    q1, q2, q3 = resumen.cuartiles()
+    valores_percentiles = resumen.cuantiles(np.asarray(percentiles_deseados, dtype=float) / 100)
+
+    return {
+        'n': int(resumen.n),
+        'media': round(resumen.media, 4),
+        'varianza': round(resumen.varianza(ddof=1), 4),
+        'desviacion_estandar': round(resumen.desviacion_estandar(ddof=1), 4),
+        'mediana': round(q2, 4),
+        'moda': [round(m, 4) for m in resumen.modas().tolist()],
+        'Q1': round(q1, 4),
+        'Q3': round(q3, 4),
+        'percentiles': {f'P{p}': round(v, 4) for p, v in zip(percentiles_deseados, valores_percentiles)},
+        'agrupado': isinstance(resumen, ResumenAgrupado),
+        'formulas': {
+            'media': 'x̄ = Σ(fi · xi) / n',
+            'varianza': 's² = Σ fi (xi - x̄)² / (n-1)',
+            'mediana': 'Me = Li + (n/2 - F(anterior)) / f · c',
+            'moda': 'Mo = Li + d1 / (d1 + d2) · c'
+        }
+    }
+
+
+def generar_tabla_agrupada(tabla):
+    """
+    Genera una tabla resumen de las medidas calculadas desde el cuadro de frecuencias
+    """
+    analisis = analisis_datos_agrupados(tabla)
+    formulas = analisis['formulas']
+
+    datos_tabla = [
+        ['n (total de observaciones)', analisis['n'], 'Suma de las frecuencias'],
+        ['Media', analisis['media'], formulas['media']],
+        ['Varianza', analisis['varianza'], formulas['varianza']],
+        ['Desviación Estándar', analisis['desviacion_estandar'], 's = √s²'],
+        ['Mediana', analisis['mediana'], formulas['mediana'] if analisis['agrupado'] else 'Valor central'],
+        ['Moda', analisis['moda'], formulas['moda'] if analisis['agrupado'] else 'Valor(es) más frecuente(s)'],
+        ['Q1', analisis['Q1'], '25% de los datos son menores o iguales'],
+        ['Q3', analisis['Q3'], '75% de los datos son menores o iguales'],
+    ]
+    for nombre, valor in analisis['percentiles'].items():
+        datos_tabla.append([nombre, valor, f'{nombre[1:]}% de los datos son menores o iguales'])
+
+    df = pd.DataFrame(datos_tabla, columns=['Medida', 'Valor', 'Interpretación'])
+    return df
@@ -0,0 +1,100 @@
+"""
+Distribución Empírica - Función de distribución acumulada (ECDF) con consultas por búsqueda binaria
+"""
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.resumen_descriptivo import ResumenDescriptivo, ResumenFrecuencias
+from estadistica_inferencial.distribucion_normal import DistribucionNormal
+
+
+class DistribucionEmpirica(ResumenFrecuencias):
+    """
+    Función de distribución empírica Fn(x) = (cantidad de datos ≤ x) / n
+
+    Guarda una sola vez los valores distintos ordenados y sus frecuencias
+    acumuladas; cada consulta (probabilidades, rangos, cuantiles) es una
+    búsqueda binaria O(log k) por punto, y acepta arreglos de puntos.
+
+    datos: arreglo de datos (los faltantes se ignoran) o ResumenDescriptivo;
+           las tablas de frecuencia y los acumuladores se usan sin expandirse.
+    Como es un ResumenDescriptivo, las funciones de medidas_posicion,
+    medidas_dispersión y medidas_forma también la aceptan.
+    """
+
+    def __init__(self, datos):
+        if isinstance(datos, ResumenDescriptivo):
+            tabla = datos.tabla_frecuencias()
+            if tabla is not None:
+                valores, conteos = tabla
+            elif hasattr(datos, 'valores'):
+                valores, conteos = np.unique(datos.valores, return_counts=True)
+            else:
+                raise ValueError('La distribución empírica necesita los datos o sus frecuencias')
+        else:
+            datos = np.asarray(datos, dtype=float)
+            valores, conteos = np.unique(datos[~np.isnan(datos)], return_counts=True)
+        if len(valores) == 0:
+            raise ValueError('No hay datos para construir la distribución empírica')
+        super().__init__(valores, conteos)
+
+    def rango(self, x):
+        """Cantidad de datos menores o iguales a x"""
+        posicion = np.searchsorted(self.valores_frecuencia, x, side='right')
+        return np.where(posicion > 0, self.acumulados[np.maximum(posicion - 1, 0)], 0)
+
+    def acumulada(self, x):
+        """Fn(x) = P(X ≤ x)"""
+        return self.rango(x) / self.n
+
+    def probabilidad(self, a, b=None):
+        """P(X ≤ a) o, si se indica b, P(a < X ≤ b)"""
+        if b is None:
+            return self.acumulada(a)
+        return np.maximum(self.acumulada(b) - self.acumulada(a), 0)
+
+    def probabilidad_mayor(self, x):
+        """P(X > x)"""
+        return 1 - self.acumulada(x)
+
+    def inversa(self, probabilidades):
+        """Menor valor x tal que Fn(x) ≥ p (inversa generalizada de la ECDF)"""
+        p = np.asarray(probabilidades, dtype=float)
+        if np.any((p < 0) | (p > 1)):
+            raise ValueError('Las probabilidades deben estar entre 0 y 1')
+        # Con p = 0 se devuelve el mínimo
+        posicion = np.searchsorted(self.acumulados, np.maximum(p * self.n, 1), side='left')
+        return self.valores_frecuencia[np.minimum(posicion, len(self.acumulados) - 1)]
+
+    def distancia_ks(self, distribucion):
+        """
+        Estadístico de Kolmogorov–Smirnov: máxima diferencia entre Fn y la
+        función acumulada de 'distribucion' (objeto con .cdf, ej. scipy.stats.norm)
+        """
+        teorica = distribucion.cdf(self.valores_frecuencia.astype(float))
+        anteriores = np.concatenate([[0], self.acumulados[:-1]]) / self.n
+        return float(max(np.max(self.acumulados / self.n - teorica), np.max(teorica - anteriores)))
+
+    def comparar_normal(self, normal=None, intervalos=None):
+        """
+        Compara las probabilidades empíricas con las de una DistribucionNormal
+
+        normal: DistribucionNormal; si es None se ajusta con la media y la
+                desviación estándar de los datos
+        intervalos: lista de (a, b); por defecto μ ± σ, μ ± 2σ y μ ± 3σ
+        """
+        if normal is None:
+            normal = DistribucionNormal(float(self.media), float(self.desviacion_estandar()))
+        if intervalos is None:
+            intervalos = [(normal.mu - k * normal.sigma, normal.mu + k * normal.sigma) for k in (1, 2, 3)]
+        limites = np.asarray(intervalos, dtype=float)
+        a, b = limites[:, 0], limites[:, 1]
+
+        empirica = self.probabilidad(a, b)
+        # Mismo cálculo que DistribucionNormal.probabilidad(a, b), para todos los intervalos a la vez
+        teorica = normal.distribucion.cdf(b) - normal.distribucion.cdf(a)
+        return pd.DataFrame({
+            'Intervalo': [f'[{inicio:.2f}, {fin:.2f}]' for inicio, fin in zip(a, b)],
+            'P Empírica': np.round(empirica, 4),
+            'P Normal': np.round(teorica, 4),
+            'Diferencia': np.round(empirica - teorica, 4)
+        })
@@ -0,0 +1,104 @@
+"""
+Estadísticas Incrementales - Resultados descriptivos que se actualizan al agregar filas
+"""
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.acumulador_descriptivo import AcumuladorDescriptivo
+from estadistica_descriptiva.resumen_descriptivo import es_entero_compacto
+
+
+class EstadisticasIncrementales:
+    """
+    Estadísticas de un conjunto de datos al que se le agregan filas
+    (por ejemplo, un nuevo lote de encuestas).
+
+    Cada columna numérica tiene un AcumuladorDescriptivo y cada columna de
+    texto/categórica un conteo por categoría. Al agregar filas solo se
+    procesan las filas nuevas: tendencia central, dispersión, forma,
+    cuadros de frecuencia y cuantiles quedan al día sin recalcular todo.
+
+    Los resúmenes se usan igual que los datos originales:
+        estadisticas = EstadisticasIncrementales(df)
+        estadisticas.agregar_filas(nuevo_lote)
+        calcular_varianza(estadisticas.resumen('Edad'))
+        generar_dfs(estadisticas.resumen('Edad'))
+
+    error_cuantiles: error del BosquejoCuantiles de cada columna numérica;
+                     las columnas con muchos valores distintos (no enteras)
+                     no guardan frecuencias y usan el bosquejo para
+                     mediana, cuartiles y percentiles
+    frecuencias: None decide por columna; True guarda siempre la tabla de
+                 frecuencias (útil si los datos ya están en memoria)
+    semilla: semilla de los bosquejos, para resultados reproducibles
+    """
+
+    def __init__(self, datos=None, error_cuantiles=0.01, frecuencias=None, semilla=None):
+        self.error_cuantiles = error_cuantiles
+        self.con_frecuencias = frecuencias
+        self.semilla = semilla
+        self.n_filas = 0
+        self.acumuladores = {}
+        self.categorias = {}
+        if datos is not None:
+            self.agregar_filas(datos)
+
+    @property
+    def columnas(self):
+        return list(self.acumuladores) + list(self.categorias)
+
+    def agregar_filas(self, filas):
+        """Incorpora filas nuevas (DataFrame o dict de columnas) y devuelve self"""
+        filas = pd.DataFrame(filas)
+        self.n_filas += len(filas)
+        for columna in filas.columns:
+            serie = filas[columna]
+            if columna in self.acumuladores:
+                self.acumuladores[columna].actualizar(serie)
+            elif columna in self.categorias:
+                self._contar_categorias(columna, serie)
+            elif pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+                # Con enteros de rango pequeño (ej. 'Edad') la tabla de frecuencias es exacta
+                frecuencias = self.con_frecuencias
+                if frecuencias is None:
+                    frecuencias = es_entero_compacto(serie.dropna())
+                self.acumuladores[columna] = AcumuladorDescriptivo(
+                    frecuencias=frecuencias, error_cuantiles=self.error_cuantiles,
+                    semilla=self.semilla).actualizar(serie)
+            else:
+                self.categorias[columna] = pd.Series(dtype=np.int64)
+                self._contar_categorias(columna, serie)
+        return self
+
+    def _contar_categorias(self, columna, serie):
+        conteos = serie.value_counts(dropna=True)
+        self.categorias[columna] = self.categorias[columna].add(conteos, fill_value=0).astype(np.int64)
+
+    def combinar(self, otras):
+        """Incorpora las estadísticas de otro conjunto de datos con las mismas columnas"""
+        self.n_filas += otras.n_filas
+        for columna, acumulador in otras.acumuladores.items():
+            if columna in self.acumuladores:
+                self.acumuladores[columna].combinar(acumulador)
+            else:
+                self.acumuladores[columna] = acumulador
+        for columna, conteos in otras.categorias.items():
+            actuales = self.categorias.get(columna, pd.Series(dtype=np.int64))
+            self.categorias[columna] = actuales.add(conteos, fill_value=0).astype(np.int64)
+        return self
+
+    def resumen(self, columna):
+        """AcumuladorDescriptivo de una columna numérica"""
+        if columna not in self.acumuladores:
+            raise KeyError(f"La columna '{columna}' no es numérica o no existe. "
+                           f"Columnas numéricas: {', '.join(self.acumuladores)}")
+        return self.acumuladores[columna]
+
+    def frecuencias(self, columna):
+        """(valores, frecuencias) ordenados de cualquier columna"""
+        if columna in self.categorias:
+            conteos = self.categorias[columna].sort_index()
+            return conteos.index.to_numpy(), conteos.to_numpy()
+        tabla = self.resumen(columna).tabla_frecuencias()
+        if tabla is None:
+            raise ValueError(f"La columna '{columna}' no guarda frecuencias (tiene demasiados valores distintos)")
+        return tabla
@@ -0,0 +1,124 @@
+"""
+Estadísticos de Orden - Mediana, cuartiles y cuantiles por selección (sin ordenar todo)
+"""
+import numpy as np
+
+# Posición "virtual" h (base 0) del cuantil p en n datos, mismos criterios que np.quantile
+METODOS_INTERPOLACION = {
+    'linear': 'h = p·(n-1), interpolación lineal (por defecto)',
+    'lower': 'Valor en ⌊p·(n-1)⌋',
+    'higher': 'Valor en ⌈p·(n-1)⌉',
+    'nearest': 'Valor en la posición más cercana a p·(n-1)',
+    'midpoint': 'Punto medio entre ⌊p·(n-1)⌋ y ⌈p·(n-1)⌉',
+    'hazen': 'h = p·n - 1/2',
+    'weibull': 'h = p·(n+1) - 1',
+    'median_unbiased': 'h = p·(n+1/3) - 2/3',
+    'normal_unbiased': 'h = p·(n+1/4) - 5/8'
+}
+
+# A partir de esta cantidad de rangos distintos conviene ordenar
+MAXIMO_RANGOS_SELECCION = 48
+
+_CONTINUOS = {
+    'linear': (1, 1),
+    'hazen': (0.5, 0.5),
+    'weibull': (0, 0),
+    'median_unbiased': (1 / 3, 1 / 3),
+    'normal_unbiased': (3 / 8, 3 / 8)
+}
+
+
+def posiciones_cuantiles(n, probabilidades, metodo='linear'):
+    """
+    Rangos (base 0) que hacen falta para cada cuantil y el peso del superior
+
+    Retorna (inferior, superior, fraccion): el cuantil es
+    x(inferior) + fraccion · (x(superior) - x(inferior)).
+    """
+    if metodo not in METODOS_INTERPOLACION:
+        raise ValueError(f"Método '{metodo}' no válido. Use: {', '.join(METODOS_INTERPOLACION)}")
+    p = np.asarray(probabilidades, dtype=float)
+    if np.any((p < 0) | (p > 1)):
+        raise ValueError('Las probabilidades deben estar entre 0 y 1')
+
+    if metodo in _CONTINUOS:
+        alfa, beta = _CONTINUOS[metodo]
+        posicion = np.clip(p * (n + 1 - alfa - beta) - 1 + alfa, 0, n - 1)
+    else:
+        posicion = p * (n - 1)
+
+    inferior = np.floor(posicion).astype(np.int64)
+    superior = np.minimum(inferior + 1, n - 1)
+    fraccion = posicion - inferior
+    if metodo == 'lower':
+        fraccion = np.zeros_like(fraccion)
+    elif metodo == 'higher':
+        fraccion = (fraccion > 0).astype(float)
+    elif metodo == 'nearest':
+        # Como np.around: los empates van a la posición par
+        fraccion = (np.around(posicion) > inferior).astype(float)
+    elif metodo == 'midpoint':
+        fraccion = np.where(fraccion > 0, 0.5, 0.0)
+    return inferior, superior, fraccion
+
+
+def seleccionar_rangos(datos, rangos):
+    """
+    Valores que ocuparían los rangos indicados (base 0) si los datos se
+    ordenaran, sin ordenarlos
+
+    Selección con varios pivotes: se ubica el rango central con una
+    partición (introselect) y los demás se buscan solo en la parte izquierda
+    o derecha que les corresponde, así cada nivel recorre segmentos
+    disjuntos: O(n · log k) para k rangos distintos.
+    """
+    rangos = np.asarray(rangos, dtype=np.int64)
+    distintos = np.unique(rangos)
+    if len(distintos) > MAXIMO_RANGOS_SELECCION:
+        # Con muchos rangos (ej. los 99 percentiles) ordenar es más rápido
+        return np.sort(datos)[rangos]
+    particion = np.array(datos, copy=True)
+    pendientes = [(0, len(particion), distintos)]
+    while pendientes:
+        inicio, fin, buscados = pendientes.pop()
+        medio = buscados[len(buscados) // 2]
+        # Particionar una vista modifica ese segmento en su lugar
+        particion[inicio:fin].partition(medio - inicio)
+        izquierda = buscados[buscados < medio]
+        derecha = buscados[buscados > medio]
+        if len(izquierda):
+            pendientes.append((inicio, medio, izquierda))
+        if len(derecha):
+            pendientes.append((medio + 1, fin, derecha))
+    return particion[rangos]
+
+
+def _combinar(bajo, alto, fraccion):
+    if np.issubdtype(np.asarray(bajo).dtype, np.integer):
+        bajo = bajo.astype(float)
+    return bajo + fraccion * (alto - bajo)
+
+
+def cuantiles_seleccion(datos, probabilidades, metodo='linear'):
+    """
+    Cuantiles en O(n) por selección: solo se ubican los rangos necesarios,
+    sin ordenar todos los datos
+    """
+    valores = np.asarray(datos)
+    inferior, superior, fraccion = posiciones_cuantiles(len(valores), probabilidades, metodo)
+    rangos = np.concatenate([np.ravel(inferior), np.ravel(superior)])
+    seleccion = seleccionar_rangos(valores, rangos)
+    bajo = seleccion[:np.size(inferior)].reshape(np.shape(inferior))
+    alto = seleccion[np.size(inferior):].reshape(np.shape(inferior))
+    return _combinar(bajo, alto, fraccion)
+
+
+def cuantiles_ordenados(ordenados, probabilidades, metodo='linear'):
+    """Cuantiles de datos que ya están ordenados"""
+    inferior, superior, fraccion = posiciones_cuantiles(len(ordenados), probabilidades, metodo)
+    return _combinar(ordenados[inferior], ordenados[superior], fraccion)
+
+
+def mediana_seleccion(datos, metodo='linear'):
+    """Mediana por selección"""
+    return cuantiles_seleccion(datos, 0.5, metodo)
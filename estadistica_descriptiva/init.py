@@ -5,6 +5,7 @@ Contiene todas las funciones para análisis descriptivo de datos
 
 from .analisis_estadistico import (
     calcular_tendencia_central,
+    calcular_frecuencias,
     generar_dfs,
     generar_dfsvai
 )
@@ -28,14 +29,88 @@ from .medidas_forma import (
 )
 
 from .medidas_posicion import (
+    calcular_cuantiles,
     calcular_cuartiles,
     calcular_deciles,
     calcular_percentiles,
+    intervalos_percentiles,
     analisis_completo_posicion,
     generar_tabla_posicion,
     crear_boxplot
 )
 
+from .estadisticos_orden import (
+    METODOS_INTERPOLACION,
+    seleccionar_rangos,
+    cuantiles_seleccion,
+    mediana_seleccion
+)
+
+from .medias import calcular_medias, MANEJO_NO_POSITIVOS
+
+from .modas import contar_valores, calcular_modas, moda_por_clases
+
+from .intervalos_clase import (
+    REGLAS_INTERVALOS,
+    calcular_bordes,
+    contar_en_clases,
+    columnas_acumuladas,
+    tabla_intervalos,
+    agrupar_en_clases
+)
+
+from .resumen_descriptivo import (
+    ResumenDescriptivo,
+    ResumenFrecuencias,
+    ResumenEnteros,
+    obtener_resumen
+)
+
+from .datos_agrupados import (
+    ResumenAgrupado,
+    resumen_desde_tabla,
+    moda_agrupada,
+    analisis_datos_agrupados,
+    generar_tabla_agrupada
+)
+
+from .acumulador_descriptivo import (
+    AcumuladorDescriptivo,
+    analizar_csv_por_bloques,
+    analizar_particiones
+)
+
+from .bosquejo_cuantiles import BosquejoCuantiles
+
+from .estadisticas_incrementales import EstadisticasIncrementales
+
+from .valores_atipicos import (
+    detectar_atipicos,
+    indices_atipicos,
+    eliminar_atipicos,
+    resumen_atipicos
+)
+
+from .analisis_por_grupos import analisis_descriptivo_columnas
+
+from .intervalos_bootstrap import (
+    ESTADISTICOS_BOOTSTRAP,
+    remuestrear,
+    intervalo_bootstrap,
+    generar_tabla_bootstrap
+)
+
+from .ventanas_moviles import (
+    CuantilMovil,
+    estadisticas_moviles,
+    estadisticas_acumuladas,
+    cuantiles_moviles
+)
+
+from .distribucion_empirica import DistribucionEmpirica
+
+from .densidad_kernel import REGLAS_ANCHO_BANDA, calcular_ancho_banda, densidad_kernel
+
 from .graficas import (
     graficar_tendencia,
     graficar_frecuencia
@@ -44,6 +119,7 @@ from .graficas import (
 __all__ = [
     # Análisis estadístico
     'calcular_tendencia_central',
+    'calcular_frecuencias',
     'generar_dfs',
     'generar_dfsvai',
     
@@ -64,13 +140,85 @@ __all__ = [
     'graficar_forma',
     
     # Posición
+    'calcular_cuantiles',
     'calcular_cuartiles',
     'calcular_deciles',
     'calcular_percentiles',
+    'intervalos_percentiles',
     'analisis_completo_posicion',
     'generar_tabla_posicion',
     'crear_boxplot',
     
+    # Estadísticos de orden
+    'METODOS_INTERPOLACION',
+    'seleccionar_rangos',
+    'cuantiles_seleccion',
+    'mediana_seleccion',
+    
+    # Medias
+    'calcular_medias',
+    'MANEJO_NO_POSITIVOS',
+    
+    # Modas
+    'contar_valores',
+    'calcular_modas',
+    'moda_por_clases',
+    
+    # Intervalos de clase
+    'REGLAS_INTERVALOS',
+    'calcular_bordes',
+    'contar_en_clases',
+    'columnas_acumuladas',
+    'tabla_intervalos',
+    'agrupar_en_clases',
+    
+    # Núcleo descriptivo
+    'ResumenDescriptivo',
+    'ResumenFrecuencias',
+    'ResumenEnteros',
+    
+    # Datos agrupados
+    'ResumenAgrupado',
+    'resumen_desde_tabla',
+    'moda_agrupada',
+    'analisis_datos_agrupados',
+    'generar_tabla_agrupada',
+    'obtener_resumen',
+    'AcumuladorDescriptivo',
+    'analizar_csv_por_bloques',
+    'analizar_particiones',
+    'BosquejoCuantiles',
+    'EstadisticasIncrementales',
+    
+    # Valores atípicos
+    'detectar_atipicos',
+    'indices_atipicos',
+    'eliminar_atipicos',
+    'resumen_atipicos',
+    
+    # Varias columnas y grupos
+    'analisis_descriptivo_columnas',
+    
+    # Intervalos bootstrap
+    'ESTADISTICOS_BOOTSTRAP',
+    'remuestrear',
+    'intervalo_bootstrap',
+    'generar_tabla_bootstrap',
+    
+    # Ventanas móviles y acumuladas
+    'CuantilMovil',
+    'estadisticas_moviles',
+    'estadisticas_acumuladas',
+    'cuantiles_moviles',
+    
+    # Distribución empírica (ECDF)
+    'DistribucionEmpirica',
+    
+    # Densidad kernel
+    'REGLAS_ANCHO_BANDA',
+    'calcular_ancho_banda',
+    'densidad_kernel',
+    
     # Gráficas
     'graficar_tendencia',
     'graficar_frecuencia'
@@ -0,0 +1,292 @@
+"""
+Intervalos Bootstrap - Intervalos de confianza por remuestreo para cualquier medida descriptiva
+"""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from scipy import stats
+from estadistica_descriptiva.acumulador_descriptivo import quitar_dato
+from estadistica_descriptiva.resumen_descriptivo import ResumenDescriptivo, coeficientes_forma, momentos_centrales
+
+# Memoria aproximada (en valores float64) de cada bloque de remuestras
+_VALORES_POR_BLOQUE = 4_000_000
+
+# Con más datos, el jackknife de funciones propias quita grupos en vez de observaciones
+MAXIMO_GRUPOS_JACKKNIFE = 1000
+
+
+def _media(muestras):
+    return muestras.mean(axis=1)
+
+
+def _mediana(muestras):
+    return np.median(muestras, axis=1)
+
+
+def _iqr(muestras):
+    q1, q3 = np.quantile(muestras, [0.25, 0.75], axis=1)
+    return q3 - q1
+
+
+def _varianza(muestras):
+    return muestras.var(axis=1, ddof=1)
+
+
+def _desviacion_estandar(muestras):
+    return muestras.std(axis=1, ddof=1)
+
+
+def _cv(muestras):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return muestras.std(axis=1, ddof=1) / np.abs(muestras.mean(axis=1)) * 100
+
+
+def _asimetria(muestras):
+    return coeficientes_forma(*momentos_centrales(muestras)[1:])[0]
+
+
+def _curtosis(muestras):
+    return coeficientes_forma(*momentos_centrales(muestras)[1:])[1]
+
+
+# Cada estadístico recibe una matriz (remuestras, n) y devuelve un valor por fila
+ESTADISTICOS_BOOTSTRAP = {
+    'media': ('Media', _media),
+    'mediana': ('Mediana', _mediana),
+    'iqr': ('IQR', _iqr),
+    'varianza': ('Varianza', _varianza),
+    'desviacion_estandar': ('Desviación Estándar', _desviacion_estandar),
+    'cv': ('CV (%)', _cv),
+    'asimetria': ('Asimetría', _asimetria),
+    'curtosis': ('Curtosis', _curtosis)
+}
+
+
+def _obtener_funcion(estadistico):
+    if callable(estadistico):
+        return estadistico
+    if estadistico not in ESTADISTICOS_BOOTSTRAP:
+        raise ValueError(f"Estadístico '{estadistico}' no válido. Use: {', '.join(ESTADISTICOS_BOOTSTRAP)}")
+    return ESTADISTICOS_BOOTSTRAP[estadistico][1]
+
+
+def _preparar_datos(datos):
+    if isinstance(datos, ResumenDescriptivo):
+        if not hasattr(datos, 'valores'):
+            raise ValueError('El bootstrap necesita los datos originales, no solo un resumen')
+        datos = datos.valores
+    valores = np.asarray(datos, dtype=float)
+    valores = valores[~np.isnan(valores)]
+    if len(valores) < 2:
+        raise ValueError('Se necesitan al menos 2 datos para el bootstrap')
+    return valores
+
+
+def _replicas_bloque(valores, funciones, cantidad, semilla):
+    """Evalúa todas las funciones sobre las mismas 'cantidad' remuestras"""
+    rng = np.random.default_rng(semilla)
+    indices = rng.integers(0, len(valores), size=(cantidad, len(valores)))
+    muestras = valores[indices]
+    return np.stack([funcion(muestras) for funcion in funciones])
+
+
+def remuestrear(datos, estadisticos='media', remuestras=2000, procesos=1, semilla=None):
+    """
+    Réplicas bootstrap de uno o varios estadísticos
+
+    Las remuestras se generan por bloques (índices aleatorios de tamaño
+    bloque × n) y cada estadístico se evalúa de forma vectorizada sobre todo
+    el bloque. Cada bloque tiene su propia semilla derivada de 'semilla', así
+    que el resultado es el mismo con cualquier cantidad de procesos.
+
+    estadisticos: nombre de ESTADISTICOS_BOOTSTRAP, función f(matriz) → arreglo
+                  por fila, o una lista de ellos (se evalúan sobre las mismas remuestras)
+    procesos: 1 = sin paralelismo, None = todos los núcleos (las funciones
+              propias deben definirse a nivel de módulo para poder enviarse)
+
+    Retorna un arreglo (remuestras,) o (cantidad de estadísticos, remuestras).
+    """
+    valores = _preparar_datos(datos)
+    unico = not isinstance(estadisticos, (list, tuple))
+    funciones = [_obtener_funcion(e) for e in ([estadisticos] if unico else estadisticos)]
+
+    tamano_bloque = max(1, min(remuestras, _VALORES_POR_BLOQUE // len(valores)))
+    cantidades = [tamano_bloque] * (remuestras // tamano_bloque)
+    if remuestras % tamano_bloque:
+        cantidades.append(remuestras % tamano_bloque)
+    semillas = np.random.SeedSequence(semilla).spawn(len(cantidades))
+    argumentos = ([valores] * len(cantidades), [funciones] * len(cantidades), cantidades, semillas)
+
+    if procesos == 1 or len(cantidades) == 1:
+        bloques = list(map(_replicas_bloque, *argumentos))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            bloques = list(ejecutor.map(_replicas_bloque, *argumentos))
+    replicas = np.concatenate(bloques, axis=1)
+    return replicas[0] if unico else replicas
+
+
+def _momentos_sin_cada_uno(valores):
+    """Media y sumas M2, M3, M4 de la muestra sin cada observación, en O(n)"""
+    media, m2, m3, m4 = momentos_centrales(valores)
+    n = len(valores)
+    _, medias, m2, m3, m4 = quitar_dato((n, media, m2 * n, m3 * n, m4 * n), valores)
+    return medias, m2, m3, m4
+
+
+def _cuantiles_sin_cada_uno(valores, probabilidades):
+    """
+    Cuantiles (interpolación lineal) de la muestra sin cada observación, con
+    un solo ordenamiento: quitar el dato de rango r solo corre un lugar los
+    rangos mayores que r
+    """
+    n = len(valores)
+    orden = np.argsort(valores, kind='stable')
+    ordenados = valores[orden]
+    rangos = np.empty(n, dtype=np.int64)
+    rangos[orden] = np.arange(n)
+
+    def valor_en(k):
+        # Posición k (base 0) de los n - 1 datos que quedan
+        return np.where(k < rangos, ordenados[k], ordenados[min(k + 1, n - 1)])
+
+    resultados = []
+    for p in probabilidades:
+        posicion = p * (n - 2)
+        inferior = int(np.floor(posicion))
+        bajo = valor_en(inferior)
+        alto = valor_en(min(inferior + 1, n - 2))
+        resultados.append(bajo + (posicion - inferior) * (alto - bajo))
+    return resultados
+
+
+def _jackknife_momentos(valores):
+    n = len(valores)
+    medias, m2, m3, m4 = _momentos_sin_cada_uno(valores)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varianzas = m2 / (n - 2)
+        asimetria, curtosis = coeficientes_forma(m2 / (n - 1), m3 / (n - 1), m4 / (n - 1))
+        return {
+            _media: medias,
+            _varianza: varianzas,
+            _desviacion_estandar: np.sqrt(varianzas),
+            _cv: np.sqrt(varianzas) / np.abs(medias) * 100,
+            _asimetria: asimetria,
+            _curtosis: curtosis
+        }
+
+
+def _jackknife_grupos(valores, funcion):
+    """
+    Estadístico sin cada grupo de observaciones, por bloques de filas.
+    Con n ≤ MAXIMO_GRUPOS_JACKKNIFE cada grupo es una observación (jackknife
+    clásico); con más datos, el grupo g reúne las posiciones i con
+    i mod MAXIMO_GRUPOS_JACKKNIFE = g, así el costo queda en O(grupos · n).
+    """
+    n = len(valores)
+    grupos = min(n, MAXIMO_GRUPOS_JACKKNIFE)
+    grupo_de = np.arange(n) % grupos
+    tamanos = np.bincount(grupo_de, minlength=grupos)
+    resultados = np.empty(grupos)
+    # Las filas de un bloque deben conservar la misma cantidad de datos
+    for tamano in np.unique(tamanos):
+        quitados = np.flatnonzero(tamanos == tamano)
+        filas_por_bloque = max(1, _VALORES_POR_BLOQUE // n)
+        for inicio in range(0, len(quitados), filas_por_bloque):
+            filas = quitados[inicio:inicio + filas_por_bloque]
+            conservar = grupo_de[None, :] != filas[:, None]
+            muestras = np.broadcast_to(valores, (len(filas), n))[conservar].reshape(len(filas), n - tamano)
+            resultados[filas] = funcion(muestras)
+    return resultados
+
+
+def _jackknife(valores, funcion):
+    """
+    Valores jackknife del estadístico: fórmulas directas en O(n) o
+    O(n log n) para las medidas de ESTADISTICOS_BOOTSTRAP, y jackknife por
+    grupos (_jackknife_grupos) para funciones propias
+    """
+    if funcion in (_mediana, _iqr):
+        if funcion is _mediana:
+            return _cuantiles_sin_cada_uno(valores, [0.5])[0]
+        q1, q3 = _cuantiles_sin_cada_uno(valores, [0.25, 0.75])
+        return q3 - q1
+    if funcion in (_media, _varianza, _desviacion_estandar, _cv, _asimetria, _curtosis):
+        return _jackknife_momentos(valores)[funcion]
+    return _jackknife_grupos(valores, funcion)
+
+
+def _limites(valores, funcion, estimacion, replicas, confianza, metodo):
+    alfa = 1 - confianza
+    if metodo == 'percentil':
+        return np.quantile(replicas, [alfa / 2, 1 - alfa / 2])
+
+    # BCa: corrección de sesgo (z0) y aceleración (a) por jackknife
+    proporcion = np.mean(replicas < estimacion) + 0.5 * np.mean(replicas == estimacion)
+    proporcion = np.clip(proporcion, 1 / (len(replicas) + 1), len(replicas) / (len(replicas) + 1))
+    z0 = stats.norm.ppf(proporcion)
+
+    jackknife = _jackknife(valores, funcion)
+    diferencias = jackknife.mean() - jackknife
+    denominador = 6 * (diferencias ** 2).sum() ** 1.5
+    aceleracion = (diferencias ** 3).sum() / denominador if denominador > 0 else 0.0
+
+    z = stats.norm.ppf([alfa / 2, 1 - alfa / 2])
+    ajustados = stats.norm.cdf(z0 + (z0 + z) / (1 - aceleracion * (z0 + z)))
+    return np.quantile(replicas, ajustados)
+
+
+def intervalo_bootstrap(datos, estadistico='media', confianza=0.95, metodo='percentil',
+                        remuestras=2000, procesos=1, semilla=None):
+    """
+    Intervalo de confianza bootstrap de una medida descriptiva
+
+    metodo: 'percentil' o 'bca' (corregido por sesgo y acelerado)
+    """
+    if metodo not in ('percentil', 'bca'):
+        raise ValueError("Método no válido. Use 'percentil' o 'bca'")
+    valores = _preparar_datos(datos)
+    funcion = _obtener_funcion(estadistico)
+    estimacion = float(funcion(valores[None, :])[0])
+    replicas = remuestrear(valores, funcion, remuestras, procesos, semilla)
+    inferior, superior = _limites(valores, funcion, estimacion, replicas, confianza, metodo)
+    nombre = ESTADISTICOS_BOOTSTRAP[estadistico][0] if isinstance(estadistico, str) else 'Estadístico'
+
+    return {
+        'estadistico': nombre,
+        'estimacion': round(estimacion, 4),
+        'limite_inferior': round(float(inferior), 4),
+        'limite_superior': round(float(superior), 4),
+        'error_estandar': round(float(replicas.std(ddof=1)), 4),
+        'sesgo': round(float(replicas.mean() - estimacion), 4),
+        'confianza': confianza,
+        'metodo': metodo,
+        'remuestras': remuestras,
+        'interpretacion': f'Con {confianza * 100:g}% de confianza, {nombre.lower()} está entre '
+                          f'{round(float(inferior), 4)} y {round(float(superior), 4)}'
+    }
+
+
+def generar_tabla_bootstrap(datos, estadisticos=None, confianza=0.95, metodo='percentil',
+                            remuestras=2000, procesos=1, semilla=None):
+    """
+    Tabla de intervalos bootstrap para varias medidas, todas calculadas
+    sobre las mismas remuestras
+    """
+    if estadisticos is None:
+        estadisticos = list(ESTADISTICOS_BOOTSTRAP)
+    if metodo not in ('percentil', 'bca'):
+        raise ValueError("Método no válido. Use 'percentil' o 'bca'")
+    valores = _preparar_datos(datos)
+    replicas = remuestrear(valores, list(estadisticos), remuestras, procesos, semilla)
+
+    filas = []
+    for estadistico, replicas_estadistico in zip(estadisticos, replicas):
+        nombre, funcion = ESTADISTICOS_BOOTSTRAP[estadistico]
+        estimacion = float(funcion(valores[None, :])[0])
+        inferior, superior = _limites(valores, funcion, estimacion, replicas_estadistico, confianza, metodo)
+        filas.append([nombre, round(estimacion, 4), round(float(inferior), 4), round(float(superior), 4),
+                      round(float(replicas_estadistico.std(ddof=1)), 4)])
+
+    columnas = ['Medida', 'Estimación', 'Límite Inferior', 'Límite Superior', 'Error Estándar']
+    return pd.DataFrame(filas, columns=columnas)
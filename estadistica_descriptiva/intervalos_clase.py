@@ -0,0 +1,146 @@
+"""
+Intervalos de Clase - Construcción y conteo vectorizado de clases para datos agrupados
+"""
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.resumen_descriptivo import ResumenDescriptivo, obtener_resumen
+
+REGLAS_INTERVALOS = {
+    'sturges': 'k = ⌈log2(n)⌉ + 1 clases',
+    'scott': 'Amplitud c = 3.49 · σ · n^(-1/3)',
+    'fd': 'Amplitud c = 2 · IQR · n^(-1/3) (Freedman–Diaconis)',
+    'fija': 'Amplitud c indicada por el usuario'
+}
+
+
+def calcular_bordes(datos, clases=10, amplitud=None):
+    """
+    Calcula los bordes de las clases de un conjunto de datos
+
+    datos: arreglo de datos o ResumenDescriptivo (incluye acumuladores y
+           resúmenes de frecuencias)
+    clases: cantidad de clases (int), una regla de REGLAS_INTERVALOS
+            ('sturges', 'scott', 'fd') o bordes ya definidos (arreglo)
+    amplitud: ancho fijo de clase; si se indica, tiene prioridad sobre 'clases'
+              y los bordes son múltiplos de la amplitud
+
+    Retorna un arreglo de k+1 bordes crecientes; las clases son (a, b].
+    """
+    if not isinstance(clases, (int, np.integer, str)):
+        return np.asarray(clases, dtype=float)
+
+    if not isinstance(datos, ResumenDescriptivo):
+        datos = np.asarray(datos, dtype=float)
+        datos = datos[~np.isnan(datos)]
+        minimo, maximo = datos.min(), datos.max()
+    else:
+        minimo, maximo = datos.minimo, datos.maximo
+    minimo, maximo = float(minimo), float(maximo)
+    rango = maximo - minimo
+
+    if amplitud is not None:
+        if amplitud <= 0:
+            raise ValueError('La amplitud de clase debe ser positiva')
+        inicio = np.ceil(minimo / amplitud) * amplitud - amplitud
+        cantidad = max(int(np.ceil((maximo - inicio) / amplitud)), 1)
+        return inicio + amplitud * np.arange(cantidad + 1)
+
+    if isinstance(clases, str):
+        if clases not in REGLAS_INTERVALOS or clases == 'fija':
+            raise ValueError(f"Regla '{clases}' no válida. Use: sturges, scott, fd o amplitud=")
+        n = len(datos) if not isinstance(datos, ResumenDescriptivo) else datos.n
+        if clases == 'sturges':
+            cantidad = int(np.ceil(np.log2(n))) + 1
+        else:
+            # Scott y Freedman–Diaconis necesitan la dispersión de los datos
+            resumen = obtener_resumen(datos)
+            if clases == 'scott':
+                ancho = (24 * np.sqrt(np.pi) / n) ** (1 / 3) * resumen.desviacion_estandar(ddof=0)
+            else:
+                q1, _, q3 = resumen.cuartiles()
+                ancho = 2 * (q3 - q1) * n ** (-1 / 3)
+            cantidad = int(np.ceil(rango / ancho)) if ancho > 0 and rango > 0 else 1
+    else:
+        cantidad = int(clases)
+    if cantidad < 1:
+        raise ValueError('Debe haber al menos una clase')
+
+    # Igual que pd.cut: las clases son (a, b], así que el primer borde baja
+    # un 0.1% del rango para que el mínimo quede dentro de la primera clase
+    if rango == 0:
+        ajuste = 0.001 * abs(minimo) if minimo != 0 else 0.001
+        return np.linspace(minimo - ajuste, maximo + ajuste, cantidad + 1)
+    bordes = np.linspace(minimo, maximo, cantidad + 1)
+    bordes[0] -= rango * 0.001
+    return bordes
+
+
+def contar_en_clases(datos, bordes, pesos=None):
+    """
+    Frecuencia de cada clase (a, b] con búsqueda binaria y np.bincount
+
+    Los valores faltantes o fuera de los bordes no se cuentan, así que con
+    los mismos bordes los conteos de varios bloques de un CSV se pueden sumar.
+    pesos: frecuencia de cada valor (para tablas de frecuencia ya contadas)
+    """
+    bordes = np.asarray(bordes, dtype=float)
+    valores = np.asarray(datos, dtype=float)
+    clase = np.searchsorted(bordes, valores, side='left') - 1
+    dentro = (clase >= 0) & (clase < len(bordes) - 1)
+    if pesos is not None:
+        pesos = np.asarray(pesos)[dentro]
+    conteos = np.bincount(clase[dentro], weights=pesos, minlength=len(bordes) - 1)
+    return conteos.astype(np.int64)
+
+
+def columnas_acumuladas(frecuencias):
+    """
+    Columnas 'Frecuencia Acumulada', 'Frecuencia Relativa' y 'Frecuencia
+    Relativa Acumulada' de un cuadro de frecuencias; las relativas se
+    redondean al final para no acumular errores de redondeo
+    """
+    frecuencias = np.asarray(frecuencias)
+    total = frecuencias.sum()
+    acumulada = np.cumsum(frecuencias)
+    return {
+        "Frecuencia Acumulada": acumulada,
+        "Frecuencia Relativa": np.round(frecuencias / total, 2),
+        "Frecuencia Relativa Acumulada": np.round(acumulada / total, 2)
+    }
+
+
+def tabla_intervalos(bordes, frecuencias):
+    """
+    Cuadro de frecuencia agrupada a partir de los bordes y las frecuencias
+    de cada clase (por ejemplo, la suma de los conteos de varios bloques)
+    """
+    bordes = np.asarray(bordes, dtype=float)
+    frecuencias = np.asarray(frecuencias)
+    # Etiquetas redondeadas como las de pd.cut, creadas una vez por clase
+    etiquetas = pd.cut(np.array([]), bins=bordes).categories
+
+    return pd.DataFrame({
+        "Intervalo": etiquetas,
+        "Límite Inferior": bordes[:-1],
+        "Límite Superior": bordes[1:],
+        "Frecuencia": frecuencias,
+        "Marca de Clase": np.round((bordes[:-1] + bordes[1:]) / 2, 2),
+        **columnas_acumuladas(frecuencias)
+    })
+
+
+def agrupar_en_clases(datos, clases=10, amplitud=None):
+    """
+    (bordes, frecuencias) de los datos: arreglo o ResumenDescriptivo.
+    Los resúmenes con tabla de frecuencias (ResumenFrecuencias,
+    AcumuladorDescriptivo con frecuencias) se cuentan sin expandirse.
+    """
+    bordes = calcular_bordes(datos, clases, amplitud)
+    if isinstance(datos, ResumenDescriptivo):
+        tabla = datos.tabla_frecuencias()
+        if tabla is not None:
+            return bordes, contar_en_clases(tabla[0], bordes, pesos=tabla[1])
+        if not hasattr(datos, 'valores'):
+            raise ValueError('El resumen no guarda frecuencias para contar las clases')
+        datos = datos.valores
+    return bordes, contar_en_clases(datos, bordes)
@@ -0,0 +1,139 @@
+"""
+Medias - Aritmética, geométrica, armónica, recortada y winsorizada en una sola pasada
+"""
+import numpy as np
+from estadistica_descriptiva.acumulador_descriptivo import AcumuladorDescriptivo
+from estadistica_descriptiva.estadisticos_orden import seleccionar_rangos
+from estadistica_descriptiva.resumen_descriptivo import valores_en_rangos_frecuencias, valores_y_pesos
+
+MANEJO_NO_POSITIVOS = {
+    'estandar': 'Como scipy: con ceros G = H = 0; con negativos G y H no existen (NaN)',
+    'omitir': 'G y H se calculan solo con los valores positivos',
+    'error': 'Se lanza un error si hay ceros o negativos'
+}
+
+
+def _media_recortada_winsorizada(valores, pesos, n, proporcion):
+    """
+    Quita (recortada) o reemplaza por el valor más cercano que queda
+    (winsorizada) ⌊proporcion·n⌋ datos de cada extremo
+    """
+    g = int(proporcion * n)
+    if g == 0:
+        media = valores.mean() if pesos is None else (valores * pesos).sum() / n
+        return media, media
+    if 2 * g >= n:
+        return np.nan, np.nan
+
+    if pesos is None:
+        # Sin ordenar: solo se ubican los valores en los rangos de corte
+        n = int(n)
+        a, inferior, superior, b = seleccionar_rangos(valores, [g - 1, g, n - g - 1, n - g])
+        menores = valores < a
+        mayores = valores > b
+        suma_bajos = valores[menores].sum() + (g - np.count_nonzero(menores)) * a
+        suma_altos = valores[mayores].sum() + (g - np.count_nonzero(mayores)) * b
+        suma_central = valores.sum() - suma_bajos - suma_altos
+    else:
+        # Tabla de frecuencias ordenada: cuántas copias de cada valor quedan entre g y n-g
+        acumulados = np.cumsum(pesos)
+        conservados = np.clip(np.minimum(acumulados, n - g) - np.maximum(acumulados - pesos, g), 0, None)
+        suma_central = (conservados * valores).sum()
+        inferior, superior = valores_en_rangos_frecuencias(valores, acumulados, [g, n - g - 1])
+    return suma_central / (n - 2 * g), (suma_central + g * (inferior + superior)) / n
+
+
+def _sumas_positivos(valores, pesos):
+    """(cantidad de positivos, Σ ln xi, Σ 1/xi, ceros, negativos) con los pesos de cada valor"""
+    positivos = valores > 0
+    return (pesos[positivos].sum(), (pesos[positivos] * np.log(valores[positivos])).sum(),
+            (pesos[positivos] / valores[positivos]).sum(),
+            int(pesos[valores == 0].sum()), int(pesos[valores < 0].sum()))
+
+
+def _medias_geometrica_armonica(n_positivos, suma_logaritmos, suma_inversos, ceros, negativos, no_positivos):
+    """
+    G = exp(Σ ln xi / n) y H = n / Σ(1/xi) a partir de sus sumas, que se
+    obtienen de los datos o ya acumuladas por bloques (AcumuladorDescriptivo)
+
+    Retorna (geometrica, armonica, advertencia)
+    """
+    cantidad_no_positivos = ceros + negativos
+    if cantidad_no_positivos and no_positivos == 'error':
+        raise ValueError(f'Hay {cantidad_no_positivos} valores menores o iguales a 0: '
+                         'las medias geométrica y armónica solo se definen para valores positivos')
+
+    if cantidad_no_positivos and no_positivos == 'estandar':
+        if negativos:
+            return np.nan, np.nan, 'Hay valores negativos: las medias geométrica y armónica no existen'
+        return 0.0, 0.0, 'Hay ceros: las medias geométrica y armónica valen 0'
+
+    if n_positivos == 0:
+        geometrica = armonica = np.nan
+    else:
+        geometrica = np.exp(suma_logaritmos / n_positivos)
+        armonica = n_positivos / suma_inversos
+    advertencia = None
+    if cantidad_no_positivos:
+        advertencia = f'Se omitieron {cantidad_no_positivos} valores ≤ 0 en las medias geométrica y armónica'
+    return geometrica, armonica, advertencia
+
+
+def calcular_medias(datos, proporcion=0.1, no_positivos='estandar'):
+    """
+    Calcula todas las medias de los datos en una sola pasada vectorizada
+
+    datos: arreglo de datos o ResumenDescriptivo (incluye tablas de frecuencia
+           y acumuladores por bloques)
+    proporcion: fracción de datos que se recorta/winsoriza en cada extremo
+    no_positivos: manejo de ceros y negativos en las medias geométrica y
+                  armónica (ver MANEJO_NO_POSITIVOS)
+
+    La media geométrica se calcula como exp(Σ ln xi / n), sin multiplicar
+    los datos, así que no se desborda con n grande. Un AcumuladorDescriptivo
+    sin frecuencias usa las sumas que acumuló bloque a bloque; sus medias
+    recortada y winsorizada se estiman con el bosquejo de cuantiles (NaN si
+    no lo tiene).
+    """
+    if no_positivos not in MANEJO_NO_POSITIVOS:
+        raise ValueError(f"Opción '{no_positivos}' no válida. Use: {', '.join(MANEJO_NO_POSITIVOS)}")
+    if not 0 <= proporcion < 0.5:
+        raise ValueError('La proporción a recortar debe estar entre 0 y 0.5')
+
+    if isinstance(datos, AcumuladorDescriptivo) and not datos.con_frecuencias:
+        n = datos.n
+        if n == 0:
+            raise ValueError('No hay datos para calcular las medias')
+        aritmetica = datos.media
+        sumas = (n - datos.ceros - datos.negativos, datos.suma_logaritmos, datos.suma_inversos,
+                 datos.ceros, datos.negativos)
+        if datos.bosquejo is not None:
+            valores, pesos = datos.bosquejo.elementos()
+            recortada, winsorizada = _media_recortada_winsorizada(valores, pesos, pesos.sum(), proporcion)
+        else:
+            recortada = winsorizada = np.nan
+    else:
+        valores, pesos = valores_y_pesos(datos)
+        n = len(valores) if pesos is None else pesos.sum()
+        if n == 0:
+            raise ValueError('No hay datos para calcular las medias')
+
+        recortada, winsorizada = _media_recortada_winsorizada(valores, pesos, n, proporcion)
+        if pesos is None:
+            pesos = np.ones(len(valores))
+        aritmetica = (valores * pesos).sum() / n
+        sumas = _sumas_positivos(valores, pesos)
+
+    geometrica, armonica, advertencia = _medias_geometrica_armonica(*sumas, no_positivos)
+
+    return {
+        'n': int(n),
+        'aritmetica': aritmetica,
+        'geometrica': geometrica,
+        'armonica': armonica,
+        'recortada': recortada,
+        'winsorizada': winsorizada,
+        'proporcion': proporcion,
+        'no_positivos': sumas[3] + sumas[4],
+        'advertencia': advertencia
+    }
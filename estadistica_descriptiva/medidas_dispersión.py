@@ -4,13 +4,17 @@ Medidas de Dispersión - Varianza, Desviación Estándar, Rango, CV
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from estadistica_descriptiva.resumen_descriptivo import obtener_resumen
 
 def calcular_rango(datos):
     """
     Calcula el rango (diferencia entre máximo y mínimo)
+
+    datos: arreglo de datos o ResumenDescriptivo ya calculado
     """
-    minimo = np.min(datos)
-    maximo = np.max(datos)
+    resumen = obtener_resumen(datos)
+    minimo = resumen.minimo
+    maximo = resumen.maximo
     rango = maximo - minimo
     
     return {
@@ -26,22 +30,23 @@ def calcular_varianza(datos, poblacion=False):
     
     poblacion: True para varianza poblacional, False para muestral
     """
+    resumen = obtener_resumen(datos)
     if poblacion:
-        varianza = np.var(datos, ddof=0)
+        varianza = resumen.varianza(ddof=0)
         tipo = 'poblacional'
         formula = 'σ² = Σ(xi - μ)² / N'
     else:
-        varianza = np.var(datos, ddof=1)
+        varianza = resumen.varianza(ddof=1)
         tipo = 'muestral'
         formula = 's² = Σ(xi - x̄)² / (n-1)'
     
-    media = np.mean(datos)
+    media = resumen.media
     
     return {
         'varianza': round(varianza, 4),
         'tipo': tipo,
         'media': round(media, 2),
-        'n': len(datos),
+        'n': resumen.n,
         'formula': formula,
         'interpretacion': f'La varianza {tipo} es {round(varianza, 4)}, indicando la dispersión promedio al cuadrado'
     }
@@ -50,18 +55,19 @@ def calcular_desviacion_estandar(datos, poblacion=False):
     """
     Calcula la desviación estándar (muestral o poblacional)
     """
+    resumen = obtener_resumen(datos)
     if poblacion:
-        desviacion = np.std(datos, ddof=0)
+        desviacion = resumen.desviacion_estandar(ddof=0)
         tipo = 'poblacional'
         simbolo = 'σ'
         formula = 'σ = √[Σ(xi - μ)² / N]'
     else:
-        desviacion = np.std(datos, ddof=1)
+        desviacion = resumen.desviacion_estandar(ddof=1)
         tipo = 'muestral'
         simbolo = 's'
         formula = 's = √[Σ(xi - x̄)² / (n-1)]'
     
-    media = np.mean(datos)
+    media = resumen.media
     varianza = desviacion ** 2
     
     return {
@@ -79,8 +85,9 @@ def calcular_coeficiente_variacion(datos):
     Calcula el coeficiente de variación (CV)
     CV = (desviación estándar / media) × 100
     """
-    media = np.mean(datos)
-    desviacion = np.std(datos, ddof=1)
+    resumen = obtener_resumen(datos)
+    media = resumen.media
+    desviacion = resumen.desviacion_estandar(ddof=1)
     
     if media == 0:
         return {
@@ -112,8 +119,9 @@ def calcular_desviacion_media(datos):
     Calcula la desviación media o desviación promedio
     DM = Σ|xi - x̄| / n
     """
-    media = np.mean(datos)
-    desviacion_media = np.mean(np.abs(datos - media))
+    resumen = obtener_resumen(datos)
+    media = resumen.media
+    desviacion_media = resumen.desviacion_media()
     
     return {
         'desviacion_media': round(desviacion_media, 4),
@@ -127,8 +135,7 @@ def calcular_rango_intercuartilico(datos):
     Calcula el rango intercuartílico (IQR)
     IQR = Q3 - Q1
     """
-    q1 = np.percentile(datos, 25)
-    q3 = np.percentile(datos, 75)
+    q1, _, q3 = obtener_resumen(datos).cuartiles()
     iqr = q3 - q1
     
     return {
@@ -142,14 +149,16 @@ def calcular_rango_intercuartilico(datos):
 def analisis_completo_dispersion(datos, poblacion=False):
     """
     Realiza un análisis completo de todas las medidas de dispersión
+    (momentos y cuartiles se calculan una sola vez)
     """
+    resumen = obtener_resumen(datos)
     return {
-        'rango': calcular_rango(datos),
-        'varianza': calcular_varianza(datos, poblacion),
-        'desviacion_estandar': calcular_desviacion_estandar(datos, poblacion),
-        'coeficiente_variacion': calcular_coeficiente_variacion(datos),
-        'desviacion_media': calcular_desviacion_media(datos),
-        'rango_intercuartilico': calcular_rango_intercuartilico(datos)
+        'rango': calcular_rango(resumen),
+        'varianza': calcular_varianza(resumen, poblacion),
+        'desviacion_estandar': calcular_desviacion_estandar(resumen, poblacion),
+        'coeficiente_variacion': calcular_coeficiente_variacion(resumen),
+        'desviacion_media': calcular_desviacion_media(resumen),
+        'rango_intercuartilico': calcular_rango_intercuartilico(resumen)
     }
 
 def generar_tabla_dispersion(datos, poblacion=False):
@@ -193,8 +202,10 @@ def graficar_dispersion(datos, titulo="Análisis de Dispersión"):
     """
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
-    media = np.mean(datos)
-    desv_std = np.std(datos, ddof=1)
+    resumen = obtener_resumen(datos)
+    datos = resumen.valores
+    media = resumen.media
+    desv_std = resumen.desviacion_estandar(ddof=1)
     
     # 1. Histograma con media y desviación estándar
     ax1 = axes[0, 0]
@@ -236,7 +247,7 @@ def graficar_dispersion(datos, titulo="Análisis de Dispersión"):
     ax4.axis('tight')
     ax4.axis('off')
     
-    analisis = analisis_completo_dispersion(datos)
+    analisis = analisis_completo_dispersion(resumen)
     
     tabla_datos = [
         ['Medida', 'Valor'],
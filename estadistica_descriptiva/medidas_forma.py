@@ -5,6 +5,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats
+from estadistica_descriptiva.densidad_kernel import densidad_kernel
+from estadistica_descriptiva.resumen_descriptivo import obtener_resumen
 
 def calcular_asimetria(datos):
     """
@@ -13,8 +15,11 @@ def calcular_asimetria(datos):
     Asimetría > 0: Distribución sesgada a la derecha (cola derecha más larga)
     Asimetría = 0: Distribución simétrica
     Asimetría < 0: Distribución sesgada a la izquierda (cola izquierda más larga)
+
+    datos: arreglo de datos o ResumenDescriptivo ya calculado
     """
-    asimetria = stats.skew(datos)
+    resumen = obtener_resumen(datos)
+    asimetria = resumen.asimetria()
     
     # Interpretación
     if asimetria > 0.5:
@@ -37,8 +42,8 @@ def calcular_asimetria(datos):
     else:
         clasificacion = "Asimetría alta"
     
-    media = np.mean(datos)
-    mediana = np.median(datos)
+    media = resumen.media
+    mediana = resumen.mediana()
     
     return {
         'asimetria': round(asimetria, 4),
@@ -60,7 +65,7 @@ def calcular_curtosis(datos):
     Curtosis < 0: Distribución platicúrtica (más plana que la normal)
     """
     # Curtosis con corrección de Fisher (excess kurtosis)
-    curtosis = stats.kurtosis(datos, fisher=True)
+    curtosis = obtener_resumen(datos).curtosis()
     
     # Interpretación
     if curtosis > 0:
@@ -94,9 +99,11 @@ def calcular_curtosis(datos):
 def analisis_completo_forma(datos):
     """
     Realiza un análisis completo de las medidas de forma
+    (los momentos se calculan una sola vez)
     """
-    asimetria = calcular_asimetria(datos)
-    curtosis = calcular_curtosis(datos)
+    resumen = obtener_resumen(datos)
+    asimetria = calcular_asimetria(resumen)
+    curtosis = calcular_curtosis(resumen)
     
     # Análisis conjunto
     if abs(asimetria['asimetria']) < 0.5 and abs(curtosis['curtosis']) < 0.5:
@@ -153,21 +160,21 @@ def graficar_forma(datos, titulo="Análisis de Forma de la Distribución"):
     fig = plt.figure(figsize=(16, 10))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
     
-    analisis = analisis_completo_forma(datos)
-    media = np.mean(datos)
-    mediana = np.median(datos)
-    desv = np.std(datos)
+    resumen = obtener_resumen(datos)
+    datos = resumen.valores
+    analisis = analisis_completo_forma(resumen)
+    media = resumen.media
+    mediana = resumen.mediana()
+    desv = resumen.desviacion_estandar(ddof=0)
     
     # 1. Histograma con curva de densidad
     ax1 = fig.add_subplot(gs[0, :2])
     n, bins, patches = ax1.hist(datos, bins=30, density=True, alpha=0.7, 
                                  color='steelblue', edgecolor='black')
     
-    # Agregar curva de densidad estimada
-    from scipy.stats import gaussian_kde
-    density = gaussian_kde(datos)
-    xs = np.linspace(datos.min(), datos.max(), 200)
-    ax1.plot(xs, density(xs), 'r-', linewidth=2, label='Densidad estimada')
+    # Agregar curva de densidad estimada (kernel por FFT, O(n + g·log g))
+    xs, densidad = densidad_kernel(resumen, puntos=200, limites=(datos.min(), datos.max()))
+    ax1.plot(xs, densidad, 'r-', linewidth=2, label='Densidad estimada')
     
     # Marcar media y mediana
     ax1.axvline(media, color='green', linestyle='--', linewidth=2, label=f'Media = {media:.2f}')
@@ -193,6 +200,10 @@ def graficar_forma(datos, titulo="Análisis de Forma de la Distribución"):
     p = norm.pdf(x, media, desv)
     ax2.plot(x, p, 'r-', linewidth=2, label='Normal teórica')
     
+    # Densidad estimada de los datos sobre el mismo rango
+    _, densidad = densidad_kernel(resumen, puntos=100, limites=(xmin, xmax))
+    ax2.plot(x, densidad, 'k--', linewidth=1.5, label='Densidad estimada')
+    
     ax2.set_title('Comparación con\nDistribución Normal')
     ax2.legend(fontsize=9)
     ax2.grid(True, alpha=0.3)
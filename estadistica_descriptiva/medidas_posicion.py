@@ -5,14 +5,33 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy import stats
+from estadistica_descriptiva.distribucion_empirica import DistribucionEmpirica
+from estadistica_descriptiva.estadisticos_orden import cuantiles_seleccion, posiciones_cuantiles
+from estadistica_descriptiva.resumen_descriptivo import ResumenDescriptivo, obtener_resumen
+
+def calcular_cuantiles(datos, probabilidades, metodo='linear'):
+    """
+    Calcula varios cuantiles a la vez (probabilidades entre 0 y 1)
+    
+    Con datos crudos solo se ubican los rangos necesarios por selección,
+    sin ordenar todos los datos; con un ResumenDescriptivo se usa su cálculo.
+    metodo: criterio de interpolación de np.quantile (ver METODOS_INTERPOLACION);
+            los datos agrupados y los bosquejos de cuantiles solo admiten 'linear'
+    Retorna un arreglo con un valor por probabilidad.
+    """
+    probabilidades = np.asarray(probabilidades, dtype=float)
+    if isinstance(datos, ResumenDescriptivo):
+        return datos.cuantiles(probabilidades, metodo)
+    return cuantiles_seleccion(np.asarray(datos), probabilidades, metodo)
 
 def calcular_cuartiles(datos):
     """
     Calcula los cuartiles Q1, Q2 (mediana), Q3
+
+    datos: arreglo de datos o ResumenDescriptivo ya calculado
     """
-    q1 = np.percentile(datos, 25)
-    q2 = np.percentile(datos, 50)  # Mediana
-    q3 = np.percentile(datos, 75)
+    q1, q2, q3 = obtener_resumen(datos).cuartiles()
     
     # Rango intercuartílico
     iqr = q3 - q1
@@ -34,75 +53,140 @@ def calcular_deciles(datos):
     """
     Calcula los 9 deciles (D1, D2, ..., D9)
     """
+    valores = calcular_cuantiles(datos, np.arange(1, 10) / 10)
     deciles = {}
-    for i in range(1, 10):
+    for i, valor in enumerate(valores, start=1):
         percentil = i * 10
-        valor = np.percentile(datos, percentil)
         deciles[f'D{i}'] = round(valor, 2)
         deciles[f'D{i}_interpretacion'] = f'{percentil}% de los datos son menores o iguales a {round(valor, 2)}'
     
     return deciles
 
-def calcular_percentiles(datos, percentiles_deseados=None):
+def calcular_percentiles(datos, percentiles_deseados=None, confianza=None):
     """
     Calcula percentiles específicos o los más comunes
     
+    datos: arreglo de datos, ResumenDescriptivo o DistribucionEmpirica (con
+           esta última cada percentil es una búsqueda binaria); un resumen
+           ya calculado se usa tal cual, también para los intervalos
     percentiles_deseados: lista de percentiles a calcular (ej: [10, 25, 50, 75, 90])
+    confianza: si se indica (ej. 0.95), agrega el intervalo de confianza de
+               cada percentil como 'P90_IC' = (límite inferior, límite superior)
     """
     if percentiles_deseados is None:
         # Percentiles comunes
         percentiles_deseados = [5, 10, 25, 50, 75, 90, 95, 99]
     
+    intervalos = None
+    if confianza:
+        # Un solo resumen (n y estadísticos de orden) para los percentiles y sus intervalos
+        datos = obtener_resumen(datos)
+        intervalos = intervalos_percentiles(datos, percentiles_deseados, confianza)
+    valores = calcular_cuantiles(datos, np.asarray(percentiles_deseados, dtype=float) / 100)
     resultados = {}
-    for p in percentiles_deseados:
-        valor = np.percentile(datos, p)
+    for i, (p, valor) in enumerate(zip(percentiles_deseados, valores)):
         resultados[f'P{p}'] = round(valor, 2)
         resultados[f'P{p}_interpretacion'] = f'{p}% de los datos son menores o iguales a {round(valor, 2)}'
+        if intervalos is not None:
+            resultados[f'P{p}_IC'] = (intervalos['Límite Inferior'].iloc[i], intervalos['Límite Superior'].iloc[i])
     
     return resultados
 
+def intervalos_percentiles(datos, percentiles_deseados=None, confianza=0.95):
+    """
+    Intervalos de confianza para percentiles sin suponer ninguna distribución
+    
+    La cantidad de datos menores que el percentil poblacional sigue una
+    Binomial(n, p), así que el intervalo va del estadístico de orden x(l)
+    al x(u), con l y u tomados de los cuantiles α/2 y 1-α/2 de esa binomial.
+    Todos los percentiles se resuelven con una sola selección de rangos.
+    
+    Retorna una tabla con el valor de cada percentil, sus límites (NaN si
+    no hay suficientes datos en esa cola) y la confianza real, que es
+    siempre mayor o igual a la pedida.
+    """
+    if percentiles_deseados is None:
+        percentiles_deseados = [5, 10, 25, 50, 75, 90, 95, 99]
+    resumen = obtener_resumen(datos)
+    n = int(resumen.n)
+    p = np.asarray(percentiles_deseados, dtype=float) / 100
+    alfa = 1 - confianza
+    
+    # Rangos (base 1) de los límites: P(l <= B < u) >= confianza
+    l = stats.binom.ppf(alfa / 2, n, p).astype(np.int64)
+    u = stats.binom.ppf(1 - alfa / 2, n, p).astype(np.int64) + 1
+    cobertura = stats.binom.cdf(np.minimum(u, n + 1) - 1, n, p) - stats.binom.cdf(l - 1, n, p)
+    
+    # Valor puntual (interpolación lineal) y límites con una sola selección
+    inferior, superior, fraccion = posiciones_cuantiles(n, p)
+    rangos = np.concatenate([inferior, superior, np.clip(l - 1, 0, n - 1), np.clip(u - 1, 0, n - 1)])
+    valores = np.asarray(resumen.valores_en_rangos(rangos), dtype=float).reshape(4, len(p))
+    puntual = valores[0] + fraccion * (valores[1] - valores[0])
+    limite_inferior = np.where(l >= 1, valores[2], np.nan)
+    limite_superior = np.where(u <= n, valores[3], np.nan)
+    
+    return pd.DataFrame({
+        'Percentil': [f'P{percentil}' for percentil in percentiles_deseados],
+        'Valor': np.round(puntual, 2),
+        'Límite Inferior': np.round(limite_inferior, 2),
+        'Límite Superior': np.round(limite_superior, 2),
+        'Confianza Real': np.round(cobertura, 4)
+    })
+
 def calcular_valores_extremos(datos):
     """
     Identifica valores atípicos usando el método IQR
     """
-    q1 = np.percentile(datos, 25)
-    q3 = np.percentile(datos, 75)
-    iqr = q3 - q1
+    resumen = obtener_resumen(datos)
     
     # Límites para outliers
-    limite_inferior = q1 - 1.5 * iqr
-    limite_superior = q3 + 1.5 * iqr
+    limite_inferior, limite_superior = resumen.cercas(1.5)
     
-    # Identificar outliers
-    outliers = [x for x in datos if x < limite_inferior or x > limite_superior]
+    # Identificar outliers (con un bosquejo de cuantiles solo se estima la cantidad)
+    atipicos = resumen.valores_atipicos(1.5)
+    outliers = atipicos.tolist() if atipicos is not None else None
+    cantidad = resumen.contar_atipicos(1.5)
+    porcentaje = round(cantidad / resumen.n * 100, 2)
+    
+    # Filas de los outliers (etiquetas del índice si los datos son una Serie)
+    posiciones = resumen.posiciones_atipicos(1.5)
+    indices = None
+    if posiciones is not None:
+        indices = (datos.index[posiciones] if isinstance(datos, pd.Series) else posiciones).tolist()
     
     return {
         'limite_inferior': round(limite_inferior, 2),
         'limite_superior': round(limite_superior, 2),
         'outliers': outliers,
-        'cantidad_outliers': len(outliers),
-        'porcentaje_outliers': round(len(outliers) / len(datos) * 100, 2),
-        'interpretacion': f'Se detectaron {len(outliers)} valores atípicos ({round(len(outliers) / len(datos) * 100, 2)}%)'
+        'indices_outliers': indices,
+        'cantidad_outliers': cantidad,
+        'porcentaje_outliers': porcentaje,
+        'interpretacion': f'Se detectaron {cantidad} valores atípicos ({porcentaje}%)'
     }
 
 def analisis_completo_posicion(datos):
     """
     Realiza un análisis completo de medidas de posición
+    (todas las medidas salen del mismo resumen; cuartiles, deciles y
+    percentiles se ubican por selección de rangos, sin ordenar los datos)
     """
+    resumen = obtener_resumen(datos)
     return {
-        'cuartiles': calcular_cuartiles(datos),
-        'deciles': calcular_deciles(datos),
-        'percentiles': calcular_percentiles(datos),
-        'valores_extremos': calcular_valores_extremos(datos),
-        'minimo': round(np.min(datos), 2),
-        'maximo': round(np.max(datos), 2),
-        'rango': round(np.max(datos) - np.min(datos), 2)
+        'cuartiles': calcular_cuartiles(resumen),
+        'deciles': calcular_deciles(resumen),
+        'percentiles': calcular_percentiles(resumen),
+        'valores_extremos': calcular_valores_extremos(resumen),
+        'minimo': round(resumen.minimo, 2),
+        'maximo': round(resumen.maximo, 2),
+        'rango': round(resumen.maximo - resumen.minimo, 2)
     }
 
 def crear_boxplot(datos, titulo="Diagrama de Caja y Bigotes"):
     """
     Crea un boxplot para visualizar las medidas de posición
     """
+    resumen = obtener_resumen(datos)
+    datos = resumen.valores
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Boxplot vertical
@@ -118,7 +202,7 @@ def crear_boxplot(datos, titulo="Diagrama de Caja y Bigotes"):
     bp['means'][0].set_linewidth(2)
     
     # Agregar cuartiles como texto
-    cuartiles = calcular_cuartiles(datos)
+    cuartiles = calcular_cuartiles(resumen)
     ax1.text(1.15, cuartiles['Q1'], f"Q1 = {cuartiles['Q1']}", 
              verticalalignment='center', fontsize=10, color='blue')
     ax1.text(1.15, cuartiles['Q2_Mediana'], f"Q2 = {cuartiles['Q2_Mediana']}", 
@@ -148,9 +232,13 @@ def crear_boxplot(datos, titulo="Diagrama de Caja y Bigotes"):
 def crear_grafico_percentiles(datos, titulo="Percentiles"):
     """
     Crea un gráfico visual de percentiles
+    
+    Los datos crudos se convierten una vez en DistribucionEmpirica y todos
+    los percentiles salen de búsquedas binarias sobre ella.
     """
-    percentiles = list(range(0, 101, 5))
-    valores = [np.percentile(datos, p) for p in percentiles]
+    distribucion = datos if isinstance(datos, ResumenDescriptivo) else DistribucionEmpirica(datos)
+    percentiles = np.arange(0, 101, 5)
+    valores = calcular_cuantiles(distribucion, percentiles / 100)
     
     fig, ax = plt.subplots(figsize=(12, 6))
     
@@ -158,7 +246,7 @@ def crear_grafico_percentiles(datos, titulo="Percentiles"):
             markersize=5, color='steelblue')
     
     # Marcar cuartiles
-    cuartiles = calcular_cuartiles(datos)
+    cuartiles = calcular_cuartiles(distribucion)
     ax.axhline(y=cuartiles['Q1'], color='orange', linestyle='--', 
                alpha=0.7, label=f'Q1 = {cuartiles["Q1"]}')
     ax.axhline(y=cuartiles['Q2_Mediana'], color='red', linestyle='--', 
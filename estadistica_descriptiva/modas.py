@@ -0,0 +1,79 @@
+"""
+Modas - Todas las modas con su frecuencia, para datos discretos, continuos y agrupados
+"""
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.resumen_descriptivo import ResumenDescriptivo
+from estadistica_descriptiva.datos_agrupados import ResumenAgrupado, moda_agrupada
+from estadistica_descriptiva.intervalos_clase import agrupar_en_clases
+
+
+def _tipo_moda(cantidad_modas, frecuencia, n):
+    if frecuencia <= 1 < n:
+        return 'amodal'
+    return {1: 'unimodal', 2: 'bimodal'}.get(cantidad_modas, 'multimodal')
+
+
+def contar_valores(datos):
+    """
+    (valores, conteos) con una sola pasada de hash (pd.factorize + np.bincount),
+    sin ordenar los datos; los valores faltantes se ignoran
+    """
+    codigos, valores = pd.factorize(pd.Series(np.asarray(datos)), sort=False)
+    codigos = codigos[codigos >= 0]
+    return np.asarray(valores), np.bincount(codigos, minlength=len(valores))
+
+
+def calcular_modas(datos):
+    """
+    Todas las modas de los datos con su frecuencia
+
+    datos: arreglo (numérico o de texto) o ResumenDescriptivo; las tablas de
+           frecuencia y los acumuladores usan sus conteos y un ResumenAgrupado
+           usa la fórmula de datos agrupados Mo = Li + d1 / (d1 + d2) · c
+
+    Retorna un dict con 'modas' (ordenadas), 'frecuencia' (veces que aparece
+    cada moda), 'tipo' ('unimodal', 'bimodal', 'multimodal' o 'amodal' si
+    ningún valor se repite) y 'n'.
+    """
+    if isinstance(datos, ResumenAgrupado):
+        frecuencia = datos.frecuencias.max()
+        modas = datos.modas()
+        return {'modas': modas, 'frecuencia': int(frecuencia),
+                'tipo': _tipo_moda(len(modas), frecuencia, datos.n), 'n': int(datos.n)}
+
+    if isinstance(datos, ResumenDescriptivo):
+        tabla = datos.tabla_frecuencias()
+        if tabla is not None:
+            valores, conteos = tabla
+        elif hasattr(datos, 'valores'):
+            valores, conteos = contar_valores(datos.valores)
+        else:
+            raise ValueError('No se puede calcular la moda sin acumular frecuencias (frecuencias=True)')
+    else:
+        valores, conteos = contar_valores(datos)
+
+    if len(conteos) == 0:
+        raise ValueError('No hay datos para calcular la moda')
+    frecuencia = conteos.max()
+    # Solo se ordenan las modas, no todos los datos
+    modas = np.sort(valores[conteos == frecuencia])
+    return {'modas': modas, 'frecuencia': int(frecuencia),
+            'tipo': _tipo_moda(len(modas), frecuencia, conteos.sum()), 'n': int(conteos.sum())}
+
+
+def moda_por_clases(datos, clases='sturges', amplitud=None):
+    """
+    Moda de datos continuos: se agrupan en clases (ver calcular_bordes) y se
+    aplica la fórmula de datos agrupados a la(s) clase(s) modal(es)
+    """
+    bordes, frecuencias = agrupar_en_clases(datos, clases, amplitud)
+    modales = np.flatnonzero(frecuencias == frecuencias.max())
+    modas = moda_agrupada(bordes[:-1], bordes[1:], frecuencias)
+    return {
+        'modas': modas,
+        'frecuencia': int(frecuencias.max()),
+        'tipo': _tipo_moda(len(modas), frecuencias.max(), frecuencias.sum()),
+        'n': int(frecuencias.sum()),
+        'clases_modales': [(bordes[i], bordes[i + 1]) for i in modales]
+    }
@@ -0,0 +1,300 @@
+"""
+Resumen Descriptivo - Núcleo de una sola pasada para momentos y estadísticos de orden
+"""
+import numpy as np
+from estadistica_descriptiva.estadisticos_orden import (
+    MAXIMO_RANGOS_SELECCION, cuantiles_ordenados, cuantiles_seleccion, posiciones_cuantiles, seleccionar_rangos
+)
+
+
+def valores_en_rangos_frecuencias(valores, acumulados, rangos):
+    """
+    Valor que ocupa cada posición r (base 0) de los datos ordenados, a partir
+    de una tabla de frecuencias (valores ordenados y sus conteos acumulados),
+    sin expandirla
+    """
+    return valores[np.searchsorted(acumulados, np.asarray(rangos), side='right')]
+
+
+def cuantiles_desde_frecuencias(valores, acumulados, probabilidades, metodo='linear'):
+    """
+    Cuantiles con los mismos criterios de interpolación (ver
+    METODOS_INTERPOLACION), pero a partir de una tabla de frecuencias
+    (valores ordenados y sus conteos acumulados), sin expandirla
+    """
+    inferior, superior, fraccion = posiciones_cuantiles(acumulados[-1], probabilidades, metodo)
+    bajo = valores_en_rangos_frecuencias(valores, acumulados, inferior).astype(float)
+    alto = valores_en_rangos_frecuencias(valores, acumulados, superior).astype(float)
+    return bajo + fraccion * (alto - bajo)
+
+
+def momentos_centrales(valores, pesos=None):
+    """
+    Media y momentos centrales m2, m3, m4 (divididos entre n) por fila
+    (último eje), con las desviaciones respecto a la media de cada fila
+
+    pesos: frecuencia de cada valor (ej. los conteos de una tabla de
+           frecuencias); n es su suma
+    """
+    valores = np.asarray(valores, dtype=float)
+    if pesos is None:
+        cantidad = valores.shape[-1]
+        media = valores.mean(axis=-1)
+    else:
+        cantidad = pesos.sum(axis=-1)
+        media = (pesos * valores).sum(axis=-1) / cantidad
+    desviaciones = valores - media[..., None]
+    cuadrados = desviaciones * desviaciones
+    ponderados = cuadrados if pesos is None else pesos * cuadrados
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (media, ponderados.sum(axis=-1) / cantidad, (ponderados * desviaciones).sum(axis=-1) / cantidad,
+                (ponderados * cuadrados).sum(axis=-1) / cantidad)
+
+
+def coeficientes_forma(m2, m3, m4):
+    """
+    Asimetría y exceso de curtosis de Fisher (mismo criterio que
+    scipy.stats.skew / kurtosis) a partir de m2, m3, m4 divididos entre n;
+    acepta arreglos y da NaN donde m2 = 0
+    """
+    m2 = np.asarray(m2, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        asimetria = np.where(m2 > 0, m3 / m2 ** 1.5, np.nan)
+        curtosis = np.where(m2 > 0, m4 / m2 ** 2 - 3, np.nan)
+    return asimetria, curtosis
+
+
+class ResumenDescriptivo:
+    """
+    Recorre los datos una sola vez y guarda todo lo que necesitan las
+    medidas descriptivas: momentos centrales, mínimo y máximo.
+
+    Mediana, cuartiles y pocos cuantiles se obtienen por selección (sin
+    ordenar); los datos se ordenan solo si se piden muchos cuantiles y
+    desde entonces se reutilizan ordenados.
+
+    Las funciones de medidas_posicion, medidas_dispersión y medidas_forma
+    aceptan este objeto en lugar de los datos.
+    """
+
+    def __init__(self, datos):
+        self.valores = np.asarray(datos)
+        self.n = len(self.valores)
+        self.minimo = self.valores.min()
+        self.maximo = self.valores.max()
+        self._ordenados = None
+
+        # Momentos centrales: Σ(xi - x̄)², Σ(xi - x̄)³, Σ(xi - x̄)⁴
+        media, m2, m3, m4 = momentos_centrales(self.valores)
+        self.media = media[()]
+        self.m2, self.m3, self.m4 = m2 * self.n, m3 * self.n, m4 * self.n
+
+        self._cuartiles = None
+
+    @property
+    def ordenados(self):
+        """Datos ordenados (se ordenan la primera vez que se necesitan)"""
+        if self._ordenados is None:
+            self._ordenados = np.sort(self.valores)
+        return self._ordenados
+
+    def cuantiles(self, probabilidades, metodo='linear'):
+        """Cuantiles (probabilidades entre 0 y 1); metodo: ver METODOS_INTERPOLACION"""
+        if self._ordenados is None and 2 * np.size(probabilidades) <= MAXIMO_RANGOS_SELECCION:
+            return cuantiles_seleccion(self.valores, probabilidades, metodo)
+        return cuantiles_ordenados(self.ordenados, probabilidades, metodo)
+
+    def valores_en_rangos(self, rangos):
+        """Estadísticos de orden: valores en las posiciones (base 0) de los datos ordenados"""
+        if self._ordenados is None and len(np.unique(rangos)) <= MAXIMO_RANGOS_SELECCION:
+            return seleccionar_rangos(self.valores, rangos)
+        return self.ordenados[np.asarray(rangos, dtype=np.int64)]
+
+    def cuartiles(self):
+        """Q1, Q2 y Q3, calculados una sola vez"""
+        if self._cuartiles is None:
+            self._cuartiles = tuple(self.cuantiles([0.25, 0.5, 0.75]))
+        return self._cuartiles
+
+    def mediana(self):
+        return self.cuartiles()[1]
+
+    def varianza(self, ddof=1):
+        return self.m2 / (self.n - ddof)
+
+    def desviacion_estandar(self, ddof=1):
+        return np.sqrt(self.varianza(ddof))
+
+    def desviacion_media(self):
+        return np.abs(self.valores - self.media).sum() / self.n
+
+    def asimetria(self):
+        """Coeficiente de asimetría (ver coeficientes_forma)"""
+        return coeficientes_forma(self.m2 / self.n, self.m3 / self.n, self.m4 / self.n)[0][()]
+
+    def curtosis(self):
+        """Exceso de curtosis de Fisher (ver coeficientes_forma)"""
+        return coeficientes_forma(self.m2 / self.n, self.m3 / self.n, self.m4 / self.n)[1][()]
+
+    def cercas(self, factor=1.5):
+        """Límites inferior y superior para valores atípicos (método IQR)"""
+        q1, _, q3 = self.cuartiles()
+        iqr = q3 - q1
+        return q1 - factor * iqr, q3 + factor * iqr
+
+    def posiciones_atipicos(self, factor=1.5):
+        """Posiciones (base 0) de los valores fuera de las cercas IQR"""
+        limite_inferior, limite_superior = self.cercas(factor)
+        return np.flatnonzero((self.valores < limite_inferior) | (self.valores > limite_superior))
+
+    def valores_atipicos(self, factor=1.5):
+        """Valores fuera de las cercas IQR, en el orden original de los datos"""
+        return self.valores[self.posiciones_atipicos(factor)]
+
+    def contar_atipicos(self, factor=1.5):
+        """Cantidad de valores fuera de las cercas IQR"""
+        return len(self.valores_atipicos(factor))
+
+    def tabla_frecuencias(self):
+        """(valores, frecuencias) ordenados si el resumen guarda su tabla; si no, None"""
+        return None
+
+
+def valores_y_pesos(datos):
+    """
+    (valores, pesos) sin faltantes, en float: las tablas de frecuencia se
+    devuelven sin expandir; con datos crudos pesos es None
+    """
+    if isinstance(datos, ResumenDescriptivo):
+        tabla = datos.tabla_frecuencias()
+        if tabla is not None:
+            return np.asarray(tabla[0], dtype=float), np.asarray(tabla[1], dtype=float)
+        if not hasattr(datos, 'valores'):
+            raise ValueError('El resumen no guarda frecuencias (frecuencias=True) ni los datos originales')
+        datos = datos.valores
+    valores = np.asarray(datos, dtype=float)
+    return valores[~np.isnan(valores)], None
+
+
+def es_entero_compacto(datos):
+    """
+    True si todos los datos son enteros (aunque vengan como float, ej. 'Edad'
+    tras dropna) y su rango no es mayor que la cantidad de datos
+    """
+    valores = np.asarray(datos)
+    if len(valores) == 0 or valores.dtype.kind not in 'iuf':
+        return False
+    if valores.dtype.kind == 'f':
+        if not np.all(np.isfinite(valores)) or not np.array_equal(valores, np.rint(valores)):
+            return False
+        if np.abs(valores).max() >= 2 ** 62:
+            return False
+    # En int64, como contar_enteros: restar en int8/int16 se desbordaría
+    enteros = valores.astype(np.int64)
+    rango = int(enteros.max()) - int(enteros.min()) + 1
+    return rango <= max(len(valores), 1024)
+
+
+def contar_enteros(datos):
+    """
+    Tabla de frecuencias de datos enteros con un solo np.bincount sobre el rango
+    Retorna (valores, conteos) solo de los valores presentes, en orden ascendente
+    """
+    valores = np.asarray(datos)
+    # Se pasa a int64 antes de restar: en int8/int16 la resta daría la vuelta
+    enteros = valores.astype(np.int64)
+    base = int(enteros.min())
+    conteos = np.bincount(enteros - base)
+    presentes = np.flatnonzero(conteos)
+    return (presentes + base).astype(valores.dtype), conteos[presentes]
+
+
+class ResumenFrecuencias(ResumenDescriptivo):
+    """
+    ResumenDescriptivo a partir de una tabla de frecuencias (valor, frecuencia),
+    sin expandirla: momentos, cuantiles y moda salen en O(cantidad de valores)
+    aunque la tabla represente millones de observaciones
+    """
+
+    def __init__(self, valores, frecuencias):
+        valores = np.asarray(valores)
+        frecuencias = np.asarray(frecuencias)
+        orden = np.argsort(valores, kind='stable')
+        presentes = frecuencias[orden] > 0
+        self.valores_frecuencia = valores[orden][presentes]
+        self.conteos = frecuencias[orden][presentes]
+        # Frecuencias acumuladas: ubican cualquier rango con búsqueda binaria
+        self.acumulados = np.cumsum(self.conteos)
+        self.n = self.conteos.sum()
+        self.minimo = self.valores_frecuencia[0]
+        self.maximo = self.valores_frecuencia[-1]
+
+        # Momentos ponderados por frecuencia
+        media, m2, m3, m4 = momentos_centrales(self.valores_frecuencia, self.conteos)
+        self.media = media[()]
+        self.m2, self.m3, self.m4 = m2 * self.n, m3 * self.n, m4 * self.n
+
+        self._cuartiles = None
+
+    def cuantiles(self, probabilidades, metodo='linear'):
+        """Cuantiles con cualquier criterio de np.quantile (ver METODOS_INTERPOLACION)"""
+        return cuantiles_desde_frecuencias(self.valores_frecuencia, self.acumulados, probabilidades, metodo)
+
+    def valores_en_rangos(self, rangos):
+        """Valor que ocupa cada posición (base 0) sin expandir la tabla"""
+        return valores_en_rangos_frecuencias(self.valores_frecuencia, self.acumulados, rangos)
+
+    def desviacion_media(self):
+        return (self.conteos * np.abs(self.valores_frecuencia - self.media)).sum() / self.n
+
+    def modas(self):
+        """Todos los valores con la frecuencia máxima"""
+        return self.valores_frecuencia[self.conteos == self.conteos.max()]
+
+    def tabla_frecuencias(self):
+        return self.valores_frecuencia, self.conteos
+
+    def _mascara_atipicos(self, factor):
+        limite_inferior, limite_superior = self.cercas(factor)
+        return (self.valores_frecuencia < limite_inferior) | (self.valores_frecuencia > limite_superior)
+
+    def posiciones_atipicos(self, factor=1.5):
+        """Una tabla de frecuencias no conserva las filas originales"""
+        return None
+
+    def valores_atipicos(self, factor=1.5):
+        mascara = self._mascara_atipicos(factor)
+        return np.repeat(self.valores_frecuencia[mascara], self.conteos[mascara])
+
+    def contar_atipicos(self, factor=1.5):
+        return int(self.conteos[self._mascara_atipicos(factor)].sum())
+
+
+class ResumenEnteros(ResumenFrecuencias):
+    """
+    ResumenDescriptivo especializado para columnas enteras de rango pequeño
+    (ej. 'Edad', 'Faltas'): en vez de ordenar, cuenta con np.bincount y obtiene
+    momentos, cuantiles, moda y frecuencias en O(n + rango)
+    """
+
+    def __init__(self, datos):
+        self.valores = np.asarray(datos)
+        super().__init__(*contar_enteros(self.valores))
+
+    # Se conservan los datos, así que los atípicos se ubican por fila
+    posiciones_atipicos = ResumenDescriptivo.posiciones_atipicos
+    valores_atipicos = ResumenDescriptivo.valores_atipicos
+    contar_atipicos = ResumenDescriptivo.contar_atipicos
+
+
+def obtener_resumen(datos):
+    """
+    Devuelve el resumen de los datos, o el mismo objeto si ya es un resumen
+    
+    Para columnas enteras de rango pequeño se usa automáticamente ResumenEnteros.
+    """
+    if isinstance(datos, ResumenDescriptivo):
+        return datos
+    if es_entero_compacto(datos):
+        return ResumenEnteros(datos)
+    return ResumenDescriptivo(datos)
@@ -0,0 +1,111 @@
+"""
+Valores Atípicos - Detección vectorizada sobre todas las columnas numéricas
+"""
+import numpy as np
+import pandas as pd
+
+METODOS_ATIPICOS = {
+    'iqr': 'Fuera de [Q1 - k·IQR, Q3 + k·IQR] (k = 1.5 por defecto)',
+    'zscore': '|z| = |xi - x̄| / s mayor que el umbral (3 por defecto)',
+    'mad': '|0.6745 (xi - Mediana) / MAD| mayor que el umbral (3.5 por defecto)',
+    'percentil': 'Fuera de los percentiles (inferior, superior) (1 y 99 por defecto)'
+}
+
+UMBRALES_POR_DEFECTO = {
+    'iqr': 1.5,
+    'zscore': 3.0,
+    'mad': 3.5,
+    'percentil': (1, 99)
+}
+
+
+def _como_matriz(datos, columnas):
+    """Convierte los datos en (DataFrame numérico, es_unidimensional)"""
+    if isinstance(datos, pd.DataFrame):
+        if columnas is None:
+            columnas = datos.select_dtypes(include='number').columns.tolist()
+        return datos[columnas], False
+    serie = datos if isinstance(datos, pd.Series) else pd.Series(np.asarray(datos))
+    return serie.to_frame(), True
+
+
+def detectar_atipicos(datos, metodo='iqr', umbral=None, columnas=None):
+    """
+    Marca los valores atípicos de todas las columnas numéricas a la vez
+
+    datos: DataFrame (se analizan todas las columnas numéricas o 'columnas'),
+           Series o arreglo
+    metodo: 'iqr', 'zscore', 'mad' o 'percentil' (ver METODOS_ATIPICOS)
+    umbral: factor k, umbral de z o (percentil inferior, percentil superior)
+
+    Retorna una máscara booleana con la misma forma e índice que los datos
+    (DataFrame o Series); los valores faltantes nunca son atípicos.
+    """
+    if metodo not in METODOS_ATIPICOS:
+        raise ValueError(f"Método '{metodo}' no válido. Use: {', '.join(METODOS_ATIPICOS)}")
+    if umbral is None:
+        umbral = UMBRALES_POR_DEFECTO[metodo]
+
+    tabla, unidimensional = _como_matriz(datos, columnas)
+    valores = tabla.to_numpy(dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if metodo == 'iqr':
+            q1, q3 = np.nanquantile(valores, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            mascara = (valores < q1 - umbral * iqr) | (valores > q3 + umbral * iqr)
+        elif metodo == 'zscore':
+            media = np.nanmean(valores, axis=0)
+            desviacion = np.nanstd(valores, axis=0, ddof=1)
+            mascara = np.abs(valores - media) / desviacion > umbral
+        elif metodo == 'mad':
+            mediana = np.nanmedian(valores, axis=0)
+            desviaciones = np.abs(valores - mediana)
+            mad = np.nanmedian(desviaciones, axis=0)
+            # Si MAD = 0 se usa la desviación media absoluta (1.253314·MeanAD)
+            escala = np.where(mad > 0, mad / 0.6745, 1.253314 * np.nanmean(desviaciones, axis=0))
+            mascara = desviaciones / escala > umbral
+        else:
+            inferior, superior = np.nanpercentile(valores, list(umbral), axis=0)
+            mascara = (valores < inferior) | (valores > superior)
+
+    if unidimensional:
+        return pd.Series(mascara[:, 0], index=tabla.index, name=tabla.columns[0])
+    return pd.DataFrame(mascara, index=tabla.index, columns=tabla.columns)
+
+
+def indices_atipicos(datos, metodo='iqr', umbral=None, columnas=None, en_todas=False):
+    """
+    Etiquetas de índice de las filas con algún valor atípico
+    (o con valores atípicos en todas las columnas si en_todas=True)
+    """
+    mascara = detectar_atipicos(datos, metodo, umbral, columnas)
+    if isinstance(mascara, pd.DataFrame):
+        mascara = mascara.all(axis=1) if en_todas else mascara.any(axis=1)
+    return mascara.index[mascara.to_numpy()]
+
+
+def eliminar_atipicos(datos, metodo='iqr', umbral=None, columnas=None):
+    """Devuelve los datos sin las filas que tienen algún valor atípico"""
+    mascara = detectar_atipicos(datos, metodo, umbral, columnas)
+    if isinstance(mascara, pd.DataFrame):
+        mascara = mascara.any(axis=1)
+    if isinstance(datos, (pd.DataFrame, pd.Series)):
+        return datos[~mascara.to_numpy()]
+    return np.asarray(datos)[~mascara.to_numpy()]
+
+
+def resumen_atipicos(datos, metodo='iqr', umbral=None, columnas=None):
+    """
+    Tabla con la cantidad y el porcentaje de valores atípicos por columna
+    """
+    mascara = detectar_atipicos(datos, metodo, umbral, columnas)
+    if isinstance(mascara, pd.Series):
+        mascara = mascara.to_frame()
+    cantidad = mascara.sum(axis=0)
+    return pd.DataFrame({
+        'Columna': mascara.columns,
+        'Atípicos': cantidad.to_numpy(),
+        'Porcentaje': np.round(cantidad.to_numpy() / len(mascara) * 100, 2),
+        'Método': METODOS_ATIPICOS[metodo]
+    })
@@ -0,0 +1,291 @@
+"""
+Ventanas Móviles - Medidas descriptivas sobre ventanas deslizantes y acumuladas
+"""
+import heapq
+from collections import defaultdict, deque
+import numpy as np
+import pandas as pd
+from estadistica_descriptiva.acumulador_descriptivo import agregar_dato, combinar_momentos, quitar_dato
+from estadistica_descriptiva.resumen_descriptivo import coeficientes_forma, momentos_centrales
+
+
+class CuantilMovil:
+    """
+    Cuantil de una ventana que cambia elemento a elemento (dos montículos)
+
+    'bajos' (montículo de máximos) guarda los k+1 menores valores y 'altos'
+    (montículo de mínimos) el resto, con k = ⌊p·(m-1)⌋; el cuantil se
+    interpola entre las dos cimas igual que np.quantile. Los elementos que
+    salen de la ventana se borran de forma diferida cuando llegan a la cima,
+    así que agregar y quitar cuestan O(log m).
+    """
+
+    def __init__(self, probabilidad):
+        self.p = probabilidad
+        self.bajos = []
+        self.altos = []
+        self.tam_bajos = 0
+        self.tam_altos = 0
+        self._borrados_bajos = defaultdict(int)
+        self._borrados_altos = defaultdict(int)
+
+    def __len__(self):
+        return self.tam_bajos + self.tam_altos
+
+    def _limpiar(self):
+        while self.bajos and self._borrados_bajos[-self.bajos[0]]:
+            self._borrados_bajos[-heapq.heappop(self.bajos)] -= 1
+        while self.altos and self._borrados_altos[self.altos[0]]:
+            self._borrados_altos[heapq.heappop(self.altos)] -= 1
+
+    def _balancear(self):
+        objetivo = int(np.floor(self.p * (len(self) - 1))) + 1 if len(self) else 0
+        while self.tam_bajos > objetivo:
+            heapq.heappush(self.altos, -heapq.heappop(self.bajos))
+            self.tam_bajos -= 1
+            self.tam_altos += 1
+            self._limpiar()
+        while self.tam_bajos < objetivo:
+            heapq.heappush(self.bajos, -heapq.heappop(self.altos))
+            self.tam_bajos += 1
+            self.tam_altos -= 1
+            self._limpiar()
+
+    def agregar(self, valor):
+        if self.tam_bajos and valor <= -self.bajos[0]:
+            heapq.heappush(self.bajos, -valor)
+            self.tam_bajos += 1
+        else:
+            heapq.heappush(self.altos, valor)
+            self.tam_altos += 1
+        self._balancear()
+
+    def quitar(self, valor):
+        # Si valor <= cima de 'bajos', 'bajos' contiene una copia de valor
+        if self.tam_bajos and valor <= -self.bajos[0]:
+            self._borrados_bajos[valor] += 1
+            self.tam_bajos -= 1
+        else:
+            self._borrados_altos[valor] += 1
+            self.tam_altos -= 1
+        self._limpiar()
+        self._balancear()
+
+    def valor(self):
+        if not len(self):
+            return np.nan
+        posicion = self.p * (len(self) - 1)
+        inferior = -self.bajos[0]
+        fraccion = posicion - np.floor(posicion)
+        if fraccion == 0:
+            return inferior
+        return inferior + fraccion * (self.altos[0] - inferior)
+
+
+def _como_serie(datos):
+    if isinstance(datos, pd.Series):
+        return datos.astype(float)
+    return pd.Series(np.asarray(datos, dtype=float))
+
+
+def _recorrer_ventanas(valores, ventana, min_periodos, probabilidades):
+    """Cuantiles, mínimo y máximo de cada ventana en una sola pasada"""
+    n = len(valores)
+    cuantiles = np.full((n, len(probabilidades)), np.nan)
+    minimos = np.full(n, np.nan)
+    maximos = np.full(n, np.nan)
+    estructuras = [CuantilMovil(p) for p in probabilidades]
+    # Colas monótonas de posiciones: mínimo y máximo en O(1) amortizado
+    cola_min, cola_max = deque(), deque()
+    validos = 0
+
+    for i, valor in enumerate(valores):
+        if ventana is not None and i >= ventana:
+            saliente = valores[i - ventana]
+            if saliente == saliente:
+                validos -= 1
+                for estructura in estructuras:
+                    estructura.quitar(saliente)
+            for cola in (cola_min, cola_max):
+                if cola and cola[0] <= i - ventana:
+                    cola.popleft()
+
+        if valor == valor:
+            validos += 1
+            for estructura in estructuras:
+                estructura.agregar(valor)
+            while cola_min and valores[cola_min[-1]] >= valor:
+                cola_min.pop()
+            cola_min.append(i)
+            while cola_max and valores[cola_max[-1]] <= valor:
+                cola_max.pop()
+            cola_max.append(i)
+
+        if validos >= min_periodos:
+            cuantiles[i] = [estructura.valor() for estructura in estructuras]
+            minimos[i] = valores[cola_min[0]]
+            maximos[i] = valores[cola_max[0]]
+    return cuantiles, minimos, maximos
+
+
+# Datos por bloque de las sumas acumuladas: dentro de un bloque las potencias
+# se toman respecto a un valor del bloque, así que pierden pocos dígitos
+_TAMANO_BLOQUE_ACUMULADO = 256
+
+
+def _momentos_acumulados(valores):
+    """
+    n, media y sumas M2, M3, M4 de cada ventana creciente, con sumas
+    acumuladas (np.cumsum) por bloques
+
+    En cada bloque se acumulan las potencias de las desviaciones a su primer
+    dato y se pasan a momentos centrales; los bloques ya recorridos se suman
+    con combinar_momentos, todas las posiciones del bloque a la vez.
+    """
+    total = len(valores)
+    n, media, m2, m3, m4 = (np.empty(total) for _ in range(5))
+    anterior = (0, 0.0, 0.0, 0.0, 0.0)
+    for inicio in range(0, total, _TAMANO_BLOQUE_ACUMULADO):
+        parte = slice(inicio, inicio + _TAMANO_BLOQUE_ACUMULADO)
+        bloque = valores[parte]
+        presentes = ~np.isnan(bloque)
+        if not presentes.any():
+            n[parte], media[parte], m2[parte], m3[parte], m4[parte] = anterior
+            continue
+
+        centro = bloque[presentes][0]
+        d = np.where(presentes, bloque - centro, 0.0)
+        cuenta = np.cumsum(presentes)
+        s2, s3, s4 = np.cumsum(d * d), np.cumsum(d ** 3), np.cumsum(d ** 4)
+        # Media del tramo respecto al centro (0 antes del primer dato presente)
+        dm = np.cumsum(d) / np.maximum(cuenta, 1)
+        momentos_bloque = (cuenta, centro + dm, s2 - cuenta * dm * dm,
+                           s3 - 3 * dm * s2 + 2 * cuenta * dm ** 3,
+                           s4 - 4 * dm * s3 + 6 * dm * dm * s2 - 3 * cuenta * dm ** 4)
+        n[parte], media[parte], m2[parte], m3[parte], m4[parte] = combinar_momentos(anterior, momentos_bloque)
+        anterior = (n[parte][-1], media[parte][-1], m2[parte][-1], m3[parte][-1], m4[parte][-1])
+    return n, media, m2, m3, m4
+
+
+def _momentos_moviles(valores, ventana):
+    """
+    n, media y sumas M2, M3, M4 de cada ventana deslizante: al avanzar se
+    agrega el dato que entra y se quita el que sale (agregar_dato /
+    quitar_dato), O(1) por paso. Cada 'ventana' pasos la ventana se
+    recalcula desde cero, así el redondeo no se acumula a lo largo de la serie.
+    """
+    total = len(valores)
+    resultado = np.empty((total, 5))
+    lista = valores.tolist()
+    momentos = (0, 0.0, 0.0, 0.0, 0.0)
+    for i, valor in enumerate(lista):
+        if i >= ventana and i % ventana == 0:
+            tramo = valores[i - ventana + 1:i + 1]
+            tramo = tramo[~np.isnan(tramo)]
+            if len(tramo):
+                media, m2, m3, m4 = momentos_centrales(tramo)
+                k = len(tramo)
+                momentos = (k, float(media), float(m2) * k, float(m3) * k, float(m4) * k)
+            else:
+                momentos = (0, 0.0, 0.0, 0.0, 0.0)
+        else:
+            if i >= ventana:
+                saliente = lista[i - ventana]
+                if saliente == saliente:
+                    momentos = quitar_dato(momentos, saliente) if momentos[0] > 1 else (0, 0.0, 0.0, 0.0, 0.0)
+            if valor == valor:
+                momentos = agregar_dato(momentos, valor)
+        resultado[i] = momentos
+    return resultado.T
+
+
+def _momentos_ventana(valores, ventana):
+    """
+    n, media y momentos centrales m2, m3, m4 (divididos entre n) de cada
+    ventana (ventana=None: ventanas crecientes)
+
+    Las desviaciones se toman respecto a la media de cada ventana, nunca
+    respecto a una media global: con sumas acumuladas de potencias, una serie
+    con tendencia pierde todos los dígitos al restar sumas enormes.
+    """
+    if ventana is None:
+        n, media, m2, m3, m4 = _momentos_acumulados(valores)
+    else:
+        n, media, m2, m3, m4 = _momentos_moviles(valores, ventana)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return n.astype(np.int64), np.where(n > 0, media, np.nan), m2 / n, m3 / n, m4 / n
+
+
+def _estadisticas_ventana(datos, ventana, min_periodos):
+    serie = _como_serie(datos)
+    valores = serie.to_numpy()
+    n, media, m2, m3, m4 = _momentos_ventana(valores, ventana)
+    cuantiles, minimos, maximos = _recorrer_ventanas(valores, ventana, min_periodos, (0.25, 0.5, 0.75))
+    q1, mediana, q3 = cuantiles.T
+    asimetria, curtosis = coeficientes_forma(m2, m3, m4)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varianza = m2 * n / (n - 1)
+        desviacion = np.sqrt(varianza)
+        resultado = pd.DataFrame({
+            'n': n,
+            'Media': media,
+            'Mediana': mediana,
+            'Mínimo': minimos,
+            'Máximo': maximos,
+            'Rango': maximos - minimos,
+            'Varianza': varianza,
+            'Desviación Estándar': desviacion,
+            'CV (%)': desviacion / np.abs(media) * 100,
+            'Q1': q1,
+            'Q3': q3,
+            'IQR': q3 - q1,
+            'Asimetría': asimetria,
+            'Curtosis': curtosis
+        }, index=serie.index)
+    # Las ventanas con menos de min_periodos datos quedan vacías
+    medidas = resultado.columns.drop('n')
+    resultado.loc[n < min_periodos, medidas] = np.nan
+    return resultado
+
+
+def estadisticas_moviles(datos, ventana, min_periodos=None):
+    """
+    Medidas de tendencia central, dispersión, posición y forma sobre una
+    ventana deslizante de 'ventana' filas (ej. una columna ordenada de un CSV)
+
+    Los cuantiles se actualizan con montículos y los momentos agregando el
+    dato que entra y quitando el que sale, respecto a la media de cada
+    ventana. Los valores faltantes se ignoran; las ventanas con menos de
+    min_periodos datos (por defecto, la ventana completa) quedan en NaN.
+
+    Retorna un DataFrame con el mismo índice que los datos y una columna por medida.
+    """
+    if ventana < 1:
+        raise ValueError('La ventana debe tener al menos 1 elemento')
+    if min_periodos is None:
+        min_periodos = ventana
+    return _estadisticas_ventana(datos, ventana, max(min_periodos, 1))
+
+
+def estadisticas_acumuladas(datos, min_periodos=1):
+    """
+    Mismas medidas que estadisticas_moviles, pero cada fila resume todos los
+    datos desde el inicio hasta esa fila (ventana creciente)
+    """
+    return _estadisticas_ventana(datos, None, max(min_periodos, 1))
+
+
+def cuantiles_moviles(datos, ventana, probabilidades, min_periodos=None):
+    """
+    Cuantiles (probabilidades entre 0 y 1) de cada ventana deslizante,
+    con la misma interpolación lineal que calcular_cuantiles.
+    ventana=None calcula los cuantiles acumulados.
+    """
+    serie = _como_serie(datos)
+    probabilidades = np.atleast_1d(np.asarray(probabilidades, dtype=float))
+    if min_periodos is None:
+        min_periodos = ventana or 1
+    cuantiles, _, _ = _recorrer_ventanas(serie.to_numpy(), ventana, max(min_periodos, 1), probabilidades)
+    return pd.DataFrame(cuantiles, index=serie.index,
+                        columns=[f'P{round(p * 100, 2):g}' for p in probabilidades])
@@ -2,11 +2,11 @@
 Distribución Normal (Gaussiana) - La distribución más importante en estadística
 """
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats
-from scipy.special import erf
+from scipy.special import erf, ndtr, ndtri
 import seaborn as sns
+from estadistica_inferencial.tabla_normal import acumulada_z, cuantil_z, tabla_z, valor_z_critico
 
 class DistribucionNormal:
     """Clase para la distribución Normal"""
@@ -48,7 +48,7 @@ class DistribucionNormal:
         """
         if b is None:
             # P(X ≤ a)
-            prob = self.distribucion.cdf(a)
+            prob = acumulada_z((a - self.mu) / self.sigma)
             return {
                 'tipo': 'acumulada',
                 'limite': a,
@@ -61,7 +61,7 @@ class DistribucionNormal:
             if a > b:
                 a, b = b, a
             
-            prob = self.distribucion.cdf(b) - self.distribucion.cdf(a)
+            prob = acumulada_z((b - self.mu) / self.sigma) - acumulada_z((a - self.mu) / self.sigma)
             return {
                 'tipo': 'intervalo',
                 'limite_inferior': a,
@@ -71,9 +71,32 @@ class DistribucionNormal:
                 'formula': f'P({a} ≤ X ≤ {b}) = Φ({b}) - Φ({a})'
             }
     
+    def pdf_many(self, x):
+        """Densidad f(x) para un arreglo de x (la normal es continua: no hay pmf)"""
+        z = (np.asarray(x, dtype=float) - self.mu) / self.sigma
+        return np.exp(-0.5 * z * z) / (self.sigma * np.sqrt(2 * np.pi))
+    
+    def cdf_many(self, x):
+        """P(X ≤ x) para un arreglo de x"""
+        return ndtr((np.asarray(x, dtype=float) - self.mu) / self.sigma)
+    
+    def ppf_many(self, probabilidades):
+        """x tal que P(X ≤ x) = q para un arreglo de q (NaN fuera de [0, 1])"""
+        q = np.asarray(probabilidades, dtype=float)
+        return np.where((q >= 0) & (q <= 1), self.mu + self.sigma * ndtri(q), np.nan)
+    
+    def interval_many(self, a, b):
+        """P(a ≤ X ≤ b) para arreglos de límites (0 si a > b)"""
+        za = (np.asarray(a, dtype=float) - self.mu) / self.sigma
+        zb = (np.asarray(b, dtype=float) - self.mu) / self.sigma
+        # A la derecha de la media se restan colas derechas para no perder precisión
+        prob = np.where(za > 0, ndtr(-za) - ndtr(-zb), ndtr(zb) - ndtr(za))
+        return np.maximum(prob, 0)
+    
     def probabilidad_mayor(self, x):
         """Calcula P(X > x)"""
-        prob = 1 - self.distribucion.cdf(x)
+        # Cola derecha por simetría: Φ(-z) = 1 - Φ(z)
+        prob = acumulada_z((self.mu - x) / self.sigma)
         return {
             'x': x,
             'probabilidad': float(prob),
@@ -83,7 +106,7 @@ class DistribucionNormal:
     
     def probabilidad_menor(self, x):
         """Calcula P(X < x)"""
-        prob = self.distribucion.cdf(x)
+        prob = acumulada_z((x - self.mu) / self.sigma)
         return {
             'x': x,
             'probabilidad': float(prob),
@@ -113,7 +136,7 @@ class DistribucionNormal:
         if not 0 < p < 1:
             raise ValueError("El percentil debe estar entre 0 y 1")
         
-        x = self.distribucion.ppf(p)
+        x = self.mu + self.sigma * cuantil_z(p)
         return {
             'percentil': p,
             'percentil_porcentaje': f'{p * 100:.1f}%',
@@ -337,8 +360,7 @@ class DistribucionNormal:
         """
         Calcula el intervalo de confianza para un nivel dado
         """
-        alpha = 1 - nivel_confianza
-        z_critico = stats.norm.ppf(1 - alpha/2)
+        z_critico = valor_z_critico(nivel_confianza)
         
         limite_inferior = self.mu - z_critico * self.sigma
         limite_superior = self.mu + z_critico * self.sigma
@@ -354,24 +376,8 @@ class DistribucionNormal:
         }
     
     def tabla_normal_estandar(self, z_min=-3, z_max=3, paso=0.5):
-        """Genera tabla de valores Z y probabilidades"""
-        z_valores = np.arange(z_min, z_max + paso, paso)
-        
-        datos = []
-        for z in z_valores:
-            prob_menor = stats.norm.cdf(z)
-            prob_mayor = 1 - prob_menor
-            x_valor = self.mu + z * self.sigma
-            
-            datos.append({
-                'Z': round(z, 2),
-                'X': round(x_valor, 2),
-                'P(Z ≤ z)': round(prob_menor, 4),
-                'P(Z > z)': round(prob_mayor, 4),
-                '%': f'{prob_menor * 100:.1f}%'
-            })
-        
-        return pd.DataFrame(datos)
+        """Genera tabla de valores Z y probabilidades (vectorizada, desde la tabla Z precalculada)"""
+        return tabla_z(z_min, z_max, paso, self.mu, self.sigma)
     
     def graficar(self, figsize=(16, 12)):
         """Genera gráficos completos de la distribución"""
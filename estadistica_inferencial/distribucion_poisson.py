@@ -5,8 +5,54 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats
-from scipy.special import factorial
+from scipy.special import gammaln, pdtr, pdtrc, xlogy
 import seaborn as sns
+from estadistica_inferencial.distribuciones import cuantil_desde_acumuladas
+
+# Con más valores de k el eje x se rotula automáticamente en lugar de uno por k
+_MAXIMO_MARCAS_K = 60
+
+
+def log_masa_poisson(k, lambd):
+    """
+    ln P(X = k) = k·ln λ - λ - lnΓ(k+1) para todos los k a la vez; en
+    escala logarítmica ni λ^k ni k! se desbordan (la fórmula directa falla
+    desde k ≈ 170)
+    """
+    k = np.asarray(k, dtype=float)
+    dentro = (k >= 0) & (k == np.floor(k))
+    kv = np.where(dentro, k, 0)
+    return np.where(dentro, xlogy(kv, lambd) - lambd - gammaln(kv + 1), -np.inf)
+
+
+def masa_poisson(k, lambd):
+    """P(X = k), vectorizada en k"""
+    return np.exp(log_masa_poisson(k, lambd))
+
+
+def acumulada_poisson(k, lambd):
+    """P(X ≤ k), vectorizada en k (gamma incompleta regularizada, sin sumar términos)"""
+    k = np.floor(np.asarray(k, dtype=float))
+    return np.where(k < 0, 0.0, pdtr(np.maximum(k, 0), lambd))
+
+
+def supervivencia_poisson(k, lambd):
+    """P(X > k), vectorizada en k; precisa en la cola derecha (no se calcula como 1 - F)"""
+    k = np.floor(np.asarray(k, dtype=float))
+    return np.where(k < 0, 1.0, pdtrc(np.maximum(k, 0), lambd))
+
+
+def intervalo_poisson(k1, k2, lambd):
+    """
+    P(k1 ≤ X ≤ k2) en O(1) como diferencia de acumuladas; si el intervalo
+    está a la derecha de λ se restan colas derechas para no perder precisión
+    """
+    k1 = np.asarray(k1, dtype=float)
+    k2 = np.asarray(k2, dtype=float)
+    izquierda = acumulada_poisson(k2, lambd) - acumulada_poisson(k1 - 1, lambd)
+    derecha = supervivencia_poisson(k1 - 1, lambd) - supervivencia_poisson(k2, lambd)
+    return np.maximum(np.where(k1 > lambd, derecha, izquierda), 0)
+
 
 class DistribucionPoisson:
     """Clase para la distribución de Poisson"""
@@ -21,6 +67,7 @@ class DistribucionPoisson:
         
         self.lambd = lambd
         self.distribucion = stats.poisson(lambd)
+        self._acumuladas = None
     
     def probabilidad(self, k):
         """
@@ -35,8 +82,8 @@ class DistribucionPoisson:
                 'razon': 'k debe ser un entero no negativo'
             }
         
-        # Calcular probabilidad
-        prob = (self.lambd ** k) * np.exp(-self.lambd) / factorial(k)
+        # Calcular probabilidad (en escala logarítmica)
+        prob = masa_poisson(k, self.lambd)
         
         return {
             'k': k,
@@ -56,16 +103,16 @@ class DistribucionPoisson:
             raise ValueError('k debe ser un entero no negativo')
         
         if tipo == 'menor_igual':  # P(X ≤ k)
-            prob_acum = self.distribucion.cdf(k)
+            prob_acum = acumulada_poisson(k, self.lambd)
             formula = f'P(X ≤ {k})'
         elif tipo == 'menor':  # P(X < k)
-            prob_acum = self.distribucion.cdf(k - 1) if k > 0 else 0
+            prob_acum = acumulada_poisson(k - 1, self.lambd)
             formula = f'P(X < {k})'
         elif tipo == 'mayor_igual':  # P(X ≥ k)
-            prob_acum = 1 - self.distribucion.cdf(k - 1) if k > 0 else 1
+            prob_acum = supervivencia_poisson(k - 1, self.lambd)
             formula = f'P(X ≥ {k})'
         elif tipo == 'mayor':  # P(X > k)
-            prob_acum = 1 - self.distribucion.cdf(k)
+            prob_acum = supervivencia_poisson(k, self.lambd)
             formula = f'P(X > {k})'
         else:
             raise ValueError("tipo debe ser 'menor_igual', 'menor', 'mayor_igual' o 'mayor'")
@@ -86,16 +133,40 @@ class DistribucionPoisson:
         if k1 > k2:
             k1, k2 = k2, k1
         
-        prob = sum(self.probabilidad(k)['probabilidad'] for k in range(k1, k2 + 1))
+        prob = intervalo_poisson(k1, k2, self.lambd)
         
         return {
             'k1': k1,
             'k2': k2,
             'probabilidad': float(prob),
             'porcentaje': round(float(prob) * 100, 2),
-            'formula': f'P({k1} ≤ X ≤ {k2}) = Σ P(X=k) para k={k1} hasta k={k2}'
+            'formula': f'P({k1} ≤ X ≤ {k2}) = F({k2}) - F({k1 - 1})'
         }
     
+    def pmf_many(self, k):
+        """P(X = k) para un arreglo de k"""
+        return masa_poisson(k, self.lambd)
+    
+    def cdf_many(self, x):
+        """P(X ≤ x) para un arreglo de x"""
+        return acumulada_poisson(x, self.lambd)
+    
+    def ppf_many(self, probabilidades):
+        """
+        Menor k con P(X ≤ k) ≥ q para un arreglo de q (-1 con q = 0, infinito
+        con q = 1, NaN fuera de [0, 1]). La tabla F(k) se calcula una vez hasta λ + 40σ,
+        donde la cola que queda ya no es representable en punto flotante.
+        """
+        if self._acumuladas is None:
+            k_max = int(self.lambd + 40 * np.sqrt(self.lambd)) + 40
+            self._acumuladas = acumulada_poisson(np.arange(k_max + 1), self.lambd)
+        q = np.asarray(probabilidades, dtype=float)
+        return np.where(q == 1, np.inf, cuantil_desde_acumuladas(self._acumuladas, q))
+    
+    def interval_many(self, a, b):
+        """P(a ≤ X ≤ b) para arreglos de límites"""
+        return intervalo_poisson(np.ceil(np.asarray(a, dtype=float)), b, self.lambd)
+    
     def estadisticas(self):
         """Calcula las estadísticas de la distribución"""
         media = self.lambd
@@ -112,6 +183,23 @@ class DistribucionPoisson:
             'curtosis': 3 + (1 / self.lambd)
         }
     
+    def _valores_k(self, k_max=None):
+        """
+        Valores de k a graficar: de 0 a k_max (si None, 3λ o mínimo 15).
+        Con λ grande solo se toma λ ± 10σ, fuera de ahí P(X = k) < 1e-20.
+        """
+        k_min = 0
+        if k_max is None:
+            sigma = np.sqrt(self.lambd)
+            k_max = min(max(int(3 * self.lambd) + 5, 15), int(self.lambd + 10 * sigma) + 15)
+            k_min = max(int(self.lambd - 10 * sigma), 0)
+        return np.arange(k_min, k_max + 1)
+    
+    def _marcar_k(self, ax, k_values):
+        """Una marca por k solo si caben; si no, las elige matplotlib"""
+        if len(k_values) <= _MAXIMO_MARCAS_K:
+            ax.set_xticks(k_values)
+    
     def graficar_probabilidades(self, k_max=None, ax=None):
         """
         Genera gráfica de barras con las probabilidades P(X=k)
@@ -124,11 +212,8 @@ class DistribucionPoisson:
             fig, ax = plt.subplots(figsize=(10, 6))
         
         # Definir rango de k
-        if k_max is None:
-            k_max = max(int(3 * self.lambd) + 5, 15)
-        
-        k_values = np.arange(0, k_max + 1)
-        probabilidades = [self.probabilidad(k)['probabilidad'] for k in k_values]
+        k_values = self._valores_k(k_max)
+        probabilidades = masa_poisson(k_values, self.lambd)
         
         # Crear gráfica de barras
         bars = ax.bar(k_values, probabilidades, color='steelblue', alpha=0.7, 
@@ -149,7 +234,7 @@ class DistribucionPoisson:
                     fontsize=14, fontweight='bold')
         ax.legend(loc='best')
         ax.grid(True, alpha=0.3, axis='y')
-        ax.set_xticks(k_values)
+        self._marcar_k(ax, k_values)
         
         return ax
     
@@ -164,11 +249,8 @@ class DistribucionPoisson:
         if ax is None:
             fig, ax = plt.subplots(figsize=(10, 6))
         
-        if k_max is None:
-            k_max = max(int(3 * self.lambd) + 5, 15)
-        
-        k_values = np.arange(0, k_max + 1)
-        prob_acumuladas = [self.distribucion.cdf(k) for k in k_values]
+        k_values = self._valores_k(k_max)
+        prob_acumuladas = acumulada_poisson(k_values, self.lambd)
         
         # Gráfica escalonada
         ax.step(k_values, prob_acumuladas, where='post', color='darkgreen',
@@ -190,7 +272,7 @@ class DistribucionPoisson:
         ax.legend(loc='best')
         ax.grid(True, alpha=0.3)
         ax.set_ylim(-0.05, 1.05)
-        ax.set_xticks(k_values)
+        self._marcar_k(ax, k_values)
         
         return ax
     
@@ -214,7 +296,7 @@ class DistribucionPoisson:
         k_values = np.arange(0, k_max + 1)
         
         # Graficar distribución actual
-        probs = [self.probabilidad(k)['probabilidad'] for k in k_values]
+        probs = masa_poisson(k_values, self.lambd)
         ax.plot(k_values, probs, 'o-', linewidth=2.5, markersize=6,
                label=f'λ = {self.lambd}')
         
@@ -222,7 +304,7 @@ class DistribucionPoisson:
         colores = plt.cm.Set1(np.linspace(0, 1, len(otros_lambdas)))
         for i, lambd in enumerate(otros_lambdas):
             dist = DistribucionPoisson(lambd)
-            probs = [dist.probabilidad(k)['probabilidad'] for k in k_values]
+            probs = masa_poisson(k_values, dist.lambd)
             ax.plot(k_values, probs, 'o-', linewidth=2, markersize=5,
                    label=f'λ = {lambd}', color=colores[i], alpha=0.7)
         
@@ -249,7 +331,7 @@ class DistribucionPoisson:
         
         k_max = max([intervalo[1] for intervalo in intervalos]) + 5
         k_values = np.arange(0, k_max + 1)
-        probabilidades = [self.probabilidad(k)['probabilidad'] for k in k_values]
+        probabilidades = masa_poisson(k_values, self.lambd)
         
         # Graficar todas las barras
         ax.bar(k_values, probabilidades, color='lightgray', alpha=0.5,
@@ -259,8 +341,8 @@ class DistribucionPoisson:
         colores = plt.cm.Set3(np.linspace(0, 1, len(intervalos)))
         for i, (k1, k2) in enumerate(intervalos):
             k_intervalo = np.arange(k1, k2 + 1)
-            probs_intervalo = [probabilidades[k] for k in k_intervalo if k < len(probabilidades)]
-            prob_total = sum(probs_intervalo)
+            probs_intervalo = probabilidades[k1:k2 + 1]
+            prob_total = float(intervalo_poisson(k1, k2, self.lambd))
             
             ax.bar(k_intervalo, probs_intervalo, color=colores[i], alpha=0.8,
                   edgecolor='black', linewidth=1.5,
@@ -282,23 +364,17 @@ class DistribucionPoisson:
             # Calcular hasta donde la probabilidad sea significativa
             k_max = int(self.lambd + 4 * np.sqrt(self.lambd))
         
-        datos = []
-        prob_acumulada = 0
+        k = np.arange(k_max + 1)
+        prob_k = self.pmf_many(k)
+        prob_acumulada = self.cdf_many(k)
         
-        for k in range(k_max + 1):
-            prob_info = self.probabilidad(k)
-            prob_k = prob_info['probabilidad']
-            prob_acumulada += prob_k
-            
-            datos.append({
-                'k': k,
-                'P(X=k)': round(prob_k, 6),
-                'Porcentaje': f"{round(prob_k * 100, 2)}%",
-                'P(X≤k)': round(prob_acumulada, 6),
-                'P(X≤k) %': f"{round(prob_acumulada * 100, 2)}%"
-            })
-        
-        return pd.DataFrame(datos)
+        return pd.DataFrame({
+            'k': k,
+            'P(X=k)': np.round(prob_k, 6),
+            'Porcentaje': [f"{v}%" for v in np.round(prob_k * 100, 2).tolist()],
+            'P(X≤k)': np.round(prob_acumulada, 6),
+            'P(X≤k) %': [f"{v}%" for v in np.round(prob_acumulada * 100, 2).tolist()]
+        })
     
     def generar_muestra(self, tamaño_muestra):
         """Genera una muestra aleatoria"""
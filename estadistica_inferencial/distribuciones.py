@@ -2,10 +2,89 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats
-from scipy.special import comb
+from scipy.special import bdtr, bdtrc, comb, gammaln, xlog1py, xlogy
 import seaborn as sns
 from fractions import Fraction
 
+# Hasta este n los coeficientes C(n,k) de la tabla se muestran como enteros exactos
+_MAXIMO_N_COEFICIENTES_EXACTOS = 1000
+
+
+def log_masa_binomial(k, n, p):
+    """
+    ln P(X = k) para todos los k a la vez, con log-gamma:
+    ln C(n,k) = lnΓ(n+1) - lnΓ(k+1) - lnΓ(n-k+1)
+    Así no se forman enteros gigantes ni potencias que se desbordan.
+    """
+    k = np.asarray(k, dtype=float)
+    dentro = (k >= 0) & (k <= n) & (k == np.floor(k))
+    kv = np.where(dentro, k, 0)
+    # xlogy/xlog1py dan 0·ln(0) = 0, así que p = 0 y p = 1 también funcionan
+    log_masa = (gammaln(n + 1) - gammaln(kv + 1) - gammaln(n - kv + 1)
+                + xlogy(kv, p) + xlog1py(n - kv, -p))
+    return np.where(dentro, log_masa, -np.inf)
+
+
+def coeficientes_binomiales(n, k):
+    """
+    C(n,k) para uno o varios k: enteros exactos si n ≤ 1000; con n mayor los
+    coeficientes no caben en un float, así que se devuelven en notación
+    científica (texto) a partir de su logaritmo
+    """
+    if n <= _MAXIMO_N_COEFICIENTES_EXACTOS:
+        return comb(n, k, exact=True) if np.isscalar(k) else [comb(n, i, exact=True) for i in k]
+    k = np.asarray(k, dtype=float)
+    log10_coef = (gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)) / np.log(10)
+    exponente = np.floor(log10_coef)
+    mantisa = 10 ** (log10_coef - exponente)
+    if k.ndim == 0:
+        return f'{float(mantisa):.4f}e+{int(exponente)}'
+    return [f'{m:.4f}e+{e}' for m, e in zip(mantisa.tolist(), exponente.astype(np.int64).tolist())]
+
+
+def masa_binomial(k, n, p):
+    """P(X = k), vectorizada en k"""
+    return np.exp(log_masa_binomial(k, n, p))
+
+
+def acumulada_binomial(k, n, p):
+    """P(X ≤ k), vectorizada en k (beta incompleta regularizada, sin sumar términos)"""
+    k = np.floor(np.asarray(k, dtype=float))
+    return np.where(k < 0, 0.0, np.where(k >= n, 1.0, bdtr(np.clip(k, 0, n), n, p)))
+
+
+def supervivencia_binomial(k, n, p):
+    """P(X > k), vectorizada en k; precisa en la cola derecha (no se calcula como 1 - F)"""
+    k = np.floor(np.asarray(k, dtype=float))
+    return np.where(k < 0, 1.0, np.where(k >= n, 0.0, bdtrc(np.clip(k, 0, n), n, p)))
+
+
+def intervalo_binomial(k1, k2, n, p):
+    """
+    P(k1 ≤ X ≤ k2) en O(1) como diferencia de acumuladas; si el intervalo
+    está a la derecha de la media se restan colas derechas para no perder precisión
+    """
+    k1 = np.ceil(np.asarray(k1, dtype=float))
+    k2 = np.asarray(k2, dtype=float)
+    izquierda = acumulada_binomial(k2, n, p) - acumulada_binomial(k1 - 1, n, p)
+    derecha = supervivencia_binomial(k1 - 1, n, p) - supervivencia_binomial(k2, n, p)
+    return np.maximum(np.where(k1 > n * p, derecha, izquierda), 0)
+
+
+def cuantil_desde_acumuladas(acumuladas, probabilidades, inicio=0):
+    """
+    Menor k con F(k) ≥ q para cada q, por búsqueda binaria sobre la tabla
+    F(inicio), F(inicio + 1), ... (mucho más rápido que un ppf punto a punto)
+
+    Las probabilidades fuera de [0, 1] dan NaN; q = 0 da inicio - 1, igual
+    que el ppf de scipy.stats para distribuciones discretas.
+    """
+    q = np.asarray(probabilidades, dtype=float)
+    k = inicio + np.searchsorted(acumuladas, q, side='left')
+    k = np.where(q == 0, inicio - 1, k)
+    return np.where((q >= 0) & (q <= 1), k, np.nan)
+
+
 class DistribucionBernoulli:
     """Clase para la distribución de Bernoulli"""
     
@@ -37,6 +116,25 @@ class DistribucionBernoulli:
             'formula': f"P(X={k}) = p^{k} * (1-p)^{1-k} = {self.p}^{k} * {self.q}^{1-k}"
         }
     
+    def pmf_many(self, k):
+        """P(X = k) para un arreglo de k"""
+        k = np.asarray(k)
+        return np.where(k == 1, self.p, np.where(k == 0, self.q, 0.0))
+    
+    def cdf_many(self, x):
+        """P(X ≤ x) para un arreglo de x"""
+        x = np.asarray(x, dtype=float)
+        return np.where(x < 0, 0.0, np.where(x < 1, self.q, 1.0))
+    
+    def ppf_many(self, probabilidades):
+        """Menor k con P(X ≤ k) ≥ q para un arreglo de q (-1 con q = 0, NaN fuera de [0, 1])"""
+        return cuantil_desde_acumuladas(np.array([self.q, 1.0]), probabilidades)
+    
+    def interval_many(self, a, b):
+        """P(a ≤ X ≤ b) para arreglos de límites"""
+        a = np.ceil(np.asarray(a, dtype=float))
+        return np.maximum(self.cdf_many(b) - self.cdf_many(a - 1), 0)
+    
     def estadisticas(self):
         """Calcula las estadísticas de la distribución"""
         media = self.p
@@ -129,6 +227,7 @@ class DistribucionBinomial:
         self.p = p
         self.q = 1 - p
         self.distribucion = stats.binom(n, p)
+        self._acumuladas = None
     
     def probabilidad(self, k):
         """
@@ -143,8 +242,8 @@ class DistribucionBinomial:
                 'razon': f"k debe ser un entero entre 0 y {self.n}"
             }
         
-        coef_binomial = comb(self.n, k, exact=True)
-        prob = coef_binomial * (self.p ** k) * (self.q ** (self.n - k))
+        coef_binomial = coeficientes_binomiales(self.n, k)
+        prob = float(masa_binomial(k, self.n, self.p))
         
         return {
             'k': k,
@@ -166,19 +265,20 @@ class DistribucionBinomial:
             raise ValueError(f"k debe ser un entero entre 0 y {self.n}")
         
         if tipo == 'menor_igual':  # P(X ≤ k)
-            prob_acum = sum(self.probabilidad(i)['probabilidad'] for i in range(k + 1))
+            prob_acum = acumulada_binomial(k, self.n, self.p)
             formula = f"P(X ≤ {k})"
         elif tipo == 'menor':  # P(X < k)
-            prob_acum = sum(self.probabilidad(i)['probabilidad'] for i in range(k))
+            prob_acum = acumulada_binomial(k - 1, self.n, self.p)
             formula = f"P(X < {k})"
         elif tipo == 'mayor_igual':  # P(X ≥ k)
-            prob_acum = sum(self.probabilidad(i)['probabilidad'] for i in range(k, self.n + 1))
+            prob_acum = supervivencia_binomial(k - 1, self.n, self.p)
             formula = f"P(X ≥ {k})"
         elif tipo == 'mayor':  # P(X > k)
-            prob_acum = sum(self.probabilidad(i)['probabilidad'] for i in range(k + 1, self.n + 1))
+            prob_acum = supervivencia_binomial(k, self.n, self.p)
             formula = f"P(X > {k})"
         else:
             raise ValueError("tipo debe ser 'menor_igual', 'menor', 'mayor_igual' o 'mayor'")
+        prob_acum = float(prob_acum)
         
         return {
             'k': k,
@@ -189,6 +289,27 @@ class DistribucionBinomial:
             'complemento': 1 - prob_acum
         }
     
+    def pmf_many(self, k):
+        """P(X = k) para un arreglo de k"""
+        return masa_binomial(k, self.n, self.p)
+    
+    def cdf_many(self, x):
+        """P(X ≤ x) para un arreglo de x"""
+        return acumulada_binomial(x, self.n, self.p)
+    
+    def ppf_many(self, probabilidades):
+        """
+        Menor k con P(X ≤ k) ≥ q para un arreglo de q (-1 con q = 0, NaN
+        fuera de [0, 1]); la tabla F(0..n) se calcula una vez y se reutiliza
+        """
+        if self._acumuladas is None:
+            self._acumuladas = acumulada_binomial(np.arange(self.n + 1), self.n, self.p)
+        return cuantil_desde_acumuladas(self._acumuladas, probabilidades)
+    
+    def interval_many(self, a, b):
+        """P(a ≤ X ≤ b) para arreglos de límites"""
+        return intervalo_binomial(a, b, self.n, self.p)
+    
     def estadisticas(self):
         """Calcula las estadísticas de la distribución"""
         media = self.n * self.p
@@ -211,29 +332,28 @@ class DistribucionBinomial:
         }
     
     def tabla_probabilidades(self, mostrar_acumulada=True):
-        """Genera tabla completa de probabilidades"""
-        datos = []
-        prob_acumulada = 0
+        """
+        Genera tabla completa de probabilidades
         
-        for k in range(self.n + 1):
-            prob_info = self.probabilidad(k)
-            prob_k = prob_info['probabilidad']
-            prob_acumulada += prob_k
-            
-            fila = {
-                'k': k,
-                'P(X=k)': round(prob_k, 6),
-                'Porcentaje': f"{round(prob_k * 100, 2)}%",
-                'C(n,k)': prob_info['coeficiente_binomial']
-            }
-            
-            if mostrar_acumulada:
-                fila['P(X≤k)'] = round(prob_acumulada, 6)
-                fila['P(X≤k) %'] = f"{round(prob_acumulada * 100, 2)}%"
-            
-            datos.append(fila)
+        Las probabilidades de todas las filas se calculan con una sola
+        operación vectorizada (antes: un C(n,k) exacto y una suma por fila).
+        """
+        k = np.arange(self.n + 1)
+        prob_k = self.pmf_many(k)
         
-        return pd.DataFrame(datos)
+        tabla = pd.DataFrame({
+            'k': k,
+            'P(X=k)': np.round(prob_k, 6),
+            'Porcentaje': [f"{v}%" for v in np.round(prob_k * 100, 2).tolist()],
+            'C(n,k)': coeficientes_binomiales(self.n, k)
+        })
+        
+        if mostrar_acumulada:
+            prob_acumulada = self.cdf_many(k)
+            tabla['P(X≤k)'] = np.round(prob_acumulada, 6)
+            tabla['P(X≤k) %'] = [f"{v}%" for v in np.round(prob_acumulada * 100, 2).tolist()]
+        
+        return tabla
     
     def generar_muestra(self, tamaño_muestra):
         """Genera una muestra aleatoria"""
@@ -255,8 +375,8 @@ class DistribucionBinomial:
         
         # Preparar datos
         x = np.arange(0, self.n + 1)
-        probabilidades = [self.probabilidad(k)['probabilidad'] for k in x]
-        prob_acumuladas = np.cumsum(probabilidades)
+        probabilidades = masa_binomial(x, self.n, self.p)
+        prob_acumuladas = acumulada_binomial(x, self.n, self.p)
         
         # Layout de subplots
         gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
@@ -441,7 +561,7 @@ def comparar_distribuciones():
         # Crear distribución
         dist = DistribucionBinomial(params['n'], params['p'])
         x = np.arange(0, params['n'] + 1)
-        probabilidades = [dist.probabilidad(k)['probabilidad'] for k in x]
+        probabilidades = masa_binomial(x, dist.n, dist.p)
         
         # Graficar
         ax.bar(x, probabilidades, alpha=0.7, color=f'C{i}', edgecolor='black')
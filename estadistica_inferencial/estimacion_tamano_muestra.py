@@ -1,7 +1,7 @@
 """Calculos para estimacion e intervalos de confianza en Estadistica II."""
 
 import math
-from scipy import stats
+from estadistica_inferencial.valores_criticos import t_critico, z_critico
 
 
 class EstimacionTamanoMuestra:
@@ -42,9 +42,7 @@ class EstimacionTamanoMuestra:
         if z_comun is not None:
             return z_comun
 
-        alpha = 1 - (confianza / 100)
-        probabilidad = 1 - (alpha / 2)
-        return stats.norm.ppf(probabilidad)
+        return z_critico(confianza / 100)
 
     @staticmethod
     def normalizar_proporcion(valor, nombre="valor"):
@@ -61,14 +59,13 @@ class EstimacionTamanoMuestra:
 
     @classmethod
     def obtener_t_critico(cls, nivel_confianza, grados_libertad):
-        """Obtiene el t critico bilateral exacto usando scipy.stats."""
+        """Obtiene el t critico bilateral exacto (con cache, ver valores_criticos)."""
         gl = int(grados_libertad)
         if gl <= 0:
             raise ValueError("Los grados de libertad deben ser mayores que 0.")
 
         confianza = cls.normalizar_confianza_porcentaje(nivel_confianza)
-        alpha = 1 - (confianza / 100)
-        return stats.t.ppf(1 - alpha / 2, gl)
+        return t_critico(confianza / 100, gl)
 
     @staticmethod
     def _validar_no_negativo(valor, nombre):
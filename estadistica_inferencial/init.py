@@ -1,18 +1,47 @@
 """
 Módulo de Estadística Inferencial
 Contiene todas las funciones para probabilidades y distribuciones
+
+Además de los métodos que devuelven resultados con fórmulas y textos, cada
+distribución tiene una versión por lotes (pmf_many o pdf_many, cdf_many,
+ppf_many, interval_many) que recibe arreglos y devuelve arreglos.
 """
 
 from .probabilidades import ProbabilidadesElementales
 
 from .distribuciones import (
     DistribucionBernoulli,
-    DistribucionBinomial
+    DistribucionBinomial,
+    masa_binomial,
+    acumulada_binomial,
+    supervivencia_binomial
 )
 
 from .distribucion_normal import DistribucionNormal
 
-from .distribucion_poisson import DistribucionPoisson
+from .tabla_normal import (
+    acumulada_z,
+    cuantil_z,
+    valor_z_critico,
+    tabla_z
+)
+
+from .valores_criticos import (
+    valores_criticos,
+    valores_criticos_gl,
+    z_critico,
+    t_critico,
+    chi2_criticos,
+    f_criticos
+)
+
+from .distribucion_poisson import (
+    DistribucionPoisson,
+    masa_poisson,
+    acumulada_poisson,
+    supervivencia_poisson,
+    intervalo_poisson
+)
 
 from .regresion_correlacion import (
     CorrelacionLineal,
@@ -35,9 +64,26 @@ __all__ = [
     'DistribucionBernoulli',
     'DistribucionBinomial',
     'DistribucionPoisson',
+    'masa_binomial',
+    'acumulada_binomial',
+    'supervivencia_binomial',
+    'masa_poisson',
+    'acumulada_poisson',
+    'supervivencia_poisson',
+    'intervalo_poisson',
     
     # Distribuciones continuas
     'DistribucionNormal',
+    'acumulada_z',
+    'cuantil_z',
+    'valor_z_critico',
+    'tabla_z',
+    'valores_criticos',
+    'valores_criticos_gl',
+    'z_critico',
+    't_critico',
+    'chi2_criticos',
+    'f_criticos',
     
     # Regresión y correlación
     'CorrelacionLineal',
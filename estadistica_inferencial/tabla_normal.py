@@ -0,0 +1,122 @@
+"""
+Tabla Normal - Tabla Z precalculada con interpolación, compartida por la estadística inferencial
+"""
+from bisect import bisect_right
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+# Malla de la tabla: z de -Z_MAXIMO_TABLA a Z_MAXIMO_TABLA cada PASO_TABLA.
+# Fuera de ese rango (colas con probabilidad < 1e-9) se usa el cálculo exacto.
+Z_MAXIMO_TABLA = 6.0
+PASO_TABLA = 1e-3
+
+_Z = np.linspace(-Z_MAXIMO_TABLA, Z_MAXIMO_TABLA, int(round(2 * Z_MAXIMO_TABLA / PASO_TABLA)) + 1)
+_ACUMULADA = ndtr(_Z)
+_DENSIDAD = np.exp(-0.5 * _Z * _Z) / np.sqrt(2 * np.pi)
+# Copias como listas de Python: para un solo valor evitan el costo fijo de numpy
+_Z_LISTA, _ACUMULADA_LISTA, _DENSIDAD_LISTA = _Z.tolist(), _ACUMULADA.tolist(), _DENSIDAD.tolist()
+
+
+def _hermite(t, y0, y1, d0, d1, ancho):
+    """Interpolación cúbica de Hermite entre dos nodos con valores y derivadas conocidos"""
+    t2 = t * t
+    t3 = t2 * t
+    return ((2 * t3 - 3 * t2 + 1) * y0 + (t3 - 2 * t2 + t) * ancho * d0
+            + (-2 * t3 + 3 * t2) * y1 + (t3 - t2) * ancho * d1)
+
+
+def _es_escalar(valor):
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def acumulada_z(z):
+    """
+    Φ(z) = P(Z ≤ z) desde la tabla precalculada
+
+    Entre dos nodos se interpola con Hermite cúbico usando la densidad φ
+    como derivada (error < 1e-13); fuera de la tabla se calcula exacto.
+    Acepta un número o un arreglo.
+    """
+    if _es_escalar(z):
+        if not -Z_MAXIMO_TABLA <= z <= Z_MAXIMO_TABLA:
+            return float(ndtr(z))
+        posicion = (z + Z_MAXIMO_TABLA) / PASO_TABLA
+        i = min(int(posicion), len(_Z_LISTA) - 2)
+        return _hermite(posicion - i, _ACUMULADA_LISTA[i], _ACUMULADA_LISTA[i + 1],
+                        _DENSIDAD_LISTA[i], _DENSIDAD_LISTA[i + 1], PASO_TABLA)
+
+    valores = np.asarray(z, dtype=float)
+    posicion = (valores + Z_MAXIMO_TABLA) / PASO_TABLA
+    i = np.clip(np.floor(posicion).astype(np.int64), 0, len(_Z) - 2)
+    t = posicion - i
+    interpolado = _hermite(t, _ACUMULADA[i], _ACUMULADA[i + 1], _DENSIDAD[i], _DENSIDAD[i + 1], PASO_TABLA)
+    # Fuera de la tabla (o NaN) se usa el cálculo exacto
+    resultado = np.where(np.abs(valores) <= Z_MAXIMO_TABLA, interpolado, ndtr(valores))
+    return float(resultado) if np.ndim(z) == 0 else resultado
+
+
+def cuantil_z(probabilidades):
+    """
+    z tal que Φ(z) = p desde la tabla precalculada (búsqueda binaria e
+    interpolación de Hermite de la función inversa, con derivada 1/φ);
+    en las colas fuera de la tabla se calcula exacto. NaN fuera de [0, 1].
+
+    Se busca siempre la cola izquierda, min(p, 1 - p), y se usa la simetría
+    z(p) = -z(1 - p): cerca de 1 los valores de Φ pierden dígitos.
+    """
+    if _es_escalar(probabilidades):
+        p = probabilidades
+        if not 0 <= p <= 1:
+            return np.nan
+        q = min(p, 1 - p)
+        if q < _ACUMULADA_LISTA[0]:
+            return float(ndtri(p))
+        i = min(bisect_right(_ACUMULADA_LISTA, q) - 1, len(_Z_LISTA) - 2)
+        ancho = _ACUMULADA_LISTA[i + 1] - _ACUMULADA_LISTA[i]
+        z = _hermite((q - _ACUMULADA_LISTA[i]) / ancho, _Z_LISTA[i], _Z_LISTA[i + 1],
+                     1 / _DENSIDAD_LISTA[i], 1 / _DENSIDAD_LISTA[i + 1], ancho)
+        return z if p <= 0.5 else -z
+
+    p = np.asarray(probabilidades, dtype=float)
+    q = np.minimum(p, 1 - p)
+    i = np.clip(np.searchsorted(_ACUMULADA, q, side='right') - 1, 0, len(_Z) - 2)
+    ancho = _ACUMULADA[i + 1] - _ACUMULADA[i]
+    t = (q - _ACUMULADA[i]) / ancho
+    interpolado = _hermite(t, _Z[i], _Z[i + 1], 1 / _DENSIDAD[i], 1 / _DENSIDAD[i + 1], ancho)
+    interpolado = np.where(p <= 0.5, interpolado, -interpolado)
+    # Colas fuera de la tabla: cálculo exacto
+    resultado = np.where(q >= _ACUMULADA[0], interpolado, ndtri(np.where((p >= 0) & (p <= 1), p, np.nan)))
+    return float(resultado) if np.ndim(probabilidades) == 0 else resultado
+
+
+def valor_z_critico(nivel_confianza):
+    """
+    Z(α/2) bilateral: P(-z ≤ Z ≤ z) = nivel_confianza (entre 0 y 1);
+    acepta un número o un arreglo de niveles
+    """
+    nivel = np.asarray(nivel_confianza, dtype=float)
+    if np.any((nivel <= 0) | (nivel >= 1)):
+        raise ValueError('El nivel de confianza debe estar entre 0 y 1')
+    return cuantil_z(1 - (1 - nivel_confianza) / 2)
+
+
+def tabla_z(z_min=-3, z_max=3, paso=0.5, mu=0, sigma=1):
+    """
+    Tabla de valores Z y sus probabilidades, construida con operaciones
+    vectorizadas sobre todos los z a la vez
+
+    mu, sigma: para agregar el valor X = μ + z·σ de una normal no estándar
+    """
+    z_valores = np.arange(z_min, z_max + paso, paso)
+    prob_menor = acumulada_z(z_valores)
+    # La cola derecha por simetría, sin restar de 1
+    prob_mayor = acumulada_z(-z_valores)
+
+    return pd.DataFrame({
+        'Z': np.round(z_valores, 2),
+        'X': np.round(mu + z_valores * sigma, 2),
+        'P(Z ≤ z)': np.round(prob_menor, 4),
+        'P(Z > z)': np.round(prob_mayor, 4),
+        '%': [f'{v:.1f}%' for v in (prob_menor * 100).tolist()]
+    })
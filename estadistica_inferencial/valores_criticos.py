@@ -0,0 +1,118 @@
+"""
+Valores Críticos - Cuantiles z, t, χ² y F con caché, compartidos por los intervalos de confianza
+"""
+from functools import lru_cache
+import numpy as np
+from scipy.special import chdtri, fdtri, stdtrit
+from estadistica_inferencial.tabla_normal import cuantil_z
+
+DISTRIBUCIONES_CRITICAS = {
+    'z': 'Normal estándar (sin grados de libertad)',
+    't': 't de Student con gl grados de libertad',
+    'chi2': 'Chi-cuadrado con gl grados de libertad',
+    'f': 'F de Fisher con gl (numerador) y gl2 (denominador) grados de libertad'
+}
+
+# Lo que se precalcula al importar: niveles usuales y gl de 1 a GL_PRECALENTADOS
+NIVELES_COMUNES = (0.80, 0.90, 0.95, 0.98, 0.99)
+GL_PRECALENTADOS = 120
+
+
+def _validar(distribucion, nivel_confianza, gl, gl2):
+    if distribucion not in DISTRIBUCIONES_CRITICAS:
+        raise ValueError(f"Distribución '{distribucion}' no válida. Use: {', '.join(DISTRIBUCIONES_CRITICAS)}")
+    if not np.all((np.asarray(nivel_confianza) > 0) & (np.asarray(nivel_confianza) < 1)):
+        raise ValueError('El nivel de confianza debe estar entre 0 y 1')
+    if distribucion != 'z' and (gl is None or not np.all(np.asarray(gl) > 0)):
+        raise ValueError('Los grados de libertad deben ser mayores que 0')
+    if distribucion == 'f' and (gl2 is None or not np.all(np.asarray(gl2) > 0)):
+        raise ValueError('La F necesita gl2 (grados de libertad del denominador) mayores que 0')
+
+
+def _calcular(distribucion, nivel_confianza, gl, gl2):
+    """
+    (inferior, superior) bilaterales: P(inferior ≤ X ≤ superior) = nivel,
+    con α/2 en cada cola. Llama directo a scipy.special, sin crear objetos
+    de scipy.stats, y acepta arreglos de gl.
+    """
+    alfa_2 = (1 - np.asarray(nivel_confianza, dtype=float)) / 2
+    if distribucion == 'z':
+        superior = cuantil_z(1 - alfa_2)
+        return -superior, superior
+    if distribucion == 't':
+        superior = stdtrit(gl, 1 - alfa_2)
+        return -superior, superior
+    if distribucion == 'chi2':
+        # chdtri recibe la cola derecha
+        return chdtri(gl, 1 - alfa_2), chdtri(gl, alfa_2)
+    return fdtri(gl, gl2, alfa_2), fdtri(gl, gl2, 1 - alfa_2)
+
+
+@lru_cache(maxsize=4096)
+def _valores_criticos_en_cache(distribucion, nivel_confianza, gl, gl2):
+    _validar(distribucion, nivel_confianza, gl, gl2)
+    inferior, superior = _calcular(distribucion, nivel_confianza, gl, gl2)
+    return float(inferior), float(superior)
+
+
+def valores_criticos(distribucion, nivel_confianza, gl=None, gl2=None):
+    """
+    (inferior, superior) bilaterales de la distribución para el nivel de
+    confianza (entre 0 y 1), guardados en una caché LRU por
+    (distribución, nivel, gl, gl2): recalcular con los mismos datos en cada
+    tecla no vuelve a evaluar nada
+
+    distribucion: 'z', 't', 'chi2' o 'f' (ver DISTRIBUCIONES_CRITICAS)
+    """
+    # Redondear unifica niveles iguales escritos distinto (0.95 y 1 - 0.05);
+    # la validación solo corre cuando el valor no está en la caché
+    return _valores_criticos_en_cache(distribucion, round(float(nivel_confianza), 12),
+                                      None if gl is None else float(gl),
+                                      None if gl2 is None else float(gl2))
+
+
+def z_critico(nivel_confianza):
+    """Z(α/2) bilateral"""
+    return valores_criticos('z', nivel_confianza)[1]
+
+
+def t_critico(nivel_confianza, gl):
+    """t(α/2, gl) bilateral"""
+    return valores_criticos('t', nivel_confianza, gl)[1]
+
+
+def chi2_criticos(nivel_confianza, gl):
+    """(χ²(1-α/2, gl), χ²(α/2, gl)): los valores de la cola izquierda y derecha"""
+    return valores_criticos('chi2', nivel_confianza, gl)
+
+
+def f_criticos(nivel_confianza, gl1, gl2):
+    """(F(1-α/2; gl1, gl2), F(α/2; gl1, gl2)): los valores de la cola izquierda y derecha"""
+    return valores_criticos('f', nivel_confianza, gl1, gl2)
+
+
+def valores_criticos_gl(distribucion, nivel_confianza, gl=None, gl2=None):
+    """
+    Versión vectorizada, sin caché: gl, gl2 y el nivel pueden ser arreglos
+    (se combinan con broadcasting de numpy), ej. toda una tabla t de una vez
+
+    Retorna (inferior, superior) como arreglos.
+    """
+    _validar(distribucion, nivel_confianza, gl, gl2)
+    if distribucion != 'z':
+        gl = np.asarray(gl, dtype=float)
+    if distribucion == 'f':
+        gl2 = np.asarray(gl2, dtype=float)
+    return _calcular(distribucion, nivel_confianza, gl, gl2)
+
+
+def precalentar(niveles=NIVELES_COMUNES, gl_maximo=GL_PRECALENTADOS):
+    """Llena la caché con z, t y χ² para los niveles dados y gl de 1 a gl_maximo"""
+    for nivel in niveles:
+        z_critico(nivel)
+        for gl in range(1, gl_maximo + 1):
+            t_critico(nivel, gl)
+            chi2_criticos(nivel, gl)
+
+
+precalentar()
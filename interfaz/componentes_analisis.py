@@ -8,6 +8,7 @@ import pandas as pd
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from config_interfaz import *
+from estadistica_descriptiva.estadisticas_incrementales import EstadisticasIncrementales
 from utils.tooltip import crear_tooltip
 
 
@@ -32,6 +33,10 @@ class VentanaAnalisis(tk.Toplevel):
         
         self.geometry(f"{window_width}x{window_height}+{x}+{y}")
         self.datos = datos
+        # Estadísticas que se actualizan solo con las filas agregadas; los datos
+        # ya están en memoria, así que toda columna guarda su tabla de frecuencias
+        # (las pantallas de cuadros, modas y percentiles la necesitan)
+        self.estadisticas = EstadisticasIncrementales(datos, frecuencias=True) if datos is not None else None
         
         # Configurar ventana para que sea responsive
         self.grid_rowconfigure(0, weight=1)
@@ -196,6 +201,34 @@ class VentanaAnalisis(tk.Toplevel):
             btn_random.bind("<Leave>", on_leave_random)
             
             crear_tooltip(btn_random, "🎲 Genera datos aleatorios para probar sin CSV")
+            
+            # Botón Agregar Filas con diseño Material
+            btn_agregar = tk.Button(
+                btn_inner_container,
+                text="➕ Agregar Filas",
+                command=self.agregar_datos,
+                bg="#03A9F4",
+                fg="#000000",
+                font=("Helvetica", 11, "bold"),
+                relief="flat",
+                cursor="hand2",
+                padx=25,
+                pady=12,
+                activebackground="#4FC3F7",
+                activeforeground="#000000",
+                borderwidth=0
+            )
+            btn_agregar.pack(side='left', padx=8)
+            
+            # Efecto hover
+            def on_enter_agregar(e):
+                btn_agregar['bg'] = '#4FC3F7'
+            def on_leave_agregar(e):
+                btn_agregar['bg'] = '#03A9F4'
+            btn_agregar.bind("<Enter>", on_enter_agregar)
+            btn_agregar.bind("<Leave>", on_leave_agregar)
+            
+            crear_tooltip(btn_agregar, "➕ Agrega un nuevo lote de filas (CSV) a los datos cargados")
         
         # ===== CONTENEDOR CON PESTAÑAS MEJORADO =====
         # Estilo personalizado para las pestañas
@@ -449,7 +482,7 @@ class VentanaAnalisis(tk.Toplevel):
         if ruta:
             try:
                 from utils.cargar_datos import importar_csv
-                self.datos = importar_csv(ruta)
+                self.establecer_datos(importar_csv(ruta))
                 
                 info = f"✅ ARCHIVO CARGADO CORRECTAMENTE\n\n"
                 info += f"Archivo: {ruta.split('/')[-1]}\n"
@@ -463,6 +496,43 @@ class VentanaAnalisis(tk.Toplevel):
             except Exception as e:
                 messagebox.showerror("Error", f"❌ No se pudo cargar el archivo:\n\n{str(e)}")
     
+    def establecer_datos(self, datos):
+        """Reemplaza los datos y reinicia sus estadísticas incrementales"""
+        self.datos = datos
+        self.estadisticas = EstadisticasIncrementales(datos, frecuencias=True)
+    
+    def resumen_columna(self, columna):
+        """
+        Resumen de una columna para las funciones de estadística: se
+        actualiza solo con las filas agregadas, sin recorrer todos los datos
+        """
+        return self.estadisticas.resumen(columna)
+    
+    def agregar_datos(self):
+        """Agrega las filas de otro CSV; las estadísticas solo procesan las filas nuevas"""
+        if self.datos is None:
+            self.cargar_datos()
+            return
+        ruta = filedialog.askopenfilename(
+            title="Seleccionar archivo CSV con filas nuevas",
+            filetypes=[("Archivos CSV", "*.csv"), ("Todos los archivos", "*.*")]
+        )
+        if ruta:
+            try:
+                from utils.cargar_datos import importar_csv
+                nuevas = importar_csv(ruta)
+                self.datos = pd.concat([self.datos, nuevas], ignore_index=True)
+                self.estadisticas.agregar_filas(nuevas)
+                
+                info = f"✅ FILAS AGREGADAS CORRECTAMENTE\n\n"
+                info += f"Archivo: {ruta.split('/')[-1]}\n"
+                info += f"Filas nuevas: {len(nuevas)}\n"
+                info += f"Total de filas: {len(self.datos)}\n"
+                
+                messagebox.showinfo("Éxito", info)
+            except Exception as e:
+                messagebox.showerror("Error", f"❌ No se pudieron agregar las filas:\n\n{str(e)}")
+    
     def generar_datos_random(self):
         """Genera datos aleatorios para pruebas"""
         try:
@@ -524,7 +594,7 @@ class VentanaAnalisis(tk.Toplevel):
                     
                     # Generar datos aleatorios
                     edades = np.random.randint(valor_min, valor_max + 1, cantidad)
-                    self.datos = pd.DataFrame({'Edad': edades})
+                    self.establecer_datos(pd.DataFrame({'Edad': edades}))
                     
                     info = f"✅ DATOS ALEATORIOS GENERADOS\n\n"
                     info += f"Cantidad de datos: {cantidad}\n"
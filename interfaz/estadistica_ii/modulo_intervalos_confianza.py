@@ -6,9 +6,8 @@ import tkinter as tk
 from statistics import mean, stdev
 from tkinter import ttk
 
-from scipy import stats
-
 from config_interfaz import *
+from estadistica_inferencial.valores_criticos import chi2_criticos, t_critico, z_critico
 
 
 def _centrar_ventana(ventana, proporcion_w=0.9, proporcion_h=0.88):
@@ -526,7 +525,7 @@ class VentanaIntervalosConfianza:
             raise ValueError("n debe ser mayor que 0 y σ no puede ser negativa.")
         alpha = 1 - nc
         alpha_2 = alpha / 2
-        z = stats.norm.ppf(1 - alpha_2)
+        z = z_critico(nc)
         se = sigma / math.sqrt(n)
         e = z * se
         li = media - e
@@ -601,7 +600,7 @@ class VentanaIntervalosConfianza:
             estado = nota if n >= 30 else ""
         alpha = 1 - nc
         df = n - 1
-        t_crit = stats.t.ppf(1 - alpha / 2, df)
+        t_crit = t_critico(nc, df)
         se = s / math.sqrt(n)
         e = t_crit * se
         li = media - e
@@ -651,7 +650,7 @@ class VentanaIntervalosConfianza:
         alpha = 1 - nc
         alpha_2 = alpha / 2
         q_hat = 1 - p_hat
-        z = stats.norm.ppf(1 - alpha_2)
+        z = z_critico(nc)
         se = math.sqrt((p_hat * q_hat) / n)
         e = z * se
         li = p_hat - e
@@ -698,8 +697,7 @@ class VentanaIntervalosConfianza:
         alpha = 1 - nc
         alpha_2 = alpha / 2
         df = n - 1
-        chi_right = stats.chi2.ppf(1 - alpha_2, df)
-        chi_left = stats.chi2.ppf(alpha_2, df)
+        chi_left, chi_right = chi2_criticos(nc, df)
         li = (df * s2) / chi_right
         ls = (df * s2) / chi_left
         return {
@@ -745,7 +743,7 @@ class VentanaIntervalosConfianza:
         nc = _normalizar_confianza(valores["nc"])
         alpha = 1 - nc
         alpha_2 = alpha / 2
-        z = stats.norm.ppf(1 - alpha_2)
+        z = z_critico(nc)
         se = math.sqrt((valores["sigma1"] ** 2) / valores["n1"] + (valores["sigma2"] ** 2) / valores["n2"])
         dif = valores["x1"] - valores["x2"]
         e = z * se
@@ -795,7 +793,7 @@ class VentanaIntervalosConfianza:
         nc = _normalizar_confianza(valores["nc"])
         df = valores["n1"] + valores["n2"] - 2
         sp2 = (((valores["n1"] - 1) * (valores["s1"] ** 2)) + ((valores["n2"] - 1) * (valores["s2"] ** 2))) / df
-        t_crit = stats.t.ppf(1 - (1 - nc) / 2, df)
+        t_crit = t_critico(nc, df)
         se = math.sqrt(sp2 * ((1 / valores["n1"]) + (1 / valores["n2"])))
         dif = valores["x1"] - valores["x2"]
         e = t_crit * se
@@ -850,7 +848,7 @@ class VentanaIntervalosConfianza:
         v = math.floor(numerador / denominador)
         if v <= 0:
             raise ValueError("Los grados de libertad de Welch no pudieron calcularse.")
-        t_crit = stats.t.ppf(1 - (1 - nc) / 2, v)
+        t_crit = t_critico(nc, v)
         se = math.sqrt(A + B)
         dif = valores["x1"] - valores["x2"]
         e = t_crit * se
@@ -904,7 +902,7 @@ class VentanaIntervalosConfianza:
             estado = ""
         alpha = 1 - nc
         alpha_2 = alpha / 2
-        z = stats.norm.ppf(1 - alpha_2)
+        z = z_critico(nc)
         se = math.sqrt((valores["s1"] ** 2) / valores["n1"] + (valores["s2"] ** 2) / valores["n2"])
         dif = valores["x1"] - valores["x2"]
         e = z * se
@@ -1065,9 +1063,8 @@ class VentanaIntervalosConfianza:
                         raise ValueError("n debe ser mayor que 1 y sd no puede ser negativa.")
 
                 nc = _normalizar_confianza(nc_var.get())
-                alpha = 1 - nc
                 df = n - 1
-                t_crit = stats.t.ppf(1 - alpha / 2, df)
+                t_crit = t_critico(nc, df)
                 se = sd / math.sqrt(n)
                 e = t_crit * se
                 li = dbar - e
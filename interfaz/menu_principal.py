@@ -13,10 +13,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from config_interfaz import *
 from estadistica_descriptiva.analisis_estadistico import calcular_tendencia_central, generar_dfs, generar_dfsvai
-from estadistica_descriptiva.medidas_posicion import generar_tabla_posicion, crear_boxplot
+from estadistica_descriptiva.medidas_posicion import generar_tabla_posicion, intervalos_percentiles, crear_boxplot
 from estadistica_descriptiva.medidas_dispersión import generar_tabla_dispersion, graficar_dispersion
 from estadistica_descriptiva.medidas_forma import analisis_completo_forma, generar_tabla_forma, graficar_forma
 from estadistica_descriptiva.graficas import graficar_frecuencia
+from estadistica_descriptiva.modas import calcular_modas
+from estadistica_descriptiva.distribucion_empirica import DistribucionEmpirica
+from estadistica_inferencial.distribucion_normal import DistribucionNormal
 from utils.tooltip import crear_tooltip
 from interfaz.componentes_analisis import VentanaAnalisis, crear_panel_instrucciones
 from interfaz.menu_inferencial_mixin import MenuInferencialMixin
@@ -363,12 +366,14 @@ class MenuPrincipal(MenuInferencialMixin):
                 datos_edad = ventana.datos['Edad'].dropna()
                 
                 # ========== CALCULAR TODO ==========
+                resumen_edad = ventana.resumen_columna('Edad')
+                
                 # Tendencia central
-                tendencia = calcular_tendencia_central(datos_edad)
+                tendencia = calcular_tendencia_central(resumen_edad)
                 
                 # Cuadros de frecuencia
-                dfs = generar_dfs(datos_edad)
-                dfsvai = generar_dfsvai(datos_edad)
+                dfs = generar_dfs(resumen_edad)
+                dfsvai = generar_dfsvai(resumen_edad)
                 
                 # ========== CREAR NOTEBOOK CON PESTAÑAS ==========
                 # Limpiar notebook si ya existe
@@ -661,8 +666,9 @@ class MenuPrincipal(MenuInferencialMixin):
                 datos_edad = ventana.datos['Edad'].dropna()
                 
                 # Generar cuadros
-                dfs = generar_dfs(datos_edad)
-                dfsvai = generar_dfsvai(datos_edad)
+                resumen_edad = ventana.resumen_columna('Edad')
+                dfs = generar_dfs(resumen_edad)
+                dfsvai = generar_dfsvai(resumen_edad)
                 
                 # ============= FORMATEAR RESULTADOS CON ESTILO =============
                 resultado = ""
@@ -746,7 +752,7 @@ class MenuPrincipal(MenuInferencialMixin):
             
             try:
                 datos_edad = ventana.datos['Edad'].dropna()
-                tendencia = calcular_tendencia_central(datos_edad)
+                tendencia = calcular_tendencia_central(ventana.resumen_columna('Edad'))
                 
                 # Crear ventana emergente con resultados
                 ventana_tend = tk.Toplevel(ventana)
@@ -786,7 +792,11 @@ class MenuPrincipal(MenuInferencialMixin):
                     ('📐 Media Geométrica', tendencia['Media Geométrica'], 
                      'Raíz n del producto'),
                     ('⚖️ Media Armónica', tendencia['Media Armónica'], 
-                     'Para promedios de tasas')
+                     'Para promedios de tasas'),
+                    ('✂️ Media Recortada', tendencia['Media Recortada (10%)'], 
+                     'Sin el 10% de cada extremo'),
+                    ('🧱 Media Winsorizada', tendencia['Media Winsorizada (10%)'], 
+                     'Extremos reemplazados (10%)')
                 ]
                 
                 for medida, valor, desc in medidas_info:
@@ -928,7 +938,9 @@ class MenuPrincipal(MenuInferencialMixin):
                 datos_edad = ventana.datos['Edad'].dropna()
                 
                 # Calcular medidas
-                tendencia = calcular_tendencia_central(datos_edad)
+                resumen_edad = ventana.resumen_columna('Edad')
+                tendencia = calcular_tendencia_central(resumen_edad)
+                info_moda = calcular_modas(resumen_edad)
                 
                 # ============= FORMATEAR RESULTADOS CON ESTILO =============
                 resultado = ""
@@ -950,7 +962,11 @@ class MenuPrincipal(MenuInferencialMixin):
                     ('📐 Media Geométrica', tendencia['Media Geométrica'], 
                      'Raíz n-ésima del producto de n valores'),
                     ('⚖️ Media Armónica', tendencia['Media Armónica'], 
-                     'Recíproco de la media de recíprocos')
+                     'Recíproco de la media de recíprocos'),
+                    ('✂️ Media Recortada (10%)', tendencia['Media Recortada (10%)'], 
+                     'Promedio sin el 10% menor ni el 10% mayor'),
+                    ('🧱 Media Winsorizada (10%)', tendencia['Media Winsorizada (10%)'], 
+                     'Promedio con los extremos reemplazados por P10 y P90')
                 ]
                 
                 for medida, valor, desc in medidas_display:
@@ -968,7 +984,11 @@ class MenuPrincipal(MenuInferencialMixin):
                 
                 resultado += f"  ✓ El valor promedio es: {media:.2f}\n"
                 resultado += f"  ✓ El 50% de los datos están por debajo de: {mediana:.2f}\n"
-                resultado += f"  ✓ Los valores más frecuentes son: {tendencia['Moda']}\n\n"
+                if info_moda['tipo'] == 'amodal':
+                    resultado += f"  ✓ Ningún valor se repite; moda estimada por clases: {tendencia['Moda']}\n\n"
+                else:
+                    resultado += f"  ✓ Los valores más frecuentes son: {tendencia['Moda']} "
+                    resultado += f"({info_moda['frecuencia']} veces cada uno, distribución {info_moda['tipo'].upper()})\n\n"
                 
                 resultado += "  📊 ANÁLISIS DE SIMETRÍA:\n"
                 if abs(media - mediana) < 0.1:
@@ -1075,6 +1095,7 @@ class MenuPrincipal(MenuInferencialMixin):
    ✓ Deciles (D1-D9) → Dividen datos en 10 partes iguales
    ✓ Percentiles (P10, P25, P50, P75, P90) → Dividen en 100 partes
    ✓ Rango Intercuartílico (IQR) → Dispersión del 50% central
+   ✓ Intervalos de confianza (95%) de los percentiles P5-P99
 
 📈 GRÁFICO INCLUIDO:
    • Diagrama de Caja (Boxplot) con cuartiles y valores atípicos
@@ -1104,8 +1125,10 @@ class MenuPrincipal(MenuInferencialMixin):
             try:
                 datos_edad = ventana.datos['Edad'].dropna()
                 
+                resumen = ventana.resumen_columna('Edad')
+                
                 # Generar tabla
-                tabla = generar_tabla_posicion(datos_edad)
+                tabla = generar_tabla_posicion(resumen)
                 
                 # Formatear resultados
                 resultado = "=" * 120 + "\n"
@@ -1113,6 +1136,13 @@ class MenuPrincipal(MenuInferencialMixin):
                 resultado += "=" * 120 + "\n\n"
                 resultado += tabla.to_string(index=False) + "\n\n"
                 
+                # Intervalos sin suponer distribución (estadísticos de orden)
+                intervalos = intervalos_percentiles(resumen, [5, 10, 25, 50, 75, 90, 95, 99], confianza=0.95)
+                resultado += "=" * 120 + "\n"
+                resultado += "INTERVALOS DE CONFIANZA DE LOS PERCENTILES (95%, sin suponer distribución)\n"
+                resultado += "=" * 120 + "\n\n"
+                resultado += intervalos.to_string(index=False) + "\n\n"
+                
                 resultado += "=" * 120 + "\n"
                 resultado += "INTERPRETACIÓN\n"
                 resultado += "=" * 120 + "\n\n"
@@ -1120,6 +1150,8 @@ class MenuPrincipal(MenuInferencialMixin):
                 resultado += "• Los deciles dividen los datos en 10 partes iguales (10% cada una)\n"
                 resultado += "• Los percentiles dividen los datos en 100 partes iguales (1% cada una)\n"
                 resultado += "• El rango intercuartílico (IQR) contiene el 50% central de los datos\n"
+                resultado += "• Cada intervalo contiene el percentil poblacional con al menos 95% de confianza;\n"
+                resultado += "  un límite vacío (NaN) indica que faltan datos en esa cola\n"
                 
                 ventana.mostrar_texto(resultado)
                 
@@ -1201,8 +1233,10 @@ class MenuPrincipal(MenuInferencialMixin):
             try:
                 datos_edad = ventana.datos['Edad'].dropna()
                 
+                resumen = ventana.resumen_columna('Edad')
+                
                 # Generar tabla
-                tabla = generar_tabla_dispersion(datos_edad)
+                tabla = generar_tabla_dispersion(resumen)
                 
                 # Formatear resultados
                 resultado = "=" * 120 + "\n"
@@ -1268,6 +1302,7 @@ class MenuPrincipal(MenuInferencialMixin):
 📊 MEDIDAS QUE SE CALCULAN:
    ✓ Coeficiente de Asimetría (Skewness)
    ✓ Coeficiente de Curtosis (Kurtosis)
+   ✓ Comparación con la normal (regla empírica 68-95-99.7)
    
 📈 INTERPRETACIÓN ASIMETRÍA:
    • = 0 → Distribución simétrica (normal)
@@ -1304,9 +1339,11 @@ class MenuPrincipal(MenuInferencialMixin):
             try:
                 datos_edad = ventana.datos['Edad'].dropna()
                 
+                resumen = ventana.resumen_columna('Edad')
+                
                 # Generar tabla y análisis
-                tabla = generar_tabla_forma(datos_edad)
-                analisis = analisis_completo_forma(datos_edad)
+                tabla = generar_tabla_forma(resumen)
+                analisis = analisis_completo_forma(resumen)
                 
                 # Formatear resultados
                 resultado = "=" * 120 + "\n"
@@ -1341,6 +1378,16 @@ class MenuPrincipal(MenuInferencialMixin):
                 else:
                     resultado += "   ⚠️  La distribución NO es normal\n"
                 
+                # Distribución empírica contra la normal ajustada (regla empírica)
+                distribucion = DistribucionEmpirica(resumen)
+                normal = DistribucionNormal(float(resumen.media), float(resumen.desviacion_estandar()))
+                resultado += "\n" + "=" * 120 + "\n"
+                resultado += "COMPARACIÓN CON LA DISTRIBUCIÓN NORMAL (μ ± σ, μ ± 2σ, μ ± 3σ)\n"
+                resultado += "=" * 120 + "\n\n"
+                resultado += distribucion.comparar_normal(normal).to_string(index=False) + "\n\n"
+                resultado += f"   Máxima diferencia entre las acumuladas (Kolmogorov–Smirnov): "
+                resultado += f"{distribucion.distancia_ks(normal.distribucion):.4f}\n"
+                
                 ventana.mostrar_texto(resultado)
                 
                 # Generar gráfico
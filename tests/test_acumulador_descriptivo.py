@@ -0,0 +1,69 @@
+"""
+Acumulador por bloques: combinar momentos y frecuencias de bloques o
+particiones debe dar lo mismo que una sola pasada sobre todos los datos
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.acumulador_descriptivo import (
+    AcumuladorDescriptivo, analizar_csv_por_bloques, analizar_particiones
+)
+from estadistica_descriptiva.medias import calcular_medias
+
+
+def _comparar_con_una_pasada(acumulador, datos):
+    assert acumulador.n == len(datos)
+    np.testing.assert_allclose(acumulador.media, datos.mean(), rtol=1e-12)
+    np.testing.assert_allclose(acumulador.varianza(), datos.var(ddof=1), rtol=1e-10)
+    np.testing.assert_allclose(acumulador.asimetria(), stats.skew(datos), atol=1e-10)
+    np.testing.assert_allclose(acumulador.curtosis(), stats.kurtosis(datos), atol=1e-10)
+    assert (acumulador.minimo, acumulador.maximo) == (datos.min(), datos.max())
+
+
+def test_bloques_desiguales_y_desplazados():
+    # Media lejos de 0 y bloques de tamaños distintos: pone a prueba la combinación de Chan/Pébay
+    datos = 1e6 + np.random.default_rng(0).gamma(2, 3, 100_003)
+    acumulador = AcumuladorDescriptivo(frecuencias=False)
+    for bloque in np.array_split(datos, [7, 5_000, 5_001, 60_000]):
+        acumulador.actualizar(bloque)
+    _comparar_con_una_pasada(acumulador, datos)
+
+
+def test_particiones_con_frecuencias():
+    datos = np.random.default_rng(1).integers(15, 70, 50_000)
+    combinado = analizar_particiones(np.array_split(datos, 6), procesos=1)
+    _comparar_con_una_pasada(combinado, datos.astype(float))
+
+    valores, conteos = np.unique(datos, return_counts=True)
+    np.testing.assert_array_equal(combinado.valores_frecuencia, valores)
+    np.testing.assert_array_equal(combinado.conteos, conteos)
+    probabilidades = [0.1, 0.25, 0.5, 0.75, 0.9]
+    np.testing.assert_allclose(combinado.cuantiles(probabilidades), np.quantile(datos, probabilidades))
+
+
+def test_csv_por_bloques(tmp_path):
+    datos = np.random.default_rng(2).normal(20, 4, 10_000)
+    ruta = tmp_path / 'datos.csv'
+    pd.DataFrame({'Calificacion': datos, 'Otra': 1}).to_csv(ruta, index=False)
+
+    acumulador = analizar_csv_por_bloques(ruta, 'Calificacion', tamano_bloque=999, frecuencias=False)
+    _comparar_con_una_pasada(acumulador, pd.read_csv(ruta)['Calificacion'].to_numpy())
+
+
+def test_medias_sin_frecuencias():
+    datos = np.random.default_rng(3).lognormal(1, 0.5, 20_000)
+    acumulador = AcumuladorDescriptivo(frecuencias=False)
+    for bloque in np.array_split(datos, 4):
+        acumulador.actualizar(bloque)
+
+    medias = calcular_medias(acumulador)
+    np.testing.assert_allclose(medias['geometrica'], stats.gmean(datos), rtol=1e-12)
+    np.testing.assert_allclose(medias['armonica'], stats.hmean(datos), rtol=1e-12)
+    # Sin frecuencias ni bosquejo no se pueden recortar los extremos
+    assert np.isnan(medias['recortada'])
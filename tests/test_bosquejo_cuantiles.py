@@ -0,0 +1,52 @@
+"""
+Bosquejo de cuantiles: el rango real de cada cuantil estimado debe quedar
+dentro del error pedido, también al combinar bosquejos de bloques distintos
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.bosquejo_cuantiles import BosquejoCuantiles
+
+PROBABILIDADES = np.linspace(0.01, 0.99, 99)
+
+
+def _error_de_rango(bosquejo, datos):
+    """Máxima diferencia entre la proporción de datos ≤ cuantil estimado y p"""
+    ordenados = np.sort(datos)
+    estimados = bosquejo.cuantiles(PROBABILIDADES)
+    rangos = np.searchsorted(ordenados, estimados, side='right') / len(datos)
+    return np.abs(rangos - PROBABILIDADES).max()
+
+
+def test_error_de_rango_y_memoria_acotada():
+    datos = np.random.default_rng(0).lognormal(size=200_000)
+    bosquejo = BosquejoCuantiles(0.01, semilla=1)
+    for bloque in np.array_split(datos, 13):
+        bosquejo.actualizar(bloque)
+
+    assert bosquejo.n == len(datos)
+    assert _error_de_rango(bosquejo, datos) <= 0.01
+    assert sum(len(nivel) for nivel in bosquejo.niveles) < 2_000
+    # Los extremos se conocen con exactitud
+    np.testing.assert_array_equal(bosquejo.cuantiles([0, 1]), [datos.min(), datos.max()])
+
+
+def test_combinar_bosquejos():
+    datos = np.random.default_rng(2).normal(size=150_000)
+    izquierdo = BosquejoCuantiles(0.01, semilla=3).actualizar(datos[:40_000])
+    derecho = BosquejoCuantiles(0.01, semilla=4).actualizar(datos[40_000:])
+    combinado = izquierdo.combinar(derecho)
+
+    assert combinado.n == len(datos)
+    assert _error_de_rango(combinado, datos) <= 0.01
+
+
+def test_misma_semilla_mismo_resultado():
+    datos = np.random.default_rng(5).exponential(size=50_000)
+    primero = BosquejoCuantiles(0.02, semilla=7).actualizar(datos).cuantiles(PROBABILIDADES)
+    segundo = BosquejoCuantiles(0.02, semilla=7).actualizar(datos).cuantiles(PROBABILIDADES)
+    np.testing.assert_array_equal(primero, segundo)
@@ -0,0 +1,68 @@
+"""
+Datos agrupados: las clases cuentan todos los datos igual que pd.cut, y los
+cuantiles de un cuadro agrupado siguen la fórmula Pk = Li + (k·n - F) / f · c
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.analisis_estadistico import generar_dfsvai
+from estadistica_descriptiva.datos_agrupados import ResumenAgrupado, resumen_desde_tabla
+from estadistica_descriptiva.intervalos_clase import agrupar_en_clases, calcular_bordes, contar_en_clases
+
+
+@pytest.mark.parametrize('clases', ['sturges', 'scott', 'fd', 7])
+def test_clases_cuentan_todos_los_datos(clases):
+    datos = np.random.default_rng(0).normal(50, 10, 1_000)
+    bordes, frecuencias = agrupar_en_clases(datos, clases)
+    assert len(frecuencias) == len(bordes) - 1
+    assert frecuencias.sum() == len(datos)
+    esperado = pd.Series(pd.cut(datos, bordes)).value_counts(sort=False).to_numpy()
+    np.testing.assert_array_equal(frecuencias, esperado)
+
+
+def test_conteo_con_pesos_y_cuadro():
+    valores = np.array([1.0, 2.5, 2.5, 4.0, 7.0, np.nan])
+    bordes = calcular_bordes(valores, amplitud=2)
+    distintos, conteos = np.unique(valores[~np.isnan(valores)], return_counts=True)
+    np.testing.assert_array_equal(contar_en_clases(distintos, bordes, pesos=conteos),
+                                  contar_en_clases(valores, bordes))
+
+    cuadro = generar_dfsvai(valores[~np.isnan(valores)], bins=bordes)
+    assert cuadro['Frecuencia'].sum() == 5
+    assert cuadro['Frecuencia Acumulada'].iloc[-1] == 5
+    assert cuadro['Frecuencia Relativa Acumulada'].iloc[-1] == 1
+
+
+def test_cuantiles_agrupados():
+    inferiores = np.array([10, 20, 30, 40])
+    superiores = inferiores + 10
+    frecuencias = np.array([5, 15, 20, 10])
+    resumen = ResumenAgrupado(inferiores, superiores, frecuencias)
+    acumuladas = np.cumsum(frecuencias)
+
+    for p in (0.1, 0.25, 0.5, 0.75, 0.9):
+        objetivo = p * frecuencias.sum()
+        clase = np.searchsorted(acumuladas, objetivo)
+        anterior = acumuladas[clase - 1] if clase else 0
+        esperado = inferiores[clase] + (objetivo - anterior) / frecuencias[clase] * 10
+        np.testing.assert_allclose(resumen.cuantiles([p])[0], esperado)
+
+    marcas = (inferiores + superiores) / 2
+    np.testing.assert_allclose(resumen.media, np.average(marcas, weights=frecuencias))
+    np.testing.assert_allclose(resumen.varianza(), np.cov(marcas, fweights=frecuencias))
+    with pytest.raises(ValueError):
+        resumen.cuantiles([0.5], metodo='nearest')
+
+
+def test_resumen_desde_cuadro_con_textos():
+    cuadro = pd.DataFrame({'Intervalo': ['(10, 20]', '(20, 30]', '(30, 40]'], 'Frecuencia': [2, 6, 2]})
+    resumen = resumen_desde_tabla(cuadro)
+    assert isinstance(resumen, ResumenAgrupado)
+    assert resumen.n == 10
+    np.testing.assert_allclose(resumen.mediana(), 25)
@@ -0,0 +1,62 @@
+"""
+Distribución empírica y densidad kernel: la ECDF debe coincidir con
+scipy.stats.ecdf y la densidad por FFT con scipy.stats.gaussian_kde
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.acumulador_descriptivo import AcumuladorDescriptivo
+from estadistica_descriptiva.densidad_kernel import calcular_ancho_banda, densidad_kernel
+from estadistica_descriptiva.distribucion_empirica import DistribucionEmpirica
+from estadistica_descriptiva.estadisticos_orden import METODOS_INTERPOLACION
+
+
+def test_ecdf_como_scipy():
+    datos = np.random.default_rng(0).integers(0, 40, 2_000).astype(float)
+    distribucion = DistribucionEmpirica(np.append(datos, np.nan))
+    puntos = np.linspace(-5, 45, 501)
+
+    assert distribucion.n == len(datos)
+    np.testing.assert_allclose(distribucion.acumulada(puntos), stats.ecdf(datos).cdf.evaluate(puntos))
+    np.testing.assert_allclose(distribucion.probabilidad(10, 20), np.mean((datos > 10) & (datos <= 20)))
+    np.testing.assert_allclose(distribucion.probabilidad_mayor(30), np.mean(datos > 30))
+    assert distribucion.distancia_ks(stats.norm(20, 11)) == pytest.approx(
+        stats.kstest(datos, stats.norm(20, 11).cdf).statistic)
+
+
+@pytest.mark.parametrize('metodo', list(METODOS_INTERPOLACION))
+def test_cuantiles_e_inversa(metodo):
+    datos = np.random.default_rng(1).normal(size=999).round(2)
+    distribucion = DistribucionEmpirica(datos)
+    p = np.linspace(0, 1, 41)
+    np.testing.assert_allclose(distribucion.cuantiles(p, metodo), np.quantile(datos, p, method=metodo))
+    np.testing.assert_allclose(distribucion.inversa(p), np.quantile(datos, p, method='inverted_cdf'))
+
+
+def test_ecdf_desde_acumulador():
+    datos = np.random.default_rng(2).integers(18, 60, 5_000)
+    acumulador = AcumuladorDescriptivo()
+    for bloque in np.array_split(datos, 5):
+        acumulador.actualizar(bloque)
+    puntos = np.arange(15, 65)
+    np.testing.assert_allclose(DistribucionEmpirica(acumulador).acumulada(puntos),
+                               DistribucionEmpirica(datos).acumulada(puntos))
+
+
+def test_densidad_kernel_como_scipy():
+    datos = np.random.default_rng(3).normal(size=5_000)
+    # 'scott' usa el mismo ancho que gaussian_kde
+    assert calcular_ancho_banda(datos, 'scott') == pytest.approx(datos.std(ddof=1) * len(datos) ** -0.2)
+
+    x, densidad = densidad_kernel(datos, ancho=0.3)
+    esperada = stats.gaussian_kde(datos, bw_method=0.3 / datos.std(ddof=1))(x)
+    # El agrupamiento lineal en 512 puntos deja un error muy pequeño
+    np.testing.assert_allclose(densidad, esperada, atol=1e-4)
+    assert np.trapezoid(densidad, x) == pytest.approx(1, abs=1e-4)
+    assert np.all(densidad >= 0)
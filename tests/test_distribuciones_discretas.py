@@ -0,0 +1,69 @@
+"""
+Núcleos de Bernoulli, Binomial y Poisson en escala logarítmica: deben
+coincidir con scipy.stats también con n, k y λ grandes, donde la fórmula
+directa con factoriales se desborda
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_inferencial.distribucion_poisson import (
+    DistribucionPoisson, acumulada_poisson, intervalo_poisson, log_masa_poisson, masa_poisson,
+    supervivencia_poisson
+)
+from estadistica_inferencial.distribuciones import (
+    DistribucionBernoulli, DistribucionBinomial, acumulada_binomial, intervalo_binomial, log_masa_binomial,
+    masa_binomial, supervivencia_binomial
+)
+
+PROBABILIDADES = np.array([0, 1e-12, 0.01, 0.1, 0.5, 0.9, 0.99, 1, -0.1, 1.5])
+
+
+@pytest.mark.parametrize('n, p', [(10, 0.3), (1_000, 0.02), (100_000, 0.5)])
+def test_binomial_como_scipy(n, p):
+    k = np.arange(-2, n + 3)
+    np.testing.assert_allclose(masa_binomial(k, n, p), stats.binom.pmf(k, n, p), rtol=1e-9, atol=1e-300)
+    np.testing.assert_allclose(log_masa_binomial(k[2:-2], n, p), stats.binom.logpmf(k[2:-2], n, p),
+                               rtol=1e-9)
+    np.testing.assert_allclose(acumulada_binomial(k, n, p), stats.binom.cdf(k, n, p), rtol=1e-9, atol=1e-300)
+    np.testing.assert_allclose(supervivencia_binomial(k, n, p), stats.binom.sf(k, n, p), rtol=1e-9, atol=1e-300)
+
+    distribucion = DistribucionBinomial(n, p)
+    np.testing.assert_array_equal(distribucion.ppf_many(PROBABILIDADES), stats.binom.ppf(PROBABILIDADES, n, p))
+    a, b = np.array([0, n // 3, n // 2]), np.array([n // 4, n // 2, n])
+    np.testing.assert_allclose(intervalo_binomial(a, b, n, p),
+                               stats.binom.cdf(b, n, p) - stats.binom.cdf(a - 1, n, p), atol=1e-12)
+
+
+@pytest.mark.parametrize('lambd', [0.5, 4, 1_000, 1e6])
+def test_poisson_como_scipy(lambd):
+    centro = int(lambd)
+    k = np.unique(np.clip(np.arange(centro - 300, centro + 300), -1, None))
+    np.testing.assert_allclose(masa_poisson(k, lambd), stats.poisson.pmf(k, lambd), rtol=1e-9, atol=1e-300)
+    np.testing.assert_allclose(acumulada_poisson(k, lambd), stats.poisson.cdf(k, lambd), rtol=1e-9, atol=1e-300)
+    np.testing.assert_allclose(supervivencia_poisson(k, lambd), stats.poisson.sf(k, lambd), rtol=1e-9, atol=1e-300)
+
+    distribucion = DistribucionPoisson(lambd)
+    np.testing.assert_array_equal(distribucion.ppf_many(PROBABILIDADES), stats.poisson.ppf(PROBABILIDADES, lambd))
+    np.testing.assert_allclose(intervalo_poisson(centro, centro + 10, lambd),
+                               stats.poisson.cdf(centro + 10, lambd) - stats.poisson.cdf(centro - 1, lambd),
+                               atol=1e-12)
+
+
+def test_poisson_sin_desbordarse():
+    # λ^k y k! se desbordan desde k ≈ 170; el logaritmo no
+    np.testing.assert_allclose(log_masa_poisson(5_000, 4_900.5), stats.poisson.logpmf(5_000, 4_900.5), rtol=1e-12)
+    assert masa_poisson(-1, 3) == 0 and masa_poisson(2.5, 3) == 0
+
+
+def test_bernoulli_por_lotes():
+    distribucion = DistribucionBernoulli(0.3)
+    k = np.array([-1, 0, 1, 2])
+    np.testing.assert_allclose(distribucion.pmf_many(k), stats.bernoulli.pmf(k, 0.3))
+    np.testing.assert_allclose(distribucion.cdf_many(k), stats.bernoulli.cdf(k, 0.3))
+    np.testing.assert_array_equal(distribucion.ppf_many(PROBABILIDADES), stats.bernoulli.ppf(PROBABILIDADES, 0.3))
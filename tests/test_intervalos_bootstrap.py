@@ -0,0 +1,45 @@
+"""
+Bootstrap: con la misma semilla el resultado se repite exactamente, y los
+intervalos percentil y BCa coinciden con scipy.stats.bootstrap salvo el
+error de Monte Carlo
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.intervalos_bootstrap import intervalo_bootstrap, remuestrear
+
+DATOS = np.random.default_rng(0).gamma(2, 2, 300)
+
+
+def test_misma_semilla_mismas_replicas():
+    primero = remuestrear(DATOS, ['media', 'mediana', 'curtosis'], 700, semilla=11)
+    segundo = remuestrear(DATOS, ['media', 'mediana', 'curtosis'], 700, semilla=11)
+    assert primero.shape == (3, 700)
+    np.testing.assert_array_equal(primero, segundo)
+    assert not np.array_equal(primero, remuestrear(DATOS, ['media', 'mediana', 'curtosis'], 700, semilla=12))
+
+    intervalo = intervalo_bootstrap(DATOS, 'asimetria', metodo='bca', semilla=5)
+    assert intervalo == intervalo_bootstrap(DATOS, 'asimetria', metodo='bca', semilla=5)
+
+
+@pytest.mark.parametrize('estadistico, funcion', [
+    ('media', np.mean),
+    ('varianza', lambda x, axis=-1: np.var(x, ddof=1, axis=axis)),
+    ('asimetria', stats.skew),
+])
+@pytest.mark.parametrize('metodo, metodo_scipy', [('percentil', 'percentile'), ('bca', 'BCa')])
+def test_intervalos_como_scipy(estadistico, funcion, metodo, metodo_scipy):
+    intervalo = intervalo_bootstrap(DATOS, estadistico, metodo=metodo, remuestras=4000, semilla=4)
+    esperado = stats.bootstrap((DATOS,), funcion, method=metodo_scipy, n_resamples=4000,
+                               random_state=1).confidence_interval
+    ancho = esperado.high - esperado.low
+    # Dos simulaciones distintas: se acepta una diferencia pequeña respecto al ancho
+    assert abs(intervalo['limite_inferior'] - esperado.low) < 0.05 * ancho
+    assert abs(intervalo['limite_superior'] - esperado.high) < 0.05 * ancho
+    assert intervalo['limite_inferior'] <= intervalo['estimacion'] <= intervalo['limite_superior']
@@ -0,0 +1,69 @@
+"""
+Tabla Z y valores críticos: la tabla interpolada y la caché deben dar los
+mismos valores que scipy (Φ, Φ⁻¹, t, χ² y F)
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_inferencial.tabla_normal import acumulada_z, cuantil_z, tabla_z, valor_z_critico
+from estadistica_inferencial.valores_criticos import (
+    chi2_criticos, f_criticos, t_critico, valores_criticos, valores_criticos_gl, z_critico
+)
+
+NIVELES = [0.5, 0.8, 0.9, 0.95, 0.975, 0.99, 0.999]
+
+
+def test_acumulada_y_cuantil_z():
+    z = np.concatenate([np.linspace(-8, 8, 10_001), [-6, 6, 0]])
+    np.testing.assert_allclose(acumulada_z(z), stats.norm.cdf(z), rtol=1e-12, atol=1e-15)
+    assert acumulada_z(1.96) == pytest.approx(stats.norm.cdf(1.96), abs=1e-14)
+
+    p = np.concatenate([np.linspace(0, 1, 10_001), [1e-12, 1 - 1e-12]])
+    np.testing.assert_allclose(cuantil_z(p), stats.norm.ppf(p), rtol=1e-10, atol=1e-10)
+    assert cuantil_z(0.975) == pytest.approx(stats.norm.ppf(0.975), abs=1e-11)
+    assert np.isnan(cuantil_z(1.5)) and np.all(np.isnan(cuantil_z(np.array([-0.1, 1.1]))))
+
+
+def test_tabla_z():
+    tabla = tabla_z(-3, 3, 0.5, mu=100, sigma=15)
+    z = np.arange(-3, 3.5, 0.5)
+    np.testing.assert_allclose(tabla['Z'], z)
+    np.testing.assert_allclose(tabla['X'], 100 + 15 * z)
+    np.testing.assert_allclose(tabla['P(Z ≤ z)'], np.round(stats.norm.cdf(z), 4))
+    np.testing.assert_allclose(tabla['P(Z > z)'], np.round(stats.norm.sf(z), 4))
+
+
+@pytest.mark.parametrize('nivel', NIVELES)
+def test_valores_criticos_como_scipy(nivel):
+    alfa_2 = (1 - nivel) / 2
+    assert z_critico(nivel) == pytest.approx(stats.norm.ppf(1 - alfa_2), rel=1e-10)
+    assert valor_z_critico(nivel) == pytest.approx(stats.norm.ppf(1 - alfa_2), rel=1e-10)
+    for gl in (1, 5, 29, 120, 1_000):
+        assert t_critico(nivel, gl) == pytest.approx(stats.t.ppf(1 - alfa_2, gl), rel=1e-10)
+        np.testing.assert_allclose(chi2_criticos(nivel, gl), stats.chi2.ppf([alfa_2, 1 - alfa_2], gl), rtol=1e-10)
+        np.testing.assert_allclose(f_criticos(nivel, gl, 12), stats.f.ppf([alfa_2, 1 - alfa_2], gl, 12),
+                                   rtol=1e-9)
+
+
+def test_version_vectorizada_y_cache():
+    gl = np.arange(1, 61)
+    inferior, superior = valores_criticos_gl('t', 0.95, gl)
+    np.testing.assert_allclose(superior, [t_critico(0.95, g) for g in gl], rtol=1e-14)
+    np.testing.assert_allclose(inferior, -superior)
+    # 0.95 y 1 - 0.05 son el mismo nivel para la caché
+    assert valores_criticos('t', 1 - 0.05, 10) == valores_criticos('t', 0.95, 10)
+
+
+@pytest.mark.parametrize('argumentos', [('z', 1.0), ('z', 0), ('t', 0.95, None), ('t', 0.95, 0),
+                                        ('f', 0.95, 3), ('w', 0.95)])
+def test_valores_criticos_invalidos(argumentos):
+    # Se validan también cuando se vuelven a pedir: los errores no quedan en la caché
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            valores_criticos(*argumentos)
@@ -0,0 +1,75 @@
+"""
+Valores atípicos: las filas marcadas deben ser las mismas que al aplicar
+cada criterio columna por columna con pandas, con las etiquetas del índice
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.valores_atipicos import (
+    detectar_atipicos, eliminar_atipicos, indices_atipicos
+)
+
+
+def _datos():
+    rng = np.random.default_rng(0)
+    datos = pd.DataFrame({
+        'Edad': rng.normal(25, 3, 300).round(),
+        'Calificacion': rng.normal(80, 5, 300),
+        'Carrera': 'Sistemas'
+    }, index=pd.RangeIndex(1000, 1300, name='Folio'))
+    datos.loc[[1003, 1150], 'Edad'] = [70, 2]
+    datos.loc[[1150, 1299], 'Calificacion'] = [10, 140]
+    datos.loc[1010, 'Edad'] = np.nan
+    return datos
+
+
+def _mascara_esperada(serie, metodo):
+    if metodo == 'iqr':
+        q1, q3 = serie.quantile([0.25, 0.75])
+        return (serie < q1 - 1.5 * (q3 - q1)) | (serie > q3 + 1.5 * (q3 - q1))
+    if metodo == 'zscore':
+        return ((serie - serie.mean()) / serie.std()).abs() > 3
+    if metodo == 'mad':
+        mediana = serie.median()
+        return (0.6745 * (serie - mediana) / (serie - mediana).abs().median()).abs() > 3.5
+    inferior, superior = serie.quantile([0.01, 0.99])
+    return (serie < inferior) | (serie > superior)
+
+
+@pytest.mark.parametrize('metodo', ['iqr', 'zscore', 'mad', 'percentil'])
+def test_indices_como_pandas(metodo):
+    datos = _datos()
+    mascara = detectar_atipicos(datos, metodo)
+    assert list(mascara.columns) == ['Edad', 'Calificacion']
+    for columna in mascara.columns:
+        pd.testing.assert_series_equal(mascara[columna], _mascara_esperada(datos[columna], metodo),
+                                       check_names=False)
+
+    esperadas = _mascara_esperada(datos['Edad'], metodo) | _mascara_esperada(datos['Calificacion'], metodo)
+    pd.testing.assert_index_equal(indices_atipicos(datos, metodo), datos.index[esperadas.to_numpy()])
+    assert 1010 not in indices_atipicos(datos, metodo)
+
+
+def test_en_todas_y_eliminar():
+    datos = _datos()
+    en_todas = _mascara_esperada(datos['Edad'], 'iqr') & _mascara_esperada(datos['Calificacion'], 'iqr')
+    pd.testing.assert_index_equal(indices_atipicos(datos, en_todas=True), datos.index[en_todas.to_numpy()])
+    assert 1150 in indices_atipicos(datos, en_todas=True)
+    assert {1003, 1150, 1299} <= set(indices_atipicos(datos))
+
+    limpios = eliminar_atipicos(datos)
+    assert len(limpios) == len(datos) - len(indices_atipicos(datos))
+    assert not limpios.index.isin([1003, 1150, 1299]).any()
+
+
+def test_serie_y_arreglo():
+    valores = np.array([10, 11, 12, 11, 10, 12, 11, 50.0])
+    np.testing.assert_array_equal(indices_atipicos(valores), [7])
+    serie = pd.Series(valores, index=list('abcdefgh'))
+    assert list(indices_atipicos(serie, 'mad')) == ['h']
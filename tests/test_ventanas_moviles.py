@@ -0,0 +1,47 @@
+"""
+Ventanas móviles: las medidas de cada ventana deben coincidir con calcularlas
+directamente sobre esa ventana (sliding_window_view + scipy), también cuando
+la serie tiene tendencia y la media de cada ventana se aleja de la global
+"""
+import os
+import sys
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estadistica_descriptiva.ventanas_moviles import estadisticas_acumuladas, estadisticas_moviles
+
+
+def _serie_con_tendencia(n, semilla=0):
+    rng = np.random.default_rng(semilla)
+    return np.arange(n) * 0.5 + rng.normal(size=n)
+
+
+def test_momentos_moviles_con_tendencia():
+    ventana = 20
+    datos = _serie_con_tendencia(200_000)
+    resultado = estadisticas_moviles(datos, ventana).iloc[ventana - 1:]
+    ventanas = sliding_window_view(datos, ventana)
+
+    np.testing.assert_allclose(resultado['Media'], ventanas.mean(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(resultado['Varianza'], ventanas.var(axis=1, ddof=1), rtol=1e-9)
+    np.testing.assert_allclose(resultado['Asimetría'], stats.skew(ventanas, axis=1), atol=1e-8)
+    np.testing.assert_allclose(resultado['Curtosis'], stats.kurtosis(ventanas, axis=1), atol=1e-8)
+
+
+def test_momentos_acumulados_con_tendencia_y_faltantes():
+    datos = _serie_con_tendencia(5_000, semilla=1) * 6
+    datos[::7] = np.nan
+    resultado = estadisticas_acumuladas(datos)
+
+    for fin in (10, 999, 4_999):
+        tramo = datos[:fin + 1]
+        tramo = tramo[~np.isnan(tramo)]
+        fila = resultado.iloc[fin]
+        assert fila['n'] == len(tramo)
+        np.testing.assert_allclose(fila['Varianza'], tramo.var(ddof=1), rtol=1e-9)
+        np.testing.assert_allclose(fila['Asimetría'], stats.skew(tramo), atol=1e-8)
+        np.testing.assert_allclose(fila['Curtosis'], stats.kurtosis(tramo), atol=1e-8)
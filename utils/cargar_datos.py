@@ -7,3 +7,10 @@ def importar_csv(ruta):
     except Exception as e:
         print(f"Error al importar: {e}")
         return None
+
+def importar_csv_por_bloques(ruta, columnas=None, tamano_bloque=100_000):
+    """
+    Lee el CSV en bloques de 'tamano_bloque' filas (iterador de DataFrames)
+    para procesar archivos más grandes que la memoria
+    """
+    return pd.read_csv(ruta, usecols=columnas, chunksize=tamano_bloque)
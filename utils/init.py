@@ -3,11 +3,12 @@ Módulo de Utilidades
 Funciones auxiliares para carga y exportación de datos
 """
 
-from .cargar_datos import importar_csv
+from .cargar_datos import importar_csv, importar_csv_por_bloques
 from .exportar_resultados import exportar_resultados
 
 __all__ = [
     'importar_csv',
+    'importar_csv_por_bloques',
     'exportar_resultados'
 ]
 